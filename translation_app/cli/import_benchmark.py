@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入耗时基准
+
+在全新的解释器中（python -X importtime）分别导入 CLI 入口和各子命令的服务模块，
+输出累计导入耗时，并检查不需要翻译的命令是否加载了较慢的第三方库：
+
+    python -m translation_app.cli.import_benchmark
+    python -m translation_app.cli.import_benchmark --repeat 5 --max-ms 300
+
+存在不应加载的库或耗时超过 --max-ms 时以非零状态退出，可用于持续跟踪启动开销
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+
+# 各子命令对应的模块
+COMMAND_MODULES: Dict[str, str] = {
+    'cli': 'translation_app.cli.main',
+    'merge': 'translation_app.services.merge_service',
+    'status': 'translation_app.services.status_service',
+    'watch': 'translation_app.services.watch_service',
+    'worker': 'translation_app.services.worker_service',
+    'batch': 'translation_app.services.batch_service',
+    'job': 'translation_app.services.job_service',
+    'serve': 'translation_app.services.serve_service',
+    'stream': 'translation_app.services.stream_service',
+}
+
+# 导入较慢、只在实际翻译或解析 PDF/EPUB 时才需要的库
+HEAVY_MODULES = ('openai', 'PyPDF2', 'lxml', 'bs4', 'ebooklib')
+
+# -X importtime 输出格式: "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_PATTERN = re.compile(r'^import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)')
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """
+    在新的解释器中导入模块
+
+    Args:
+        module: 模块名
+
+    Returns:
+        (累计导入耗时（毫秒）, 被加载的较慢第三方库列表)
+    """
+    check = (
+        f'import sys, {module}; '
+        f'print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', check],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        # 取被测模块自身的累计耗时，不包含解释器启动时导入的 site 等模块
+        if match and match.group(2) == module:
+            cumulative_us = int(match.group(1))
+
+    loaded = [name for name in result.stdout.strip().split(',') if name]
+    return cumulative_us / 1000, loaded
+
+
+def run_benchmark(commands: Sequence[str], repeat: int) -> List[Tuple[str, float, List[str]]]:
+    """
+    对每个子命令重复测量，取中位数
+
+    Returns:
+        [(子命令, 导入耗时中位数（毫秒）, 被加载的较慢第三方库), ...]
+    """
+    results = []
+    for command in commands:
+        module = COMMAND_MODULES[command]
+        timings = []
+        loaded: List[str] = []
+        for _ in range(repeat):
+            elapsed, loaded = measure_import(module)
+            timings.append(elapsed)
+        results.append((command, statistics.median(timings), loaded))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='测量 CLI 各子命令的模块导入耗时')
+    parser.add_argument(
+        'commands',
+        nargs='*',
+        help=f"要测量的子命令，可选: {', '.join(COMMAND_MODULES)}（默认全部）"
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='每个模块的测量次数，取中位数 (默认: 3)')
+    parser.add_argument(
+        '--max-ms',
+        type=float,
+        default=None,
+        help='不需要翻译的命令（cli、merge、status）允许的最大导入耗时（毫秒）'
+    )
+    args = parser.parse_args()
+    unknown = [command for command in args.commands if command not in COMMAND_MODULES]
+    if unknown:
+        parser.error(f"未知的子命令: {', '.join(unknown)}")
+
+    # 不创建 API 客户端、不解析 PDF/EPUB 的命令不应加载较慢的第三方库
+    light_commands = {'cli', 'merge', 'status'}
+    failed = False
+
+    print(f"{'命令':<8}{'导入耗时':>12}  加载的较慢库")
+    for command, elapsed, loaded in run_benchmark(args.commands or list(COMMAND_MODULES), max(1, args.repeat)):
+        print(f"{command:<8}{elapsed:>10.1f}ms  {', '.join(loaded) or '-'}")
+        if command in light_commands:
+            if loaded:
+                failed = True
+                print(f"  !! {command} 不应加载: {', '.join(loaded)}")
+            if args.max_ms is not None and elapsed > args.max_ms:
+                failed = True
+                print(f"  !! {command} 导入耗时超过 {args.max_ms:g}ms")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,12 +5,17 @@
 """
 
 import argparse
+import codecs
+import os
 import sys
 
 from translation_app.cli.logging_setup import setup_logging
-from translation_app.services.batch_service import batch_translate
-from translation_app.services.job_service import run_single_file
-from translation_app.services.merge_service import merge_entrance
+from translation_app.core.config import MergeConfig, ServeConfig, TranslationDefaults, WatchConfig
+from translation_app.domain.file_order import FILE_ORDER_POLICIES
+from translation_app.domain.submission_policy import SUBMISSION_POLICIES
+
+# 各子命令的服务模块在执行时才导入：翻译相关命令依赖的 openai、PyPDF2 等库导入较慢，
+# merge、status 等命令不需要加载它们
 
 
 def main():
@@ -28,6 +33,12 @@ def main():
         default='akashml',
         help='选择服务商 (默认: akashml)'
     )
+    job_parser.add_argument(
+        '--balanced',
+        action='store_true',
+        default=False,
+        help='启用均衡切割模式，使各 chunk 大小接近'
+    )
 
     batch_parser = subparsers.add_parser('batch', help='批量翻译 files/ 目录')
     batch_parser.add_argument(
@@ -37,6 +48,212 @@ def main():
         default='akashml',
         help='选择服务商 (默认: akashml)'
     )
+    batch_parser.add_argument(
+        '--balanced',
+        action='store_true',
+        default=False,
+        help='启用均衡切割模式，使各 chunk 大小接近'
+    )
+    batch_parser.add_argument(
+        '--submission-policy',
+        type=str,
+        choices=list(SUBMISSION_POLICIES),
+        default=TranslationDefaults.BATCH_SUBMISSION_POLICY,
+        help=(
+            'chunk 提交顺序：document 按原文顺序，longest_first 最长优先 '
+            f'(默认: {TranslationDefaults.BATCH_SUBMISSION_POLICY})'
+        )
+    )
+    batch_parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=TranslationDefaults.BATCH_PREFETCH_FILES,
+        help=f'翻译当前文件时提前提取的文件数，0 表示不预取 (默认: {TranslationDefaults.BATCH_PREFETCH_FILES})'
+    )
+    batch_parser.add_argument(
+        '--order',
+        type=str,
+        choices=list(FILE_ORDER_POLICIES),
+        default=TranslationDefaults.BATCH_FILE_ORDER,
+        help=(
+            '文件处理顺序：name 按扩展名和文件名，shortest_first 预估块数最少优先，'
+            f'largest_first 预估块数最多优先 (默认: {TranslationDefaults.BATCH_FILE_ORDER})'
+        )
+    )
+    batch_parser.add_argument(
+        '--priority',
+        type=str,
+        action='append',
+        default=[],
+        metavar='GLOB',
+        help='优先处理匹配该通配符的文件（可重复指定，靠前的优先；另可写入 files/.priority）'
+    )
+    batch_parser.add_argument(
+        '--merge-each',
+        action='store_true',
+        default=MergeConfig.MERGE_EACH_FILE,
+        help='每个文件翻译完成后立即增量合并，而不是等整批结束'
+    )
+
+    watch_parser = subparsers.add_parser('watch', help='监听 files/ 目录，持续翻译新文件')
+    watch_parser.add_argument(
+        '--provider', '-p',
+        type=str,
+        choices=['akashml', 'deepseek', 'hyperbolic'],
+        default='akashml',
+        help='选择服务商 (默认: akashml)'
+    )
+    watch_parser.add_argument(
+        '--balanced',
+        action='store_true',
+        default=False,
+        help='启用均衡切割模式，使各 chunk 大小接近'
+    )
+    watch_parser.add_argument(
+        '--submission-policy',
+        type=str,
+        choices=list(SUBMISSION_POLICIES),
+        default=TranslationDefaults.BATCH_SUBMISSION_POLICY,
+        help=(
+            'chunk 提交顺序：document 按原文顺序，longest_first 最长优先 '
+            f'(默认: {TranslationDefaults.BATCH_SUBMISSION_POLICY})'
+        )
+    )
+    watch_parser.add_argument(
+        '--interval',
+        type=float,
+        default=WatchConfig.POLL_INTERVAL,
+        help=f'扫描目录的间隔秒数 (默认: {WatchConfig.POLL_INTERVAL:g})'
+    )
+    watch_parser.add_argument(
+        '--settle',
+        type=float,
+        default=WatchConfig.SETTLE_SECONDS,
+        help=f'文件保持不变多少秒后视为写入完成 (默认: {WatchConfig.SETTLE_SECONDS:g})'
+    )
+    watch_parser.add_argument(
+        '--no-merge',
+        action='store_true',
+        default=False,
+        help='不自动合并翻译结果'
+    )
+
+    worker_parser = subparsers.add_parser('worker', help='作为工作队列的 worker 翻译 files/ 目录（可多进程、多主机并行）')
+    worker_parser.add_argument(
+        '--provider', '-p',
+        type=str,
+        choices=['akashml', 'deepseek', 'hyperbolic'],
+        default='akashml',
+        help='选择服务商 (默认: akashml)'
+    )
+    worker_parser.add_argument(
+        '--balanced',
+        action='store_true',
+        default=False,
+        help='启用均衡切割模式，使各 chunk 大小接近'
+    )
+    worker_parser.add_argument(
+        '--submission-policy',
+        type=str,
+        choices=list(SUBMISSION_POLICIES),
+        default=TranslationDefaults.BATCH_SUBMISSION_POLICY,
+        help=(
+            'chunk 提交顺序：document 按原文顺序，longest_first 最长优先 '
+            f'(默认: {TranslationDefaults.BATCH_SUBMISSION_POLICY})'
+        )
+    )
+    worker_parser.add_argument(
+        '--interval',
+        type=float,
+        default=WatchConfig.POLL_INTERVAL,
+        help=f'没有可认领的文件时重新扫描的间隔秒数 (默认: {WatchConfig.POLL_INTERVAL:g})'
+    )
+    worker_parser.add_argument(
+        '--follow',
+        action='store_true',
+        default=False,
+        help='处理完所有文件后继续等待新文件'
+    )
+    worker_parser.add_argument(
+        '--no-merge',
+        action='store_true',
+        default=False,
+        help='不自动合并翻译结果'
+    )
+
+    stream_parser = subparsers.add_parser('stream', help='从标准输入读取文本，按原文顺序把译文写到标准输出（用于管道）')
+    stream_parser.add_argument(
+        '--provider', '-p',
+        type=str,
+        choices=['akashml', 'deepseek', 'hyperbolic'],
+        default='akashml',
+        help='选择服务商 (默认: akashml)'
+    )
+    stream_parser.add_argument(
+        '--balanced',
+        action='store_true',
+        default=False,
+        help='启用均衡切割模式，使各 chunk 大小接近'
+    )
+    stream_parser.add_argument(
+        '--encoding',
+        type=str,
+        default='utf-8',
+        help='标准输入的编码 (默认: utf-8)'
+    )
+    stream_parser.add_argument(
+        '--window',
+        type=int,
+        default=None,
+        help='同时在途（已提交但尚未输出）的 chunk 上限，限制内存占用 (默认: 线程数的 2 倍)'
+    )
+
+    serve_parser = subparsers.add_parser('serve', help='启动本机 HTTP 任务服务（上传文件、路径或文本，查询进度、取消、下载结果）')
+    serve_parser.add_argument(
+        '--provider', '-p',
+        type=str,
+        choices=['akashml', 'deepseek', 'hyperbolic'],
+        default='akashml',
+        help='请求未指定服务商时使用的服务商 (默认: akashml)'
+    )
+    serve_parser.add_argument(
+        '--host',
+        type=str,
+        default=ServeConfig.HOST,
+        help=f'监听地址，服务没有鉴权，请勿暴露到公网 (默认: {ServeConfig.HOST})'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=ServeConfig.PORT,
+        help=f'监听端口 (默认: {ServeConfig.PORT})'
+    )
+    serve_parser.add_argument(
+        '--max-jobs',
+        type=int,
+        default=ServeConfig.MAX_JOBS,
+        help=f'同时运行的任务数，其余任务排队 (默认: {ServeConfig.MAX_JOBS})'
+    )
+    serve_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=ServeConfig.MAX_CONCURRENCY,
+        help=f'所有任务共享的 API 并发请求数上限 (默认: {ServeConfig.MAX_CONCURRENCY})'
+    )
+
+    status_parser = subparsers.add_parser('status', help='查询工作目录中各文件的处理状态（读取清单，不扫描文件）')
+    status_parser.add_argument(
+        '--files-dir',
+        type=str,
+        default=None,
+        help='工作目录（默认: TRANSLATION_WORK_DIR 或 files）'
+    )
+    status_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        default=False,
+        help='列出每个状态下的文件名'
+    )
 
     merge_parser = subparsers.add_parser('merge', help='合并翻译后的文件')
     merge_parser.add_argument(
@@ -57,20 +274,97 @@ def main():
         default=False,
         help='删除原文件时创建备份'
     )
+    merge_parser.add_argument(
+        '--incremental',
+        action='store_true',
+        default=MergeConfig.INCREMENTAL,
+        help='增量合并：追加到最后一个未满的合并文件，不重写之前的合并文件'
+    )
 
     args = parser.parse_args()
 
     if args.command == 'job':
-        success = run_single_file(args.file, args.provider)
+        from translation_app.services.job_service import run_single_file
+        success = run_single_file(args.file, args.provider, balanced=args.balanced)
         return 0 if success else 1
     if args.command == 'batch':
-        batch_translate(args.provider)
+        from translation_app.services.batch_service import batch_translate
+        batch_translate(
+            args.provider,
+            balanced=args.balanced,
+            submission_policy=args.submission_policy,
+            prefetch=args.prefetch,
+            order=args.order,
+            priority=args.priority,
+            merge_each=args.merge_each
+        )
+        return 0
+    if args.command == 'watch':
+        from translation_app.services.watch_service import watch_translate
+        watch_translate(
+            args.provider,
+            balanced=args.balanced,
+            submission_policy=args.submission_policy,
+            poll_interval=args.interval,
+            settle_seconds=args.settle,
+            merge=not args.no_merge
+        )
+        return 0
+    if args.command == 'worker':
+        from translation_app.services.worker_service import run_worker
+        run_worker(
+            args.provider,
+            balanced=args.balanced,
+            submission_policy=args.submission_policy,
+            poll_interval=args.interval,
+            follow=args.follow,
+            merge=not args.no_merge
+        )
+        return 0
+    if args.command == 'stream':
+        from translation_app.services.stream_service import stream_translate
+        try:
+            codecs.lookup(args.encoding)
+        except LookupError:
+            parser.error(f'未知的编码: {args.encoding}')
+        try:
+            success = stream_translate(
+                sys.stdin.buffer,
+                sys.stdout.buffer,
+                args.provider,
+                balanced=args.balanced,
+                encoding=args.encoding,
+                window=args.window
+            )
+        except BrokenPipeError:
+            # 下游提前关闭（如 | head）：丢弃剩余输出，避免退出时再次报错
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+        except UnicodeDecodeError as e:
+            print(f'标准输入不是有效的 {args.encoding} 文本: {e}', file=sys.stderr)
+            return 1
+        return 0 if success else 1
+    if args.command == 'serve':
+        from translation_app.services.serve_service import serve
+        serve(
+            host=args.host,
+            port=args.port,
+            provider=args.provider,
+            max_jobs=args.max_jobs,
+            max_concurrency=args.concurrency
+        )
+        return 0
+    if args.command == 'status':
+        from translation_app.services.status_service import print_status
+        print_status(args.files_dir, verbose=args.verbose)
         return 0
     if args.command == 'merge':
+        from translation_app.services.merge_service import merge_entrance
         merge_entrance(
             files_dir=args.files_dir,
             delete_originals=not args.keep_originals,
-            backup=args.backup
+            backup=args.backup,
+            incremental=args.incremental
         )
         return 0
 
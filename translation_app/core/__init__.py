@@ -10,6 +10,11 @@ from translation_app.core.config import (
     TranslationDefaults,
     LogConfig,
     FileFormats,
+    ExtractionConfig,
+    WatchConfig,
+    QueueConfig,
+    MergeConfig,
+    ServeConfig,
     SENTENCE_END_PUNCTUATION,
     SECONDARY_PUNCTUATION,
     get_work_dir,
@@ -30,12 +35,19 @@ from translation_app.core.translate_config import (
 from translation_app.core.file_ops import (
     safe_delete,
     safe_rename,
+    list_source_files,
 )
 from translation_app.core.path_utils import (
     normalize_file_path,
     get_translated_filename,
     get_translated_path,
 )
+from translation_app.core.text_encoding import (
+    detect_encoding,
+    read_text_file,
+    iter_text_segments,
+    iter_decoded_segments,
+)
 
 __all__ = [
     # config
@@ -44,6 +56,11 @@ __all__ = [
     'TranslationDefaults',
     'LogConfig',
     'FileFormats',
+    'ExtractionConfig',
+    'WatchConfig',
+    'QueueConfig',
+    'MergeConfig',
+    'ServeConfig',
     'SENTENCE_END_PUNCTUATION',
     'SECONDARY_PUNCTUATION',
     'get_work_dir',
@@ -61,8 +78,14 @@ __all__ = [
     # file_ops
     'safe_delete',
     'safe_rename',
+    'list_source_files',
     # path_utils
     'normalize_file_path',
     'get_translated_filename',
     'get_translated_path',
+    # text_encoding
+    'detect_encoding',
+    'read_text_file',
+    'iter_text_segments',
+    'iter_decoded_segments',
 ]
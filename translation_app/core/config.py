@@ -34,6 +34,18 @@ class PathConfig:
     # 备份目录
     BACKUP_DIR = WORK_DIR / ".backup"
     
+    # 提取结果缓存目录
+    CACHE_DIR = WORK_DIR / ".cache"
+    
+    # 工作队列租约目录（多个 worker 共享）
+    LEASE_DIR = WORK_DIR / ".leases"
+    
+    # 批量翻译优先级规则文件（每行一个文件名通配符，靠前的优先）
+    PRIORITY_FILE = WORK_DIR / ".priority"
+    
+    # HTTP 任务服务的任务目录（上传的文件、文本和翻译结果）
+    JOB_DIR = WORK_DIR / ".jobs"
+    
     @classmethod
     def refresh(cls):
         """
@@ -44,6 +56,10 @@ class PathConfig:
         cls.WORK_DIR = Path(os.environ.get('TRANSLATION_WORK_DIR', 'files'))
         cls.COMBINED_DIR = cls.WORK_DIR / "combined"
         cls.BACKUP_DIR = cls.WORK_DIR / ".backup"
+        cls.CACHE_DIR = cls.WORK_DIR / ".cache"
+        cls.LEASE_DIR = cls.WORK_DIR / ".leases"
+        cls.PRIORITY_FILE = cls.WORK_DIR / ".priority"
+        cls.JOB_DIR = cls.WORK_DIR / ".jobs"
     
     @classmethod
     def ensure_dirs(cls):
@@ -68,6 +84,17 @@ class CharLimits:
     
     # 中文文件判断阈值（中文字符占比 >= 30% 视为中文文件）
     CHINESE_RATIO_THRESHOLD = 0.3
+    
+    # 中文检测的置信度：采样估计的占比与阈值的差距超过 Hoeffding 界时提前给出结论
+    CHINESE_DETECT_CONFIDENCE = 0.99
+    
+    # TXT 中文检测：每个采样块的字节数、最多采样块数、给出结论前至少采样的块数（开头、中间、结尾）
+    CHINESE_SAMPLE_BLOCK_BYTES = 16 * 1024
+    CHINESE_SAMPLE_BLOCKS = 8
+    CHINESE_SAMPLE_MIN_BLOCKS = 3
+    
+    # PDF/EPUB 中文检测：最多采样的页数
+    CHINESE_SAMPLE_PAGES = 8
 
 
 # ================== 翻译配置默认值 ==================
@@ -82,6 +109,14 @@ class TranslationDefaults:
     BATCH_CHUNK_SIZE = 3000
     BATCH_MIN_CHUNK_SIZE = 1000
     BATCH_API_TIMEOUT = 60
+    # 文本块提交策略（document: 原文顺序，longest_first: 最长优先）
+    BATCH_SUBMISSION_POLICY = os.environ.get('BATCH_SUBMISSION_POLICY', 'document')
+    # 翻译当前文件时提前提取的文件数（0 表示不预取，逐个文件边提取边翻译）
+    BATCH_PREFETCH_FILES = int(os.environ.get('BATCH_PREFETCH_FILES', 2))
+    # 预取文件的最大文本字符数（预取结果整体保存在内存中，更大的文件边提取边翻译）
+    BATCH_PREFETCH_MAX_CHARS = int(os.environ.get('BATCH_PREFETCH_MAX_CHARS', 2_000_000))
+    # 文件处理顺序（name: 扩展名和文件名顺序，shortest_first: 最短优先，largest_first: 最大优先）
+    BATCH_FILE_ORDER = os.environ.get('BATCH_FILE_ORDER', 'name')
     
     # 单文件翻译默认配置
     JOB_MAX_WORKERS = 1
@@ -90,6 +125,173 @@ class TranslationDefaults:
     JOB_CHUNK_SIZE = 50000
     JOB_MIN_CHUNK_SIZE = 30000
     JOB_API_TIMEOUT = 60
+    
+    # 均衡切割模式允许的块大小偏差比例（块大小目标范围: [chunk_size * (1 - 偏差), chunk_size]）
+    CHUNK_BALANCE_TOLERANCE = 0.2
+
+
+# ================== 文本提取配置 ==================
+
+class ExtractionConfig:
+    """
+    文本提取相关配置
+    
+    支持通过环境变量覆盖：
+    - PDF_PARALLEL_MIN_BYTES: 启用 PDF 多进程并行提取的最小文件大小（字节）
+    - PDF_PARALLEL_WORKERS: PDF 并行提取的进程数（默认 CPU 核数）
+    - EPUB_PARALLEL_MIN_BYTES: 启用 EPUB 多进程并行解析的最小正文大小（字节）
+    - EPUB_PARALLEL_WORKERS: EPUB 并行解析的进程数（默认 CPU 核数）
+    - PREPROCESS_WORKERS: 预处理并行分析的进程数（默认 CPU 核数）
+    - EXTRACTION_CACHE: 是否启用提取结果缓存（默认 true）
+    - EXTRACTION_CACHE_COMPRESS: 缓存是否使用 gzip 压缩（默认 false）
+    - WORK_MANIFEST: 是否启用工作目录清单（默认 true）
+    - MERGE_READ_WORKERS: 合并时并行读取翻译结果的线程数（默认 4）
+    """
+    
+    # PDF 文件大小达到此值时启用多进程并行提取，小文件保持串行以避免进程启动开销
+    PDF_PARALLEL_MIN_BYTES = int(os.environ.get('PDF_PARALLEL_MIN_BYTES', 20 * 1024 * 1024))
+    
+    # PDF 并行提取的进程数（0 表示使用 CPU 核数）
+    PDF_PARALLEL_WORKERS = int(os.environ.get('PDF_PARALLEL_WORKERS', 0))
+    
+    # 每个进程任务负责的连续页数
+    PDF_PAGES_PER_SHARD = 50
+    
+    # EPUB 正文 HTML 总大小达到此值时启用多进程并行解析，较小的书籍串行解析更快
+    EPUB_PARALLEL_MIN_BYTES = int(os.environ.get('EPUB_PARALLEL_MIN_BYTES', 8 * 1024 * 1024))
+    
+    # EPUB 并行解析的进程数（0 表示使用 CPU 核数）
+    EPUB_PARALLEL_WORKERS = int(os.environ.get('EPUB_PARALLEL_WORKERS', 0))
+    
+    # 预处理并行分析（中文检测、字符统计）的进程数（0 表示使用 CPU 核数，1 表示不并行）
+    PREPROCESS_WORKERS = int(os.environ.get('PREPROCESS_WORKERS', 0))
+    
+    # 待分析文件数达到此值时才并行分析，文件较少时进程启动开销大于收益
+    PREPROCESS_PARALLEL_MIN_FILES = 8
+    
+    # 是否缓存提取结果（同一文件在预处理、字符统计、翻译阶段只解析一次）
+    CACHE_ENABLED = os.environ.get('EXTRACTION_CACHE', 'true').lower() == 'true'
+    
+    # 缓存文件是否使用 gzip 压缩
+    CACHE_COMPRESS = os.environ.get('EXTRACTION_CACHE_COMPRESS', 'false').lower() == 'true'
+    
+    # 是否在工作目录中保存清单（.manifest.json），复用未变化文件的分析结果
+    MANIFEST_ENABLED = os.environ.get('WORK_MANIFEST', 'true').lower() == 'true'
+    
+    # 合并时并行读取（解码、统计中文字数）翻译结果文件的线程数
+    MERGE_READ_WORKERS = int(os.environ.get('MERGE_READ_WORKERS', 4))
+    
+    # 需要缓存的文件类型（TXT 直接读取即可，无需缓存）
+    CACHE_EXTENSIONS = ('.pdf', '.epub')
+    
+    # TXT 文件达到此大小时使用内存映射读取
+    TXT_MMAP_MIN_BYTES = 16 * 1024 * 1024
+    
+    # TXT 文件按段落边界分段产出，每段的目标字符数
+    TXT_SEGMENT_CHARS = 1024 * 1024
+    
+    # 检测 TXT 编码时每个采样块的字节数（大文件在开头、中间、结尾各取一块）
+    TXT_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+
+# ================== 监听模式配置 ==================
+
+class WatchConfig:
+    """
+    监听模式（translate watch）相关配置
+    
+    支持通过环境变量覆盖：
+    - WATCH_POLL_INTERVAL: 扫描工作目录的间隔（秒）
+    - WATCH_SETTLE_SECONDS: 文件大小和修改时间保持不变多久后视为写入完成（秒）
+    """
+    
+    # 扫描工作目录的间隔（秒）
+    POLL_INTERVAL = float(os.environ.get('WATCH_POLL_INTERVAL', 5))
+    
+    # 文件大小和修改时间在此时长内保持不变才开始处理，避免处理尚未写完的文件
+    SETTLE_SECONDS = float(os.environ.get('WATCH_SETTLE_SECONDS', 10))
+
+
+# ================== 工作队列配置 ==================
+
+class QueueConfig:
+    """
+    工作队列（translate worker）相关配置
+    
+    支持通过环境变量覆盖：
+    - WORKER_LEASE_TTL: 租约有效期（秒），超过该时长没有心跳的租约可被其他 worker 回收
+    - WORKER_HEARTBEAT_INTERVAL: 租约心跳间隔（秒）
+    - WORKER_RETRY_DELAY: 处理失败的文件首次重试前的等待时间（秒），之后每次失败翻倍
+    - WORKER_MAX_ATTEMPTS: 处理失败的文件最多尝试次数，用完后文件修改前不再认领
+    """
+    
+    # 租约有效期（秒），需明显大于心跳间隔，并容忍各主机之间的时钟偏差
+    LEASE_TTL = float(os.environ.get('WORKER_LEASE_TTL', 300))
+    
+    # 租约心跳间隔（秒）
+    HEARTBEAT_INTERVAL = float(os.environ.get('WORKER_HEARTBEAT_INTERVAL', 30))
+    
+    # 处理失败后首次重试前的等待时间（秒），之后每次失败翻倍
+    RETRY_DELAY = float(os.environ.get('WORKER_RETRY_DELAY', 600))
+    
+    # 处理失败的文件最多尝试次数（含首次）
+    MAX_ATTEMPTS = int(os.environ.get('WORKER_MAX_ATTEMPTS', 5))
+
+
+# ================== HTTP 任务服务配置 ==================
+
+class ServeConfig:
+    """
+    HTTP 任务服务（translate serve）相关配置
+    
+    支持通过环境变量覆盖：
+    - SERVE_HOST: 监听地址（默认仅本机 127.0.0.1）
+    - SERVE_PORT: 监听端口
+    - SERVE_MAX_JOBS: 同时运行的任务数
+    - SERVE_MAX_CONCURRENCY: 所有任务共享的 API 并发请求数上限
+    - SERVE_MAX_UPLOAD_MB: 单次上传的最大大小（MB）
+    - SERVE_PATH_ROOT: 按路径提交任务时允许访问的目录（默认为工作目录）
+    """
+    
+    # 监听地址（服务没有鉴权，默认只监听本机）
+    HOST = os.environ.get('SERVE_HOST', '127.0.0.1')
+    
+    # 监听端口
+    PORT = int(os.environ.get('SERVE_PORT', 8765))
+    
+    # 同时运行的任务数，其余任务排队
+    MAX_JOBS = int(os.environ.get('SERVE_MAX_JOBS', 2))
+    
+    # 所有任务共享的 API 并发请求数上限
+    MAX_CONCURRENCY = int(os.environ.get('SERVE_MAX_CONCURRENCY', 8))
+    
+    # 单次上传（文件或文本）的最大字节数
+    MAX_UPLOAD_BYTES = int(os.environ.get('SERVE_MAX_UPLOAD_MB', 200)) * 1024 * 1024
+    
+    # 按路径提交任务时允许访问的目录，None 表示工作目录（PathConfig.WORK_DIR）；
+    # 服务没有鉴权，目录之外的文件一律拒绝，避免通过下载结果读取服务器上的任意文件
+    PATH_ROOT = os.environ.get('SERVE_PATH_ROOT') or None
+
+
+# ================== 合并配置 ==================
+
+class MergeConfig:
+    """
+    文件合并相关配置
+    
+    支持通过环境变量覆盖：
+    - MERGE_INCREMENTAL: 是否使用增量合并（追加到最后一个未满的合并文件，默认 false）
+    - MERGE_EACH_FILE: 批量翻译时是否每个文件保存后立即增量合并（默认 false）
+    """
+    
+    # 增量合并：新的翻译结果追加到最后一个未满的 combined_N.txt，不重写之前的合并文件
+    INCREMENTAL = os.environ.get('MERGE_INCREMENTAL', 'false').lower() == 'true'
+    
+    # 批量翻译时每个文件翻译完成后立即增量合并，而不是等整批结束
+    MERGE_EACH_FILE = os.environ.get('MERGE_EACH_FILE', 'false').lower() == 'true'
+    
+    # 增量合并状态文件（位于合并输出目录中，记录各合并文件的中文字数和字节数）
+    STATE_FILE_NAME = '.merge_state.json'
 
 
 # ================== 日志配置 ==================
@@ -119,6 +321,9 @@ class FileFormats:
     # 翻译后文件名后缀
     TRANSLATED_SUFFIX = " translated.txt"
     
+    # TXT 文件依次尝试的编码（带 BOM 的文件直接按 BOM 解码）
+    TXT_ENCODINGS = ['utf-8', 'gbk', 'gb2312']
+    
     # EPUB 支持的 MIME 类型
     EPUB_MIME_TYPES = [
         'application/xhtml+xml',
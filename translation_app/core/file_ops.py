@@ -7,7 +7,11 @@
 """
 
 import logging
+import os
 from pathlib import Path
+from typing import List
+
+from translation_app.core.config import FileFormats
 
 
 logger = logging.getLogger('FileOps')
@@ -55,3 +59,41 @@ def safe_rename(file_path: Path, new_name: str) -> bool:
     except Exception as e:
         logger.error(f"重命名失败 {file_path.name}: {e}")
         return False
+
+
+def list_source_files(directory: Path, include_translated: bool = False) -> List[Path]:
+    """
+    列出目录中支持的源文件（只扫描一次目录）
+
+    结果按 FileFormats.SUPPORTED_EXTENSIONS 的顺序分组，组内按文件名排序
+
+    Args:
+        directory: 目录路径
+        include_translated: 是否包含翻译结果文件（文件名以 " translated.txt" 结尾）
+
+    Returns:
+        文件路径列表
+    """
+    extensions = FileFormats.SUPPORTED_EXTENSIONS
+    grouped = {ext: [] for ext in extensions}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError as e:
+        logger.error(f"扫描目录失败 {directory}: {e}")
+        return []
+
+    for entry in entries:
+        name = entry.name
+        if not include_translated and name.endswith(FileFormats.TRANSLATED_SUFFIX):
+            continue
+        for ext in extensions:
+            if name.endswith(ext):
+                try:
+                    if entry.is_file():
+                        grouped[ext].append(name)
+                except OSError:
+                    pass
+                break
+
+    directory = Path(directory)
+    return [directory / name for ext in extensions for name in sorted(grouped[ext])]
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本编码模块
+
+提供 TXT 文件的编码检测和分段读取：
+- 编码只检测一次：优先识别 BOM，否则用开头、中间、结尾的采样块依次尝试候选编码
+- 大文件使用内存映射读取，按段落边界分段产出，内存占用与文件大小无关
+- 标准输入等字节流同样可以增量解码、分段产出
+"""
+
+import codecs
+import io
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from translation_app.core.config import (
+    ExtractionConfig,
+    FileFormats,
+    SENTENCE_END_PUNCTUATION,
+    SECONDARY_PUNCTUATION
+)
+
+
+logger = logging.getLogger('TextEncoding')
+
+
+# BOM 与对应编码（UTF-32 LE 的 BOM 以 UTF-16 LE 的 BOM 开头，需要先判断）
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 每次从文件读取的字节数
+_READ_BLOCK_BYTES = 1024 * 1024
+
+
+def detect_bom(data: bytes) -> Optional[str]:
+    """
+    根据 BOM 判断编码
+
+    Args:
+        data: 文件开头的字节
+
+    Returns:
+        编码名称，没有 BOM 时返回 None
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+    return None
+
+
+def _read_samples(file_path: Path) -> Tuple[bytes, List[bytes], int]:
+    """
+    读取编码检测用的采样块
+
+    Returns:
+        (开头采样, [中间采样, 结尾采样], 文件大小)，小文件只有开头采样（即全文）
+    """
+    sample_bytes = ExtractionConfig.TXT_ENCODING_SAMPLE_BYTES
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(sample_bytes)
+        others = []
+        if size > sample_bytes * 3:
+            for offset in ((size - sample_bytes) // 2, size - sample_bytes):
+                f.seek(offset)
+                others.append(f.read(sample_bytes))
+    return head, others, size
+
+
+def _sample_decodes(encoding: str, head: bytes, others: List[bytes], size: int) -> bool:
+    """判断采样块能否用指定编码解码"""
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        decoder.decode(head, final=len(head) >= size)
+
+        # 中间和结尾的采样块可能从多字节字符的中间开始，只对 UTF-8 做对齐后校验
+        if encoding.replace('_', '-').lower() in ('utf-8', 'utf8'):
+            for index, sample in enumerate(others):
+                start = 0
+                while start < min(3, len(sample)) and 0x80 <= sample[start] <= 0xBF:
+                    start += 1
+                decoder = codecs.getincrementaldecoder(encoding)()
+                decoder.decode(sample[start:], final=index == len(others) - 1)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(file_path: Path, candidates: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    检测文本文件的编码
+
+    Args:
+        file_path: 文件路径
+        candidates: 候选编码，默认使用 FileFormats.TXT_ENCODINGS
+
+    Returns:
+        编码名称，所有候选编码都无法解码时返回 None
+    """
+    head, others, size = _read_samples(file_path)
+
+    bom_encoding = detect_bom(head)
+    if bom_encoding:
+        return bom_encoding
+
+    for encoding in candidates or FileFormats.TXT_ENCODINGS:
+        if _sample_decodes(encoding, head, others, size):
+            return encoding
+    return None
+
+
+def read_text_file(file_path: Path) -> Optional[str]:
+    """
+    读取整个文本文件，自动检测编码
+
+    采样检测通过但全文解码失败时（采样之外存在非法字节），依次尝试其余候选编码
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        文件内容，所有候选编码都无法解码时返回 None
+    """
+    file_path = Path(file_path)
+    detected = detect_encoding(file_path)
+    if detected is None:
+        return None
+
+    encodings = [detected] + [e for e in FileFormats.TXT_ENCODINGS if e != detected]
+    for encoding in encodings:
+        try:
+            with open(file_path, 'r', encoding=encoding) as f:
+                return f.read()
+        except UnicodeDecodeError:
+            logger.debug(f"按 {encoding} 解码失败: {file_path.name}")
+            continue
+    return None
+
+
+def _iter_blocks(file_obj, size: int) -> Iterator[bytes]:
+    """按块读取文件，大文件使用内存映射"""
+    if size and size >= ExtractionConfig.TXT_MMAP_MIN_BYTES:
+        with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, size, _READ_BLOCK_BYTES):
+                yield mapped[offset:offset + _READ_BLOCK_BYTES]
+    else:
+        while True:
+            block = file_obj.read(_READ_BLOCK_BYTES)
+            if not block:
+                return
+            yield block
+
+
+def iter_text_segments(
+    file_path: Path,
+    encoding: Optional[str] = None,
+    segment_chars: Optional[int] = None
+) -> Iterator[str]:
+    """
+    按段落边界分段读取文本文件
+
+    各段在换行符处切分（切分处的换行符不包含在段内），用 '\\n' 连接所有段即得到全文；
+    换行符统一转换为 '\\n'，与文本模式 open() 一致
+
+    Args:
+        file_path: 文件路径
+        encoding: 文件编码，None 表示自动检测
+        segment_chars: 每段的目标字符数，默认使用 ExtractionConfig.TXT_SEGMENT_CHARS；
+                       单行超过目标长度时整行作为一段
+
+    Yields:
+        一段文本
+
+    Raises:
+        ValueError: 无法识别文件编码
+        UnicodeDecodeError: 采样之外存在非法字节
+    """
+    file_path = Path(file_path)
+    if encoding is None:
+        encoding = detect_encoding(file_path)
+        if encoding is None:
+            raise ValueError(f"无法识别文件编码: {file_path.name}")
+
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        yield from iter_decoded_segments(_iter_blocks(f, size), encoding, segment_chars)
+
+
+def _find_line_cut(text: str, limit: int) -> int:
+    """
+    在超长的行中查找切割点：[limit/2, limit) 范围内最靠后的句子结束标点之后，
+    没有时依次查找次要标点（含空格）、空白字符，仍没有时直接在 limit 处切割
+    """
+    low = limit // 2
+    for punctuation in (SENTENCE_END_PUNCTUATION, SECONDARY_PUNCTUATION):
+        cut = max(text.rfind(mark, low, limit) for mark in punctuation)
+        if cut >= 0:
+            return cut + 1
+    for index in range(limit - 1, low - 1, -1):
+        if text[index].isspace():
+            return index + 1
+    return limit
+
+
+def iter_decoded_segments(
+    blocks: Iterable[bytes],
+    encoding: str,
+    segment_chars: Optional[int] = None,
+    max_line_chars: Optional[int] = None
+) -> Iterator[str]:
+    """
+    增量解码字节块，按段落边界分段产出（分段规则与 iter_text_segments 相同）
+
+    用于文件之外的字节流（如标准输入）：每凑满一段立即产出，不等待输入结束
+
+    Args:
+        blocks: 字节块迭代器
+        encoding: 编码
+        segment_chars: 每段的目标字符数，默认使用 ExtractionConfig.TXT_SEGMENT_CHARS
+        max_line_chars: 单行长度上限，None 表示不限制；超过上限仍没有换行时
+                        （如压缩成一行的文本）在句子边界处切分，不再等待换行，
+                        此时切分处没有换行符，各段用 '\n' 连接不再等于全文
+
+    Yields:
+        一段文本
+
+    Raises:
+        UnicodeDecodeError: 存在非法字节
+    """
+    if segment_chars is None:
+        segment_chars = ExtractionConfig.TXT_SEGMENT_CHARS
+
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+    buffer = ''
+    segmented = False
+
+    for block in blocks:
+        buffer += decoder.decode(block)
+        while len(buffer) > segment_chars:
+            # 在目标长度内的最后一个换行处切分，没有换行时切在下一个换行处
+            cut = buffer.rfind('\n', 0, segment_chars)
+            if cut < 0:
+                cut = buffer.find('\n', segment_chars)
+                if max_line_chars is not None and (cut < 0 or cut > max_line_chars):
+                    if len(buffer) <= max_line_chars:
+                        break
+                    # 行超过上限：在句子边界处切分，切分处的字符保留在段内
+                    cut = _find_line_cut(buffer, max_line_chars)
+                    yield buffer[:cut]
+                    buffer = buffer[cut:]
+                    segmented = True
+                    continue
+                if cut < 0:
+                    break
+            yield buffer[:cut]
+            buffer = buffer[cut + 1:]
+            segmented = True
+
+    buffer += decoder.decode(b'', final=True)
+    if buffer or segmented:
+        yield buffer
@@ -18,9 +18,13 @@ class ChunkingConfig:
     参数:
         chunk_size: 文本切割阈值（字符数），默认8000
         min_chunk_size: 最小切割长度（字符数），默认500
+        balanced: 是否启用均衡切割模式（块大小尽量接近 chunk_size），默认False
+        balance_tolerance: 均衡模式允许的块大小偏差比例，默认0.2
     """
     chunk_size: int = 8000
     min_chunk_size: int = 500
+    balanced: bool = False
+    balance_tolerance: float = 0.2
 
 
 @dataclass
@@ -64,12 +68,14 @@ class TranslateConfig:
         retry: 重试策略配置
         api: API 配置
         client_factory: 可选的客户端工厂，用于替换默认 OpenAI 客户端
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'），默认 'document'
     """
     max_workers: int
     chunking: ChunkingConfig
     retry: RetryConfig
     api: ApiConfig
     client_factory: Optional[Callable[['TranslateConfig'], Any]] = None
+    submission_policy: str = 'document'
     
     # 为了向后兼容，保留直接访问属性的接口
     @property
@@ -123,7 +129,10 @@ def create_translate_config(
     api_base_url: Optional[str] = None,
     model: Optional[str] = None,
     api_key: Optional[str] = None,
-    client_factory: Optional[Callable[[TranslateConfig], Any]] = None
+    client_factory: Optional[Callable[[TranslateConfig], Any]] = None,
+    balanced_chunks: bool = False,
+    balance_tolerance: float = 0.2,
+    submission_policy: str = 'document'
 ) -> TranslateConfig:
     """
     便捷函数：创建 TranslateConfig（向后兼容旧的扁平化参数）
@@ -139,6 +148,9 @@ def create_translate_config(
         model: 模型名称（必需）
         api_key: API密钥（必需）
         client_factory: 可选的客户端工厂
+        balanced_chunks: 是否启用均衡切割模式，默认False
+        balance_tolerance: 均衡模式允许的块大小偏差比例，默认0.2
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'），默认 'document'
     
     Returns:
         TranslateConfig: 翻译配置对象
@@ -154,7 +166,12 @@ def create_translate_config(
     
     return TranslateConfig(
         max_workers=max_workers,
-        chunking=ChunkingConfig(chunk_size=chunk_size, min_chunk_size=min_chunk_size),
+        chunking=ChunkingConfig(
+            chunk_size=chunk_size,
+            min_chunk_size=min_chunk_size,
+            balanced=balanced_chunks,
+            balance_tolerance=balance_tolerance
+        ),
         retry=RetryConfig(max_retries=max_retries, retry_delay=retry_delay),
         api=ApiConfig(
             api_base_url=api_base_url,
@@ -162,5 +179,6 @@ def create_translate_config(
             api_key=api_key or "",
             timeout=api_timeout
         ),
-        client_factory=client_factory
+        client_factory=client_factory,
+        submission_policy=submission_policy
     )
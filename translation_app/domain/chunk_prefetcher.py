@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本块预取模块
+
+批量翻译中，文件的提取和切割是 CPU 密集型操作，而翻译是网络密集型操作。
+预取器在子进程中提前提取并切割后续 K 个文件，翻译当前文件的同时准备好下一个文件的文本块：
+
+    提取阶段（进程池，最多领先 K 个文件） -> 有界队列 -> 翻译阶段（按文件顺序逐个翻译）
+
+预取的文件以完整的文本块列表保存在内存中，因此只预取字符数已知且不超过上限的文件；
+第一个文件、超过上限或字符数未知的文件，以及轮到翻译时提取尚未开始的文件，都由翻译器
+边提取边翻译，第一个文本块就绪即开始请求
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from translation_app.core.config import TranslationDefaults
+from translation_app.core.translate_config import ChunkingConfig
+from translation_app.domain.extraction_cache import iter_file_pages
+from translation_app.domain.text_processor import TextProcessor
+
+
+logger = logging.getLogger('ChunkPrefetcher')
+
+
+def prepare_file_chunks(file_path: str, chunking: ChunkingConfig) -> List[str]:
+    """
+    提取并切割一个文件（在子进程中执行）
+
+    Args:
+        file_path: 文件路径
+        chunking: 文本切割配置
+
+    Returns:
+        切割后的文本块列表
+    """
+    processor = TextProcessor(
+        chunk_size=chunking.chunk_size,
+        min_chunk_size=chunking.min_chunk_size,
+        balanced=chunking.balanced,
+        balance_tolerance=chunking.balance_tolerance
+    )
+    return list(processor.iter_chunks(iter_file_pages(Path(file_path))))
+
+
+@dataclass
+class PreparedFile:
+    """
+    预取结果
+
+    chunks 为 None 表示未预取（由翻译器自行流式提取）；
+    error 不为 None 表示提取失败
+    """
+
+    # 文件路径
+    file_path: Path
+
+    # 切割后的文本块
+    chunks: Optional[List[str]] = None
+
+    # 提取过程中的异常
+    error: Optional[BaseException] = None
+
+
+class ChunkPrefetcher:
+    """文本块预取器：按文件顺序产出提取结果，后台最多领先 prefetch 个文件"""
+
+    def __init__(
+        self,
+        files: Sequence[Path],
+        chunking: ChunkingConfig,
+        prefetch: int,
+        char_counts: Dict[Path, Optional[int]],
+        max_chars: int,
+        workers: Optional[int] = None
+    ):
+        """
+        初始化预取器
+
+        Args:
+            files: 待处理的文件列表（按处理顺序）
+            chunking: 文本切割配置
+            prefetch: 领先当前文件的最大文件数（至少为 1）
+            char_counts: 各文件的文本字符数（未知为 None 或 -1）
+            max_chars: 预取文件的最大字符数，超过上限或字符数未知的文件不预取
+            workers: 提取进程数，默认为 min(prefetch, CPU 核数)
+        """
+        self.files = [Path(file_path) for file_path in files]
+        self.chunking = chunking
+        self.prefetch = max(1, prefetch)
+        self.char_counts = char_counts
+        self.max_chars = max_chars
+        self.workers = max(1, workers or min(self.prefetch, os.cpu_count() or 1))
+
+    def __iter__(self) -> Iterator[PreparedFile]:
+        """
+        按文件顺序产出预取结果
+
+        调用方处理完当前文件（取下一个结果）时才补充新的提取任务，
+        保证已提取但未翻译的文件不超过 prefetch 个，且每个都不超过 max_chars 个字符；
+        提前停止迭代时，尚未开始的提取任务会被取消
+
+        Yields:
+            PreparedFile: 文件的文本块或提取异常
+        """
+        if not self.files:
+            return
+
+        logger.info(f'[预取] 提前提取 {self.prefetch} 个文件，{self.workers} 个进程')
+
+        # 使用 spawn 启动子进程，避免在多线程环境下 fork
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        # 第一个文件直接流式翻译，其后领先 prefetch 个文件
+        pending = deque([(self.files[0], None)])
+        next_index = 1
+        try:
+            while next_index < len(self.files) and len(pending) <= self.prefetch:
+                pending.append(self._submit(executor, self.files[next_index]))
+                next_index += 1
+
+            while pending:
+                file_path, future = pending.popleft()
+                if future is None or (not future.done() and future.cancel()):
+                    # 不预取的文件，或轮到翻译时提取尚未开始：由翻译器流式提取
+                    prepared = PreparedFile(file_path)
+                else:
+                    try:
+                        prepared = PreparedFile(file_path, chunks=future.result())
+                    except Exception as e:
+                        prepared = PreparedFile(file_path, error=e)
+                yield prepared
+
+                if next_index < len(self.files):
+                    pending.append(self._submit(executor, self.files[next_index]))
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, executor: ProcessPoolExecutor, file_path: Path):
+        """提交一个文件的提取任务，不预取的文件返回 (文件路径, None)"""
+        char_count = self.char_counts.get(file_path)
+        if char_count is None or not 0 <= char_count <= self.max_chars:
+            logger.debug(f'[预取] 不预取（字符数 {char_count} 超过上限或未知）: {file_path.name}')
+            return file_path, None
+        return file_path, executor.submit(prepare_file_chunks, str(file_path), self.chunking)
+
+
+def iter_prepared_files(
+    files: Sequence[Path],
+    chunking: ChunkingConfig,
+    prefetch: int,
+    char_counts: Optional[Dict[Path, Optional[int]]] = None,
+    max_chars: int = TranslationDefaults.BATCH_PREFETCH_MAX_CHARS
+) -> Iterator[PreparedFile]:
+    """
+    便捷函数：按顺序产出待翻译文件，prefetch 大于 0 时在后台预取
+
+    Args:
+        files: 待处理的文件列表
+        chunking: 文本切割配置
+        prefetch: 预取文件数，0 表示不预取（由翻译器自行流式提取）
+        char_counts: 各文件的文本字符数，没有时所有文件都流式提取
+        max_chars: 预取文件的最大字符数
+
+    Yields:
+        PreparedFile: 预取结果
+    """
+    if prefetch > 0 and char_counts:
+        yield from ChunkPrefetcher(files, chunking, prefetch, char_counts, max_chars)
+        return
+    for file_path in files:
+        yield PreparedFile(Path(file_path))
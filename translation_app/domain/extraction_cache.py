@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+提取结果缓存模块
+
+PDF/EPUB 的解析开销很大，而批量翻译中同一个文件会被多次解析（中文检测、字符统计、翻译）。
+缓存以 (路径, 文件大小, 修改时间, 提取器版本) 为键，将提取出的页面保存为紧凑的二进制格式：
+
+    MAGIC | [4 字节小端长度 | UTF-8 页面内容] ...
+
+可选 gzip 压缩。缓存只在完整提取后以原子方式写入，提前停止迭代不会留下不完整的缓存
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from translation_app.core.config import ExtractionConfig, PathConfig
+from translation_app.domain.extractors import BaseExtractor, get_extractor
+
+
+logger = logging.getLogger('ExtractionCache')
+
+
+# 缓存文件头
+_MAGIC = b'TAPG1\n'
+
+# 页面长度前缀
+_LENGTH = struct.Struct('<I')
+
+
+class ExtractionCache:
+    """提取结果缓存"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        compress: Optional[bool] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录，默认 PathConfig.CACHE_DIR / "extraction"
+            compress: 是否使用 gzip 压缩，默认使用 ExtractionConfig.CACHE_COMPRESS
+            enabled: 是否启用缓存，默认使用 ExtractionConfig.CACHE_ENABLED
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else PathConfig.CACHE_DIR / "extraction"
+        self.compress = ExtractionConfig.CACHE_COMPRESS if compress is None else compress
+        self.enabled = ExtractionConfig.CACHE_ENABLED if enabled is None else enabled
+
+    def iter_pages(self, file_path: Path, extractor: Optional[BaseExtractor] = None) -> Iterator[str]:
+        """
+        逐页产出文件内容，命中缓存时直接读取缓存，否则提取并写入缓存
+
+        Args:
+            file_path: 文件路径
+            extractor: 可选的提取器，默认根据文件类型获取
+
+        Yields:
+            一页或一个章节的文本内容
+        """
+        file_path = Path(file_path)
+        if extractor is None:
+            extractor = get_extractor(str(file_path))
+
+        if not self._is_cacheable(file_path):
+            yield from extractor.iter_pages()
+            return
+
+        try:
+            entry_path = self._entry_path(file_path, extractor)
+        except OSError as e:
+            logger.warning(f'[缓存] 无法读取文件信息，跳过缓存 {file_path.name}: {e}')
+            yield from extractor.iter_pages()
+            return
+
+        if entry_path.exists():
+            yielded = False
+            try:
+                for page in self._read_entry(entry_path):
+                    yielded = True
+                    yield page
+                logger.debug(f'[缓存] 命中: {file_path.name}')
+                return
+            except (OSError, ValueError, EOFError) as e:
+                logger.warning(f'[缓存] 缓存损坏，已删除 {file_path.name}: {e}')
+                self._remove(entry_path)
+                if yielded:
+                    raise
+
+        yield from self._extract_and_store(file_path, extractor, entry_path)
+
+    def evict(self, file_path: Path):
+        """
+        删除文件对应的所有缓存（文件被删除或替换后调用）
+
+        Args:
+            file_path: 文件路径
+        """
+        if not self.cache_dir.exists():
+            return
+        path_key = self._path_key(Path(file_path))
+        for pattern in (f'{path_key}-*.pages', f'{path_key}-*.pages.gz'):
+            for entry_path in self.cache_dir.glob(pattern):
+                self._remove(entry_path)
+
+    def _is_cacheable(self, file_path: Path) -> bool:
+        """判断文件是否需要缓存"""
+        return self.enabled and file_path.suffix.lower() in ExtractionConfig.CACHE_EXTENSIONS
+
+    @staticmethod
+    def _path_key(file_path: Path) -> str:
+        """路径部分的缓存键"""
+        return hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()[:16]
+
+    def _entry_path(self, file_path: Path, extractor: BaseExtractor) -> Path:
+        """
+        计算缓存文件路径：{路径哈希}-{文件大小/修改时间/提取器版本哈希}.pages[.gz]
+        """
+        stat = file_path.stat()
+        signature = f'{stat.st_size}:{stat.st_mtime_ns}:{type(extractor).__name__}:{extractor.VERSION}'
+        signature_key = hashlib.sha1(signature.encode('utf-8')).hexdigest()[:16]
+        suffix = '.pages.gz' if self.compress else '.pages'
+        return self.cache_dir / f'{self._path_key(file_path)}-{signature_key}{suffix}'
+
+    @staticmethod
+    def _open(path: Path, mode: str, compressed: bool) -> BinaryIO:
+        """打开缓存文件，compressed 为 True 时使用 gzip"""
+        if compressed:
+            return gzip.open(path, mode)
+        return open(path, mode)
+
+    def _read_entry(self, entry_path: Path) -> Iterator[str]:
+        """逐页读取缓存文件"""
+        with self._open(entry_path, 'rb', entry_path.name.endswith('.gz')) as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError('缓存文件头不匹配')
+            while True:
+                header = f.read(_LENGTH.size)
+                if not header:
+                    return
+                if len(header) != _LENGTH.size:
+                    raise EOFError('缓存文件不完整')
+                (length,) = _LENGTH.unpack(header)
+                data = f.read(length)
+                if len(data) != length:
+                    raise EOFError('缓存文件不完整')
+                yield data.decode('utf-8')
+
+    def _extract_and_store(self, file_path: Path, extractor: BaseExtractor, entry_path: Path) -> Iterator[str]:
+        """提取文件内容，边产出边写入临时文件，完整提取后原子替换为缓存文件"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_name(
+                f'{entry_path.name}.{os.getpid()}-{threading.get_ident()}.tmp'
+            )
+            writer = self._open(temp_path, 'wb', self.compress)
+            writer.write(_MAGIC)
+        except OSError as e:
+            logger.warning(f'[缓存] 无法创建缓存，直接提取 {file_path.name}: {e}')
+            yield from extractor.iter_pages()
+            return
+
+        completed = False
+        try:
+            for page in extractor.iter_pages():
+                data = page.encode('utf-8')
+                writer.write(_LENGTH.pack(len(data)))
+                writer.write(data)
+                yield page
+            completed = True
+        finally:
+            writer.close()
+            if completed:
+                # 清理同一文件的旧缓存，再原子写入新缓存
+                self.evict(file_path)
+                try:
+                    os.replace(temp_path, entry_path)
+                    logger.debug(f'[缓存] 已写入: {file_path.name}')
+                except OSError as e:
+                    logger.warning(f'[缓存] 写入缓存失败 {file_path.name}: {e}')
+                    self._remove(temp_path)
+            else:
+                self._remove(temp_path)
+
+    @staticmethod
+    def _remove(path: Path):
+        """删除文件，忽略不存在等错误"""
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def iter_file_pages(file_path: Path) -> Iterator[str]:
+    """
+    便捷函数：通过默认缓存逐页读取文件内容
+
+    Args:
+        file_path: 文件路径
+
+    Yields:
+        一页或一个章节的文本内容
+    """
+    return ExtractionCache().iter_pages(file_path)
+
+
+def evict_file_cache(file_path: Path):
+    """
+    便捷函数：删除文件在默认缓存中的所有条目
+
+    Args:
+        file_path: 文件路径
+    """
+    ExtractionCache().evict(file_path)
@@ -1,26 +1,123 @@
 """
 文本提取器（领域层）
+
+提取器按文件扩展名注册，首次用到某种格式时才导入对应的模块：PDF、EPUB 提取器依赖的
+PyPDF2、lxml 等第三方库导入较慢，而合并、状态查询等命令完全用不到它们。
+
+其他包可以通过入口点组 "translation_app.extractors" 注册提取器，入口点名称为扩展名
+（如 ".docx"），值为 "模块:类名"，与内置格式同名时覆盖内置提取器。批量翻译扫描的文件类型
+仍由 FileFormats.SUPPORTED_EXTENSIONS 决定
 """
 
+import importlib
+import logging
+import os
+import threading
+from typing import Dict, Optional, Type, Union
+
 from translation_app.domain.extractors.base_extractor import BaseExtractor
-from translation_app.domain.extractors.pdf_extractor import PDFExtractor
-from translation_app.domain.extractors.epub_extractor import EPUBExtractor
-from translation_app.domain.extractors.txt_extractor import TXTExtractor
+
+
+logger = logging.getLogger('Extractors')
+
+
+# 第三方提取器的入口点组
+ENTRY_POINT_GROUP = 'translation_app.extractors'
+
+# 内置提取器：扩展名 -> "模块:类名"
+_BUILTIN_EXTRACTORS: Dict[str, str] = {
+    '.pdf': 'translation_app.domain.extractors.pdf_extractor:PDFExtractor',
+    '.epub': 'translation_app.domain.extractors.epub_extractor:EPUBExtractor',
+    '.txt': 'translation_app.domain.extractors.txt_extractor:TXTExtractor',
+}
+
+# 扩展名 -> 尚未加载的 "模块:类名"、入口点或已加载的提取器类（首次使用时才读取入口点）
+_registry: Optional[Dict[str, object]] = None
+_registry_lock = threading.RLock()
+
+
+def _normalize_extension(extension: str) -> str:
+    """扩展名统一为小写并以 '.' 开头"""
+    extension = extension.lower()
+    return extension if extension.startswith('.') else f'.{extension}'
+
+
+def _load_registry() -> Dict[str, object]:
+    """内置提取器加上入口点注册的提取器"""
+    # importlib.metadata 导入和扫描已安装的包都有开销，只在首次获取提取器时执行
+    from importlib.metadata import entry_points
+
+    registry: Dict[str, object] = dict(_BUILTIN_EXTRACTORS)
+    try:
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            registry[_normalize_extension(entry_point.name)] = entry_point
+    except Exception as e:
+        logger.warning(f'[提取] 读取提取器入口点失败: {e}')
+    return registry
+
+
+def _get_registry() -> Dict[str, object]:
+    global _registry
+    if _registry is None:
+        _registry = _load_registry()
+    return _registry
+
+
+def register_extractor(extension: str, extractor: Union[str, Type[BaseExtractor]]):
+    """
+    注册（或覆盖）一种格式的提取器
+
+    Args:
+        extension: 扩展名（如 ".docx"）
+        extractor: 提取器类，或延迟导入的 "模块:类名"
+    """
+    with _registry_lock:
+        _get_registry()[_normalize_extension(extension)] = extractor
+
+
+def get_extractor_class(extension: str) -> Optional[Type[BaseExtractor]]:
+    """
+    获取扩展名对应的提取器类，首次使用时导入
+
+    Args:
+        extension: 扩展名（如 ".pdf"）
+
+    Returns:
+        提取器类，不支持的格式返回 None
+    """
+    extension = _normalize_extension(extension)
+    with _registry_lock:
+        registry = _get_registry()
+        target = registry.get(extension)
+        if target is None or isinstance(target, type):
+            return target
+
+        if isinstance(target, str):
+            module_name, _, class_name = target.partition(':')
+            extractor_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            extractor_class = target.load()
+        registry[extension] = extractor_class
+        return extractor_class
 
 
 def get_extractor(file_path: str) -> BaseExtractor:
     """
     根据文件类型获取对应的提取器
     """
-    file_lower = file_path.lower()
+    extractor_class = get_extractor_class(os.path.splitext(file_path)[1])
+    if extractor_class is None:
+        raise ValueError(f'不支持的文件类型: {file_path}')
+    return extractor_class(file_path)
+
 
-    if file_lower.endswith('.pdf'):
-        return PDFExtractor(file_path)
-    if file_lower.endswith('.epub'):
-        return EPUBExtractor(file_path)
-    if file_lower.endswith('.txt'):
-        return TXTExtractor(file_path)
-    raise ValueError(f'不支持的文件类型: {file_path}')
+def __getattr__(name: str):
+    """按需导入内置提取器类（PDFExtractor 等），保持 from ... import PDFExtractor 可用"""
+    for target in _BUILTIN_EXTRACTORS.values():
+        module_name, _, class_name = target.partition(':')
+        if class_name == name:
+            return getattr(importlib.import_module(module_name), class_name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 __all__ = [
@@ -28,6 +125,8 @@ __all__ = [
     'PDFExtractor',
     'EPUBExtractor',
     'TXTExtractor',
+    'ENTRY_POINT_GROUP',
     'get_extractor',
+    'get_extractor_class',
+    'register_extractor',
 ]
-
@@ -6,17 +6,60 @@
 定义文本提取器的通用接口
 """
 
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+from translation_app.domain.text_stats import compute_text_stats
 
 
 logger = logging.getLogger('BaseExtractor')
 
 
+def stratified_indices(count: int, limit: int) -> List[int]:
+    """
+    分层采样的位置：依次取开头、中间、结尾，再逐级二分（1/4、3/4、1/8、3/8 ...）
+
+    按返回顺序读取时，任意前缀都大致均匀地覆盖整个范围，可以随时提前停止
+
+    Args:
+        count: 位置总数
+        limit: 最多返回的位置数
+
+    Returns:
+        不重复的位置索引列表
+    """
+    target = min(count, limit)
+    indices: List[int] = []
+    seen = set()
+
+    def add(index: int):
+        if len(indices) < target and index not in seen:
+            seen.add(index)
+            indices.append(index)
+
+    if target <= 0:
+        return indices
+
+    last = count - 1
+    add(0)
+    add(round(last / 2))
+    add(last)
+    denominator = 4
+    while len(indices) < target:
+        for numerator in range(1, denominator, 2):
+            add(round(last * numerator / denominator))
+        denominator *= 2
+    return indices
+
+
 class BaseExtractor(ABC):
     """文本提取器基类"""
 
+    # 提取逻辑版本号，提取结果发生变化时递增，使旧的提取缓存失效
+    VERSION = 1
+
     def __init__(self, file_path: str):
         """
         初始化提取器
@@ -27,6 +70,20 @@ class BaseExtractor(ABC):
         self.file_path = file_path
 
     @abstractmethod
+    def iter_pages(self, interrupt: Optional[int] = None) -> Iterator[str]:
+        """
+        流式提取文本内容，逐页（或逐项）产出
+
+        调用方可以边提取边处理，也可以提前停止迭代，内存占用与文档大小无关
+
+        Args:
+            interrupt: 上一次处理中断的位置（页码或项索引），None表示从头开始
+
+        Yields:
+            一页或一个章节的文本内容
+        """
+        pass
+
     def extract_text(self, interrupt: Optional[int] = None) -> List[str]:
         """
         提取文本内容
@@ -37,7 +94,19 @@ class BaseExtractor(ABC):
         Returns:
             文本内容列表，每个元素是一页或一个chunk的内容
         """
-        pass
+        return list(self.iter_pages(interrupt))
+
+    def iter_sample_pages(self, limit: int) -> Iterator[str]:
+        """
+        产出用于内容检测的采样页面（默认取前 limit 页，支持随机访问的提取器按分层顺序采样）
+
+        Args:
+            limit: 最多产出的页数
+
+        Yields:
+            一页或一个章节的文本内容（跳过空白页）
+        """
+        return itertools.islice(self.iter_pages(), limit)
 
     def is_blank_page(self, text: str) -> bool:
         """
@@ -59,28 +128,19 @@ class BaseExtractor(ABC):
         if len(text_clean) == 0:
             return True
 
-        # 2. 检查是否只包含空白字符和控制字符
-        printable_chars = sum(1 for c in text_clean if c.isprintable() and not c.isspace())
-        total_chars = len(text_clean)
+        # 2. 检查是否只包含空白字符和控制字符（常见的 HTML 空白实体如 \xa0、\u2000 等都属于空白字符）
+        stats = compute_text_stats(text_clean)
 
         # 可打印字符少于2个，直接认为空白
-        if printable_chars < 2:
+        if stats.printable < 2:
             return True
 
         # 可打印字符比例小于10%也认为空白
-        if total_chars > 0 and printable_chars / total_chars < 0.1:
-            return True
-
-        # 3. 检查是否只包含常见的HTML空白实体和特殊字符
-        blank_chars = [' ', '\n', '\t', '\r', '\xa0', '\u2000', '\u2001',
-                      '\u2002', '\u2003', '\u2004', '\u2005', '\u2006',
-                      '\u2007', '\u2008', '\u2009', '\u200a', '\u202f', '\u205f']
-        blank_chars_only = all(c in blank_chars for c in text_clean)
-        if blank_chars_only:
+        if stats.printable / stats.length < 0.1:
             return True
 
-        # 4. 如果是纯标点符号或特殊符号（没有实际内容）
-        if len(text_clean) < 20 and all(not c.isalnum() for c in text_clean):
+        # 3. 如果是纯标点符号或特殊符号（没有实际内容）
+        if stats.length < 20 and stats.alnum == 0:
             return True
 
         return False
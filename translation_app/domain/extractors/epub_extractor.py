@@ -2,18 +2,25 @@
 # -*- coding: utf-8 -*-
 """
 EPUB 文本提取器
+
+优先直接从 zip 中按书脊（spine）顺序逐个读取正文 XHTML，不加载图片、字体等资源；
+直接读取失败时降级为 ebooklib 读取整本书
 """
 
 import logging
+import multiprocessing
+import os
+import posixpath
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import List, Optional
-
-from ebooklib import epub
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import unquote
 
-from translation_app.domain.extractors.base_extractor import BaseExtractor
-from translation_app.core.config import FileFormats
+from translation_app.domain.extractors.base_extractor import BaseExtractor, stratified_indices
+from translation_app.domain.extractors.html_text import html_to_text
+from translation_app.core.config import ExtractionConfig, FileFormats
 
 
 logger = logging.getLogger('EPUBExtractor')
@@ -22,33 +29,148 @@ logger = logging.getLogger('EPUBExtractor')
 class EPUBExtractor(BaseExtractor):
     """EPUB 文本提取器"""
 
-    def extract_text(self, interrupt: Optional[int] = None) -> List[str]:
+    # 改为按书脊顺序直接读取 zip 后递增，使旧的提取缓存失效
+    VERSION = 3
+
+    def __init__(self, file_path: str, parallel: Optional[bool] = None):
+        """
+        初始化提取器
+
+        Args:
+            file_path: 文件路径
+            parallel: 是否多进程并行解析 HTML，None 表示根据正文大小自动选择
+        """
+        super().__init__(file_path)
+        self.parallel = parallel
+
+    def iter_pages(self, interrupt: Optional[int] = None) -> Iterator[str]:
         """
-        从 EPUB 文件中提取文本内容
+        从 EPUB 文件中逐项提取文本内容
 
         Args:
             interrupt: 上一次翻译异常导致退出的页码，None表示没有任何异常导致中途退出
 
+        Yields:
+            一个HTML项的内容（跳过空白页）
+        """
+        try:
+            spine_members = self._read_spine()
+        except Exception as e:
+            logger.warning(f'[提取][EPUB] 直接读取失败: {e}')
+            logger.info('[提取][EPUB] 尝试使用 ebooklib 读取...')
+            yield from self._extract_with_ebooklib(interrupt)
+            return
+
+        yield from self._extract_from_zip(spine_members, interrupt)
+
+    def iter_sample_pages(self, limit: int) -> Iterator[str]:
+        """
+        按书脊位置分层采样章节（开头、中间、结尾再逐级二分），只读取被采样的章节
+
+        Args:
+            limit: 最多采样的章节数
+
+        Yields:
+            一个HTML项的内容（跳过空白页）
+        """
+        try:
+            spine_members = self._read_spine()
+        except Exception as e:
+            logger.debug(f'[提取][EPUB] 无法直接读取书脊，按顺序采样: {e}')
+            yield from super().iter_sample_pages(limit)
+            return
+
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            for index in stratified_indices(len(spine_members), limit):
+                item_path = spine_members[index][0]
+                try:
+                    page_text = html_to_text(zip_ref.read(item_path), skip_head=True)
+                except Exception as e:
+                    logger.debug(f'[提取][EPUB] 采样 {item_path} 失败: {e}')
+                    continue
+                if not self.is_blank_page(page_text):
+                    yield page_text
+
+    def _read_spine(self) -> List[Tuple[str, int]]:
+        """
+        读取 container.xml 和 OPF，按书脊顺序列出正文 XHTML 在 zip 中的路径
+
         Returns:
-            文本内容列表，每个元素是一个HTML项的内容
+            (zip 成员路径, 解压后大小) 列表，成员缺失时大小为 0
+
+        Raises:
+            Exception: 无法找到 OPF 或书脊中没有正文
         """
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            # 读取 container.xml 找到 OPF 文件
+            container_root = ET.fromstring(zip_ref.read('META-INF/container.xml'))
+
+            # 查找 OPF 路径
+            opf_path = self._find_opf_path(container_root)
+            if not opf_path:
+                raise Exception('无法找到 OPF 文件路径')
+
+            # 读取 OPF 文件，获取 manifest 和 spine
+            opf_root = ET.fromstring(zip_ref.read(opf_path))
+            _, spine_items = self._parse_opf(opf_root)
+
+            opf_dir = posixpath.dirname(opf_path)
+            members = set(zip_ref.namelist())
+            spine_members = []
+            skipped_count = 0
+            for item_info in spine_items:
+                if item_info['media_type'] not in FileFormats.EPUB_MIME_TYPES or not item_info['href']:
+                    skipped_count += 1
+                    continue
+                href = unquote(item_info['href'].replace('\\', '/'))
+                member = posixpath.normpath(posixpath.join(opf_dir, href))
+                size = zip_ref.getinfo(member).file_size if member in members else 0
+                spine_members.append((member, size))
+
+        if not spine_members:
+            raise Exception('书脊中没有任何正文项目')
+
+        if skipped_count:
+            logger.debug(f'[提取][EPUB] 书脊中跳过 {skipped_count} 个非正文项目')
+
+        return spine_members
+
+    def _extract_from_zip(self, spine_members: List[Tuple[str, int]], interrupt: Optional[int]) -> Iterator[str]:
+        """按书脊顺序逐个读取 zip 成员并提取文本，同一时刻只有少量成员在内存中"""
+        logger.debug(f'[提取][EPUB] 直接读取，书脊中共 {len(spine_members)} 个正文项目')
+
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            def read_member(member: Tuple[str, int]) -> bytes:
+                item_path = member[0]
+                try:
+                    return zip_ref.read(item_path)
+                except Exception as e:
+                    logger.error(f'[提取][EPUB] 无法读取文件 {item_path}: {e}')
+                    # 添加错误占位符
+                    return f"[读取出错: {e}]".encode('utf-8')
+
+            total_bytes = sum(size for _, size in spine_members)
+            yield from self._extract_from_contents(spine_members, read_member, interrupt, total_bytes)
+
+    def _extract_with_ebooklib(self, interrupt: Optional[int]) -> Iterator[str]:
+        """使用 ebooklib 读取整本书后提取文本（降级方案）"""
+        from ebooklib import epub
+
         try:
             book = epub.read_epub(self.file_path, options={"ignore_ncx": True})
         except IndexError as e:
             logger.warning(f'[提取][EPUB] 标准方式读取失败: {e}')
             logger.info('[提取][EPUB] 尝试备用方式读取...')
-            try:
-                book = epub.read_epub(self.file_path)
-            except Exception as e2:
-                logger.warning(f'[提取][EPUB] 备用方式也失败: {e2}')
-                # 手动解析 EPUB 文件
-                return self._manual_extract(interrupt)
+            book = epub.read_epub(self.file_path)
 
         # 收集所有需要处理的 HTML/XHTML 内容
         html_items = self._collect_html_items(book)
+        if not html_items:
+            raise Exception('无法从 EPUB 文件中提取任何内容')
 
         # 提取内容
-        return self._extract_from_items(html_items, interrupt)
+        total_bytes = sum(len(item.get_content()) for item in html_items)
+        yield from self._extract_from_contents(html_items, lambda item: item.get_content(), interrupt, total_bytes)
 
     def _collect_html_items(self, book) -> List:
         """收集所有 HTML/XHTML 项"""
@@ -70,75 +192,116 @@ class EPUBExtractor(BaseExtractor):
 
         return html_items
 
-    def _extract_from_items(self, html_items: List, interrupt: Optional[int]) -> List[str]:
-        """从 HTML 项中提取文本"""
-        num = 0
-        content = []
-        blank_count = 0
-
-        for item in html_items:
-            num += 1
-            if interrupt and num < interrupt:
-                continue
-
-            logger.debug(f'[提取][EPUB] 处理第 {num} 项')
-
-            try:
-                soup = BeautifulSoup(item.get_content(), 'html.parser')
+    def _extract_from_contents(
+        self,
+        items: Sequence,
+        read: Callable[[object], bytes],
+        interrupt: Optional[int],
+        total_bytes: int
+    ) -> Iterator[str]:
+        """
+        按阅读顺序逐项读取 HTML 内容并提取文本，过滤空白页
 
-                # 移除 script 和 style 标签
-                for script in soup(["script", "style"]):
-                    script.decompose()
+        Args:
+            items: 按阅读顺序排列的正文项
+            read: 读取一项 HTML/XHTML 内容的函数（仅在需要时调用）
+            interrupt: 上一次翻译异常导致退出的页码，None表示没有任何异常导致中途退出
+            total_bytes: 正文 HTML 总大小，用于决定是否并行解析
 
-                # 提取文本，保留换行
-                page_text = soup.get_text(separator='\n', strip=True)
+        Yields:
+            一个HTML项的内容（跳过空白页）
+        """
+        # 跳过前面已经翻译过的项，从上一次翻译异常的项重新开始
+        first_num = interrupt if interrupt else 1
+        numbered = (
+            (num, read(item)) for num, item in enumerate(items[first_num - 1:], start=first_num)
+        )
+        parallel = self._should_parallelize(len(items) - first_num + 1, total_bytes)
+
+        content_count = 0
+        blank_count = 0
 
+        for num, result in self._iter_item_texts(numbered, parallel):
+            if isinstance(result, Exception):
+                logger.error(f'[提取][EPUB] 处理第 {num} 项时出错: {result}')
+                page_text = f"[处理出错: {result}]"
+            elif self.is_blank_page(result):
                 # 检查和过滤空白页
-                if self.is_blank_page(page_text):
-                    blank_count += 1
-                    logger.debug(f'[提取][EPUB] 第 {num} 项为空白页，已跳过')
-                    continue
-
-                content.append(page_text)
-
-            except Exception as e:
-                logger.error(f'[提取][EPUB] 处理第 {num} 项时出错: {e}')
-                content.append(f"[处理出错: {e}]")
+                blank_count += 1
+                logger.debug(f'[提取][EPUB] 第 {num} 项为空白页，已跳过')
+                continue
+            else:
+                page_text = result
 
-        logger.info(f'[提取][EPUB] 完成，有效内容: {len(content)} 项，过滤空白: {blank_count} 项')
-        return content
+            content_count += 1
+            yield page_text
 
-    def _manual_extract(self, interrupt: Optional[int]) -> List[str]:
-        """手动解析 EPUB 文件（降级方案）"""
-        logger.info('[提取][EPUB] 尝试手动解析...')
+        logger.info(f'[提取][EPUB] 完成，有效内容: {content_count} 项，过滤空白: {blank_count} 项')
 
-        html_items = []
+    def _iter_item_texts(
+        self,
+        numbered: Iterator[Tuple[int, bytes]],
+        parallel: bool
+    ) -> Iterator[Tuple[int, Union[str, Exception]]]:
+        """
+        按顺序产出每一项的正文，解析出错时产出异常对象
 
-        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-            # 读取 container.xml 找到 OPF 文件
-            container_xml = zip_ref.read('META-INF/container.xml')
-            container_root = ET.fromstring(container_xml)
+        并行时分发到进程池解析，同时在途的任务数不超过进程数的 4 倍，内存占用与书籍大小无关
 
-            # 查找 OPF 路径
-            opf_path = self._find_opf_path(container_root)
-            if not opf_path:
-                raise Exception('无法找到 OPF 文件路径')
-
-            # 读取 OPF 文件
-            opf_xml = zip_ref.read(opf_path)
-            opf_root = ET.fromstring(opf_xml)
+        Args:
+            numbered: (项序号, HTML 内容) 迭代器，按需读取
+            parallel: 是否多进程并行解析
 
-            # 获取 manifest 和 spine
-            manifest_items, spine_items = self._parse_opf(opf_root)
+        Yields:
+            (项序号, 正文文本或异常)
+        """
+        if not parallel:
+            for num, content in numbered:
+                logger.debug(f'[提取][EPUB] 处理第 {num} 项')
+                try:
+                    yield num, html_to_text(content, skip_head=True)
+                except Exception as e:
+                    yield num, e
+            return
 
-            # 读取 HTML 内容
-            html_items = self._read_html_items(zip_ref, opf_path, spine_items, manifest_items)
+        workers = ExtractionConfig.EPUB_PARALLEL_WORKERS or os.cpu_count() or 1
+        logger.info(f'[提取][EPUB] 并行解析，{workers} 个进程')
 
-        if not html_items:
-            raise Exception('无法从 EPUB 文件中提取任何内容')
-
-        logger.info(f'[提取][EPUB] 手动解析成功，找到 {len(html_items)} 个HTML项目')
-        return self._extract_from_manual_items(html_items, interrupt)
+        # 使用 spawn 启动子进程，避免在多线程环境下 fork
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        pending = deque()
+        try:
+            for num, content in numbered:
+                pending.append((num, executor.submit(html_to_text, content, True)))
+                if len(pending) < workers * 4:
+                    continue
+                yield self._collect_item(pending.popleft())
+
+            while pending:
+                yield self._collect_item(pending.popleft())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect_item(item) -> Tuple[int, Union[str, Exception]]:
+        """等待一项解析完成"""
+        num, future = item
+        logger.debug(f'[提取][EPUB] 处理第 {num} 项')
+        try:
+            return num, future.result()
+        except Exception as e:
+            return num, e
+
+    def _should_parallelize(self, item_count: int, total_bytes: int) -> bool:
+        """判断是否启用多进程并行解析"""
+        if item_count < 2:
+            return False
+        if self.parallel is not None:
+            return self.parallel
+        if (ExtractionConfig.EPUB_PARALLEL_WORKERS or os.cpu_count() or 1) < 2:
+            return False
+        return total_bytes >= ExtractionConfig.EPUB_PARALLEL_MIN_BYTES
 
     def _find_opf_path(self, container_root) -> Optional[str]:
         """查找 OPF 文件路径"""
@@ -190,67 +353,3 @@ class EPUBExtractor(BaseExtractor):
                     spine_items.append(manifest_items[item_id])
 
         return manifest_items, spine_items
-
-    def _read_html_items(self, zip_ref, opf_path, spine_items, manifest_items):
-        """读取 HTML 项内容"""
-        import os
-        opf_dir = os.path.dirname(opf_path) if os.path.dirname(opf_path) else ''
-
-        html_items = []
-        for item_info in spine_items:
-            if item_info['media_type'] in FileFormats.EPUB_MIME_TYPES:
-                item_path = os.path.join(opf_dir, item_info['href']).replace('\\', '/')
-                try:
-                    content = zip_ref.read(item_path)
-                    item = epub.EpubHtml(
-                        uid=item_info['href'],
-                        file_name=item_path,
-                        media_type=item_info['media_type']
-                    )
-                    item.content = content
-                    html_items.append(item)
-                except Exception as e:
-                    logger.error(f'[提取][EPUB] 无法读取文件 {item_path}: {e}')
-                    # 添加错误占位符
-                    error_item = epub.EpubHtml(
-                        uid=item_info['href'],
-                        file_name=item_path,
-                        media_type=item_info['media_type']
-                    )
-                    error_item.content = f"[读取出错: {e}]".encode('utf-8')
-                    html_items.append(error_item)
-
-        return html_items
-
-    def _extract_from_manual_items(self, html_items: List, interrupt: Optional[int]) -> List[str]:
-        """从手动解析的 HTML 项中提取文本"""
-        num = 0
-        content = []
-        blank_count = 0
-
-        for item in html_items:
-            num += 1
-            if interrupt and num < interrupt:
-                continue
-
-            logger.debug(f'[提取][EPUB] 处理第 {num} 项')
-
-            try:
-                soup = BeautifulSoup(item.content, 'html.parser')
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                page_text = soup.get_text(separator='\n', strip=True)
-
-                if self.is_blank_page(page_text):
-                    blank_count += 1
-                    logger.debug(f'[提取][EPUB] 第 {num} 项为空白页，已跳过')
-                    continue
-
-                content.append(page_text)
-            except Exception as e:
-                logger.error(f'[提取][EPUB] 处理第 {num} 项时出错: {e}')
-                content.append(f"[处理出错: {e}]")
-
-        logger.info(f'[提取][EPUB] 完成，有效内容: {len(content)} 项，过滤空白: {blank_count} 项')
-        return content
-
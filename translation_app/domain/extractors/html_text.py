@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML/XHTML 正文提取
+
+与 BeautifulSoup 的 soup.get_text(separator='\n', strip=True)（移除 script/style 后）语义一致，
+但不构建文档树，按事件流直接收集文本：
+1. lxml 的 C 语言 XML 解析器（EPUB 正文为 XHTML，格式良好时使用）
+2. 标准库 html.parser 流式解析（不构建 BeautifulSoup 树）
+3. BeautifulSoup html.parser（原实现，作为最终降级方案）
+"""
+
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import FrozenSet, List, Union
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml 为可选加速依赖
+    etree = None
+
+from translation_app.core.text_encoding import detect_bom
+
+
+logger = logging.getLogger('HtmlText')
+
+
+# 不参与正文提取的标签（script/style 被移除；rt/rp/template 内的文本不属于 get_text 的默认字符串类型）
+SKIPPED_TAGS = frozenset({'script', 'style', 'template', 'rt', 'rp'})
+
+# 空元素（没有结束标签，不入栈）
+VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+    'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+    'image', 'isindex', 'nextid', 'spacer',
+})
+
+# 编码声明
+_XML_ENCODING_PATTERN = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)["\']')
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9._-]+)', re.IGNORECASE)
+
+
+class _TextCollector:
+    """
+    文本收集器：接收解析事件，按 BeautifulSoup 的字符串划分规则收集文本
+
+    相邻的文本数据合并为一个字符串，遇到标签、注释等节点边界时结束当前字符串；
+    每个字符串去除首尾空白后非空才保留
+    """
+
+    def __init__(self, skipped_tags: FrozenSet[str] = SKIPPED_TAGS):
+        self.skipped_tags = skipped_tags
+        self.strings: List[str] = []
+        self._pending: List[str] = []
+        self._stack: List[str] = []
+        self._skip_depth = 0
+
+    def flush(self):
+        """结束当前字符串"""
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending = []
+        if text and not self._skip_depth:
+            self.strings.append(text)
+
+    def add_data(self, data: str):
+        self._pending.append(data)
+
+    def add_string(self, data: str):
+        """添加一个独立的字符串节点（如 CDATA）"""
+        self.flush()
+        self._pending.append(data)
+        self.flush()
+
+    def start(self, tag: str, self_closing: bool = False):
+        self.flush()
+        if self_closing or tag in VOID_TAGS:
+            return
+        self._stack.append(tag)
+        if tag in self.skipped_tags:
+            self._skip_depth += 1
+
+    def end(self, tag: str):
+        self.flush()
+        if tag not in self._stack:
+            return
+        # 弹出到最近的同名标签（未闭合的子标签一并关闭）
+        while self._stack:
+            popped = self._stack.pop()
+            if popped in self.skipped_tags:
+                self._skip_depth -= 1
+            if popped == tag:
+                break
+
+    def boundary(self):
+        """注释、声明、处理指令等节点：只结束当前字符串，本身不计入正文"""
+        self.flush()
+
+    def text(self) -> str:
+        self.flush()
+        return '\n'.join(self.strings)
+
+
+class _StreamingHTMLParser(HTMLParser):
+    """基于标准库 html.parser 的流式解析器，不构建文档树"""
+
+    def __init__(self, collector: _TextCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.collector.start(tag, self_closing=True)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.add_data(data)
+
+    def handle_comment(self, data):
+        self.collector.boundary()
+
+    def handle_decl(self, decl):
+        self.collector.boundary()
+
+    def handle_pi(self, data):
+        self.collector.boundary()
+
+    def unknown_decl(self, data):
+        if data.upper().startswith('CDATA['):
+            self.collector.add_string(data[len('CDATA['):])
+        else:
+            self.collector.boundary()
+
+
+class _LxmlTarget:
+    """lxml 解析器事件目标"""
+
+    def __init__(self, collector: _TextCollector):
+        self.collector = collector
+
+    @staticmethod
+    def _local_name(tag) -> str:
+        if not isinstance(tag, str):
+            return ''
+        return tag.rsplit('}', 1)[-1].lower()
+
+    def start(self, tag, attrib, nsmap=None):
+        self.collector.start(self._local_name(tag))
+
+    def end(self, tag):
+        self.collector.end(self._local_name(tag))
+
+    def data(self, data):
+        self.collector.add_data(data)
+
+    def comment(self, text):
+        self.collector.boundary()
+
+    def pi(self, target, data=None):
+        self.collector.boundary()
+
+    def close(self):
+        return self.collector.text()
+
+
+def _decode_markup(content: bytes) -> str:
+    """按 BOM、XML 声明或 meta charset 解码，默认 UTF-8（解码失败抛出 UnicodeDecodeError）"""
+    bom_encoding = detect_bom(content)
+    if bom_encoding:
+        return content.decode(bom_encoding)
+
+    head = content[:1024]
+    match = _XML_ENCODING_PATTERN.match(head) or _META_CHARSET_PATTERN.search(head)
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = 'utf-8'
+    return content.decode(encoding)
+
+
+def _extract_with_lxml(content: bytes, skipped_tags: FrozenSet[str]) -> str:
+    """使用 lxml 的 XML 解析器（C 实现）提取文本，要求内容为格式良好的 XHTML"""
+    collector = _TextCollector(skipped_tags)
+    parser = etree.XMLParser(
+        target=_LxmlTarget(collector),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    return etree.fromstring(content, parser)
+
+
+def _extract_with_html_parser(content: bytes, skipped_tags: FrozenSet[str]) -> str:
+    """使用标准库 html.parser 流式提取文本"""
+    collector = _TextCollector(skipped_tags)
+    parser = _StreamingHTMLParser(collector)
+    parser.feed(_decode_markup(content))
+    parser.close()
+    return collector.text()
+
+
+def _extract_with_soup(content: Union[bytes, str], skip_head: bool = False) -> str:
+    """使用 BeautifulSoup 提取文本（原实现）"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+
+    # 移除 script 和 style 标签
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    if skip_head:
+        for head in soup(["head"]):
+            head.decompose()
+
+    # 提取文本，保留换行
+    return soup.get_text(separator='\n', strip=True)
+
+
+def html_to_text(content: Union[bytes, str], skip_head: bool = False) -> str:
+    """
+    提取 HTML/XHTML 正文文本
+
+    优先使用 lxml，其次是标准库流式解析，都失败时降级为 BeautifulSoup
+
+    Args:
+        content: HTML/XHTML 内容
+        skip_head: 是否忽略 <head> 中的文本（如 <title>），只提取正文
+
+    Returns:
+        各文本节点去除首尾空白后以换行连接的正文
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    skipped_tags = SKIPPED_TAGS | {'head'} if skip_head else SKIPPED_TAGS
+
+    # lxml 的 XML 解析器会把 CDATA 与相邻文本合并，含 CDATA 时交给流式解析器以保持一致
+    if etree is not None and b'<![CDATA[' not in content:
+        try:
+            return _extract_with_lxml(content, skipped_tags)
+        except etree.XMLSyntaxError:
+            pass
+
+    try:
+        return _extract_with_html_parser(content, skipped_tags)
+    except (UnicodeDecodeError, AssertionError) as e:
+        logger.debug(f'[提取][HTML] 流式解析失败，改用 BeautifulSoup: {e}')
+
+    return _extract_with_soup(content, skip_head)
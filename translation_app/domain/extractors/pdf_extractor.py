@@ -5,36 +5,74 @@ PDF 文本提取器
 """
 
 import logging
-from typing import List, Optional
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
 from PyPDF2 import PdfReader
 
-from translation_app.domain.extractors.base_extractor import BaseExtractor
+from translation_app.domain.extractors.base_extractor import BaseExtractor, stratified_indices
+from translation_app.core.config import ExtractionConfig
 
 
 logger = logging.getLogger('PDFExtractor')
 
 
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    提取指定页码范围的文本（在子进程中执行，每个进程独立打开 PdfReader）
+
+    Args:
+        file_path: PDF 文件路径
+        start: 起始页索引（从 0 开始，包含）
+        stop: 结束页索引（不包含）
+
+    Returns:
+        各页去除首尾空白后的文本，空白页为空字符串
+    """
+    reader = PdfReader(file_path)
+    return [(reader.pages[index].extract_text() or '').strip() for index in range(start, stop)]
+
+
 class PDFExtractor(BaseExtractor):
     """PDF 文本提取器"""
 
-    def extract_text(self, interrupt: Optional[int] = None) -> List[str]:
+    def __init__(self, file_path: str, parallel: Optional[bool] = None):
         """
-        从 PDF 文件中提取文本内容
+        初始化提取器
+
+        Args:
+            file_path: 文件路径
+            parallel: 是否多进程并行提取，None 表示根据文件大小自动选择
+        """
+        super().__init__(file_path)
+        self.parallel = parallel
+
+    def iter_pages(self, interrupt: Optional[int] = None) -> Iterator[str]:
+        """
+        从 PDF 文件中逐页提取文本内容
 
         Args:
             interrupt: 上一次翻译异常导致退出的页码，None表示没有任何异常导致中途退出
 
-        Returns:
-            文本内容列表，每个元素是一页的内容
+        Yields:
+            一页的内容（跳过空白页）
         """
         reader = PdfReader(self.file_path)
+        # 跳过前面已经翻译过的页面，从上一次翻译异常的页面重新开始
+        first_index = interrupt - 1 if interrupt else 0
+        page_count = len(reader.pages)
+
+        if self._should_parallelize(page_count - first_index):
+            yield from self._iter_parallel(first_index, page_count)
+            return
+
         num = 0
-        content = []
 
         for page in reader.pages:
             num += 1
-            # 跳过前面已经翻译过的页面，从上一次翻译异常的页面重新开始
             if interrupt and num < interrupt:
                 continue
 
@@ -45,7 +83,89 @@ class PDFExtractor(BaseExtractor):
             if not page_text:
                 continue
 
-            content.append(page_text)
+            yield page_text
 
-        return content
+    def iter_sample_pages(self, limit: int) -> Iterator[str]:
+        """
+        按开头、中间、结尾再逐级二分的顺序采样页面，只解析被采样的页
+
+        Args:
+            limit: 最多采样的页数
 
+        Yields:
+            一页的内容（跳过空白页）
+        """
+        reader = PdfReader(self.file_path)
+        for index in stratified_indices(len(reader.pages), limit):
+            page_text = (reader.pages[index].extract_text() or '').strip()
+            if page_text:
+                yield page_text
+
+    def _should_parallelize(self, page_count: int) -> bool:
+        """判断是否启用多进程并行提取"""
+        if page_count < ExtractionConfig.PDF_PAGES_PER_SHARD * 2:
+            return False
+        if self.parallel is not None:
+            return self.parallel
+        try:
+            return os.path.getsize(self.file_path) >= ExtractionConfig.PDF_PARALLEL_MIN_BYTES
+        except OSError:
+            return False
+
+    def _iter_parallel(self, first_index: int, page_count: int) -> Iterator[str]:
+        """
+        多进程并行提取：将页码范围切分成多段分发到进程池，按页码顺序产出结果
+
+        同时在途的分段数量不超过进程数的 2 倍，内存占用与文档大小无关；
+        调用方提前停止迭代时，尚未开始的分段会被取消
+
+        Args:
+            first_index: 起始页索引（从 0 开始）
+            page_count: 总页数
+
+        Yields:
+            一页的内容（跳过空白页）
+        """
+        shards = self._build_shards(first_index, page_count)
+        workers = min(ExtractionConfig.PDF_PARALLEL_WORKERS or os.cpu_count() or 1, len(shards))
+        logger.info(
+            f'[提取][PDF] 并行提取 {page_count - first_index} 页，'
+            f'{len(shards)} 个分段，{workers} 个进程'
+        )
+
+        # 使用 spawn 启动子进程，避免在多线程环境下 fork
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        pending = deque()
+        try:
+            # 按分段顺序收集，保证页码顺序不变
+            for start, stop in shards:
+                future = executor.submit(_extract_page_range, self.file_path, start, stop)
+                pending.append((start, stop, future))
+                if len(pending) < workers * 2:
+                    continue
+                yield from self._drain_shard(pending.popleft())
+
+            while pending:
+                yield from self._drain_shard(pending.popleft())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _drain_shard(shard) -> Iterator[str]:
+        """等待一个分段完成并产出其中的非空页面"""
+        start, stop, future = shard
+        pages = future.result()
+        logger.debug(f'[提取][PDF] 完成第 {start + 1}-{stop} 页')
+        for page_text in pages:
+            if page_text:
+                yield page_text
+
+    @staticmethod
+    def _build_shards(first_index: int, page_count: int) -> List[Tuple[int, int]]:
+        """将 [first_index, page_count) 按固定页数切分成多个分段"""
+        step = ExtractionConfig.PDF_PAGES_PER_SHARD
+        return [
+            (start, min(start + step, page_count))
+            for start in range(first_index, page_count, step)
+        ]
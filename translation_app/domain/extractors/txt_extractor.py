@@ -5,8 +5,9 @@ TXT 文本提取器
 """
 
 import logging
-from typing import List, Optional
+from typing import Iterator, Optional
 
+from translation_app.core.text_encoding import detect_encoding, iter_text_segments
 from translation_app.domain.extractors.base_extractor import BaseExtractor
 
 
@@ -16,19 +17,27 @@ logger = logging.getLogger('TXTExtractor')
 class TXTExtractor(BaseExtractor):
     """TXT 文本提取器"""
 
-    def extract_text(self, interrupt: Optional[int] = None) -> List[str]:
+    def iter_pages(self, interrupt: Optional[int] = None) -> Iterator[str]:
         """
         从 TXT 文件中提取文本内容
 
+        编码只检测一次（BOM 或采样），按段落边界分段产出，大文件使用内存映射读取
+
         Args:
             interrupt: 此参数对 TXT 文件无效（因为是全文读取）
 
-        Returns:
-            文本内容列表，包含整个文件内容
-        """
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        Yields:
+            一段文本（在换行处切分，后续由 TextProcessor 进行切割）
 
-        # 返回完整内容，后续由 TextProcessor 进行切割
-        return [content] if content else []
+        Raises:
+            ValueError: 无法识别文件编码
+        """
+        encoding = detect_encoding(self.file_path)
+        if encoding is None:
+            raise ValueError(f'无法识别文件编码: {self.file_path}')
+        logger.debug(f'[提取][TXT] 文件编码: {encoding}')
+
+        for segment in iter_text_segments(self.file_path, encoding):
+            if segment:
+                yield segment
 
@@ -7,15 +7,23 @@
 """
 
 import logging
+import math
 from pathlib import Path
 from typing import Optional
 
 from translation_app.core.config import CharLimits
+from translation_app.core.text_encoding import detect_encoding, iter_text_segments
+from translation_app.domain.extraction_cache import iter_file_pages
 from translation_app.domain.extractors import get_extractor
+from translation_app.domain.extractors.base_extractor import stratified_indices
+from translation_app.domain.text_stats import compute_text_stats, count_cjk
 
 
 logger = logging.getLogger('FileAnalyzer')
 
+# 可以从任意字节位置对齐解码采样块的编码
+_SAMPLEABLE_ENCODINGS = ('utf-8', 'utf-8-sig', 'gbk', 'gb2312')
+
 
 def count_file_characters(file_path: Path) -> int:
     """
@@ -48,15 +56,36 @@ def count_file_characters(file_path: Path) -> int:
 
 
 def _count_txt_characters(file_path: Path) -> int:
-    """统计 TXT 文件字符数"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read().strip()
-    return len(content)
+    """
+    统计 TXT 文件字符数（去除首尾空白后的长度）
+    
+    按段读取，不保存全文；各段以换行连接即为全文
+    """
+    total_chars = 0
+    trailing_space = 0
+    started = False
+    for index, segment in enumerate(iter_text_segments(file_path)):
+        text = segment if index == 0 else '\n' + segment
+        if not started:
+            # 跳过开头空白
+            text = text.lstrip()
+            if not text:
+                continue
+            started = True
+        total_chars += len(text)
+        stripped = text.rstrip()
+        if stripped:
+            trailing_space = len(text) - len(stripped)
+        else:
+            trailing_space += len(text)
+    return total_chars - trailing_space
 
 
 def _count_using_extractor(file_path: Path, file_type: str) -> int:
     """
-    使用提取器统计文件字符数
+    使用提取器统计文件字符数（逐页累计，不保存全文）
+    
+    提取结果通过提取缓存共享，同一文件后续的统计和翻译不再重复解析
     
     Args:
         file_path: 文件路径
@@ -65,23 +94,67 @@ def _count_using_extractor(file_path: Path, file_type: str) -> int:
     Returns:
         字符数
     """
-    extractor = get_extractor(str(file_path))
-    content_list = extractor.extract_text()
-    
     total_chars = 0
-    for content in content_list:
+    for content in iter_file_pages(file_path):
         if content:
             total_chars += len(content.strip())
     
     return total_chars
 
 
+class _ChineseRatioEstimator:
+    """
+    累计采样文本的中文占比，并用 Hoeffding 不等式判断结论是否足够可靠
+
+    同一行内的字符高度相关，以采样的非空行数 n 为样本量，误差界 ε = sqrt(ln(2/δ) / (2n))，
+    δ = 1 - 置信度；估计值与阈值的差距超过 ε 时给出结论，否则需要继续采样
+    """
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.chinese = 0
+        self.non_space = 0
+        self.lines = 0
+
+    def add(self, text: str):
+        """累计一段采样文本"""
+        stats = compute_text_stats(text)
+        self.chinese += stats.chinese
+        self.non_space += stats.non_space
+        self.lines += sum(1 for line in text.splitlines() if line and not line.isspace())
+
+    @property
+    def ratio(self) -> float:
+        """当前估计的中文占比"""
+        return self.chinese / self.non_space if self.non_space else 0.0
+
+    def decide(self) -> Optional[bool]:
+        """
+        根据置信界给出结论
+
+        Returns:
+            True/False 为可靠结论，None 表示处于阈值附近，需要更多样本
+        """
+        if self.lines == 0:
+            return None
+        delta = 1 - CharLimits.CHINESE_DETECT_CONFIDENCE
+        margin = math.sqrt(math.log(2 / delta) / (2 * self.lines))
+        if self.ratio - margin >= self.threshold:
+            return True
+        if self.ratio + margin < self.threshold:
+            return False
+        return None
+
+
 def is_file_chinese(file_path: Path, threshold: Optional[float] = None) -> bool:
     """
-    判断 .txt 文件内容是否主要是中文
+    判断文件内容是否主要是中文
+    
+    先按开头、中间、结尾的顺序分层采样，采样结果足够可靠时提前返回；
+    只有占比接近阈值时才完整扫描全文
     
     Args:
-        file_path: 文件路径（仅支持 .txt 文件）
+        file_path: 文件路径（支持 txt、pdf、epub）
         threshold: 中文字符占比阈值，默认使用配置值
     
     Returns:
@@ -93,34 +166,100 @@ def is_file_chinese(file_path: Path, threshold: Optional[float] = None) -> bool:
     
     file_ext = file_path.suffix.lower()
     
-    # 只处理 .txt 文件
-    if file_ext != '.txt':
-        return False
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 统计中文字符数量
-        chinese_count = 0
-        total_chars = 0
-        for char in content:
-            if char.strip():  # 忽略空白字符
-                total_chars += 1
-                if '\u4e00' <= char <= '\u9fff':
-                    chinese_count += 1
-        
-        if total_chars == 0:
+        if file_ext == '.txt':
+            return _is_txt_chinese(file_path, threshold)
+        elif file_ext in ('.pdf', '.epub'):
+            return _is_book_chinese(file_path, threshold)
+        else:
             return False
-        
-        chinese_ratio = chinese_count / total_chars
-        return chinese_ratio >= threshold
             
     except Exception as e:
         logger.error(f"判断文件是否中文失败 {file_path.name}: {e}")
         return False
 
 
+def _is_txt_chinese(file_path: Path, threshold: float) -> bool:
+    """
+    判断 TXT 文件是否主要是中文：按字节位置分层采样，必要时完整扫描
+    """
+    encoding = detect_encoding(file_path)
+    if encoding is None:
+        return False
+    
+    block_bytes = CharLimits.CHINESE_SAMPLE_BLOCK_BYTES
+    size = file_path.stat().st_size
+    estimator = _ChineseRatioEstimator(threshold)
+    
+    # 小文件或无法按字节对齐采样的编码（UTF-16/32）直接完整扫描
+    if size > block_bytes * CharLimits.CHINESE_SAMPLE_BLOCKS and encoding in _SAMPLEABLE_ENCODINGS:
+        slot_count = size // block_bytes
+        indices = stratified_indices(slot_count, CharLimits.CHINESE_SAMPLE_BLOCKS)
+        with open(file_path, 'rb') as f:
+            for sampled, index in enumerate(indices, start=1):
+                f.seek(index * block_bytes)
+                estimator.add(_decode_sample(f.read(block_bytes), encoding, index == 0))
+                if sampled < CharLimits.CHINESE_SAMPLE_MIN_BLOCKS:
+                    continue
+                decision = estimator.decide()
+                if decision is not None:
+                    logger.debug(
+                        f"[中文检测] {file_path.name}: 采样 {sampled} 块，"
+                        f"中文占比约 {estimator.ratio:.1%}"
+                    )
+                    return decision
+        logger.debug(f"[中文检测] {file_path.name}: 采样占比 {estimator.ratio:.1%} 接近阈值，完整扫描")
+    
+    estimator = _ChineseRatioEstimator(threshold)
+    for segment in iter_text_segments(file_path, encoding):
+        estimator.add(segment)
+    return estimator.non_space > 0 and estimator.ratio >= threshold
+
+
+def _decode_sample(data: bytes, encoding: str, at_start: bool) -> str:
+    """
+    解码一个采样块
+
+    非开头的块可能从多字节字符中间开始：从第一个换行之后开始解码（UTF-8/GBK 的多字节字符不包含换行字节），
+    没有换行时跳过 UTF-8 的续字节；块末尾被截断的字符按替换字符处理
+    """
+    if not at_start:
+        encoding = 'utf-8' if encoding == 'utf-8-sig' else encoding
+        newline = data.find(b'\n')
+        if newline >= 0:
+            data = data[newline + 1:]
+        elif encoding == 'utf-8':
+            start = 0
+            while start < min(3, len(data)) and 0x80 <= data[start] <= 0xBF:
+                start += 1
+            data = data[start:]
+    return data.decode(encoding, errors='replace')
+
+
+def _is_book_chinese(file_path: Path, threshold: float) -> bool:
+    """
+    判断 PDF/EPUB 是否主要是中文：按页面位置分层采样，必要时通过提取缓存完整扫描
+    """
+    estimator = _ChineseRatioEstimator(threshold)
+    extractor = get_extractor(str(file_path))
+    for sampled, page in enumerate(extractor.iter_sample_pages(CharLimits.CHINESE_SAMPLE_PAGES), start=1):
+        estimator.add(page)
+        if sampled < CharLimits.CHINESE_SAMPLE_MIN_BLOCKS:
+            continue
+        decision = estimator.decide()
+        if decision is not None:
+            logger.debug(
+                f"[中文检测] {file_path.name}: 采样 {sampled} 页，中文占比约 {estimator.ratio:.1%}"
+            )
+            return decision
+    
+    logger.debug(f"[中文检测] {file_path.name}: 采样占比 {estimator.ratio:.1%} 接近阈值，完整扫描")
+    estimator = _ChineseRatioEstimator(threshold)
+    for page in iter_file_pages(file_path):
+        estimator.add(page)
+    return estimator.non_space > 0 and estimator.ratio >= threshold
+
+
 def count_chinese_characters(text: str) -> int:
     """
     统计文本中的中文字符数量
@@ -134,8 +273,4 @@ def count_chinese_characters(text: str) -> int:
     实现：
         使用 Unicode 范围 \\u4e00 - \\u9fff 判断中文字符
     """
-    count = 0
-    for char in text:
-        if '\u4e00' <= char <= '\u9fff':
-            count += 1
-    return count
+    return count_cjk(text)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文件排序策略模块
+
+决定批量翻译中文件的处理顺序：
+- name: 按扩展名（txt、pdf、epub）分组、组内按文件名排序（默认，与目录扫描顺序一致）
+- shortest_first: 预估文本块数最少的文件优先（SJF），单位时间内完成的文件数最多
+- largest_first: 预估文本块数最多的文件优先，尽早开始耗时最长的文件
+
+无论使用哪种策略，匹配优先级规则的文件都排在最前面。优先级规则来自工作目录中的
+.priority 文件和命令行参数，每条规则是一个文件名通配符（如 "urgent_*"、"*.pdf"），
+靠前的规则优先级更高；.priority 文件中以 # 开头的行为注释
+"""
+
+import fnmatch
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Type
+
+from translation_app.core.config import PathConfig
+
+
+logger = logging.getLogger('FileOrder')
+
+
+def estimate_chunk_count(file_path: Path, char_count: Optional[int], chunk_size: int) -> int:
+    """
+    估算文件切割后的文本块数
+
+    Args:
+        file_path: 文件路径
+        char_count: 预处理统计的文本字符数，None 或小于 0 时按文件大小估算
+        chunk_size: 文本块大小（字符数）
+
+    Returns:
+        预估文本块数（至少为 1）
+    """
+    if char_count is None or char_count < 0:
+        try:
+            char_count = file_path.stat().st_size
+        except OSError:
+            char_count = 0
+    chunk_size = max(1, chunk_size)
+    return max(1, (char_count + chunk_size - 1) // chunk_size)
+
+
+class FileOrderPolicy(ABC):
+    """文件排序策略基类"""
+
+    # 策略名称
+    name: str = ''
+
+    @abstractmethod
+    def order(self, files: Sequence[Path], chunk_counts: Mapping[Path, int]) -> List[Path]:
+        """
+        计算处理顺序
+
+        Args:
+            files: 待处理的文件列表（目录扫描顺序）
+            chunk_counts: 各文件的预估文本块数
+
+        Returns:
+            按处理先后排列的文件列表
+        """
+        pass
+
+
+class NameOrderPolicy(FileOrderPolicy):
+    """保持目录扫描顺序（按扩展名分组、组内按文件名排序）"""
+
+    name = 'name'
+
+    def order(self, files: Sequence[Path], chunk_counts: Mapping[Path, int]) -> List[Path]:
+        return list(files)
+
+
+class ShortestFirstPolicy(FileOrderPolicy):
+    """最短作业优先：按预估文本块数从小到大处理，块数相同时保持扫描顺序"""
+
+    name = 'shortest_first'
+
+    def order(self, files: Sequence[Path], chunk_counts: Mapping[Path, int]) -> List[Path]:
+        return sorted(files, key=lambda file_path: chunk_counts.get(file_path, 1))
+
+
+class LargestFirstPolicy(FileOrderPolicy):
+    """最大作业优先：按预估文本块数从大到小处理，块数相同时保持扫描顺序"""
+
+    name = 'largest_first'
+
+    def order(self, files: Sequence[Path], chunk_counts: Mapping[Path, int]) -> List[Path]:
+        return sorted(files, key=lambda file_path: -chunk_counts.get(file_path, 1))
+
+
+# 已注册的文件排序策略
+FILE_ORDER_POLICIES: Dict[str, Type[FileOrderPolicy]] = {
+    NameOrderPolicy.name: NameOrderPolicy,
+    ShortestFirstPolicy.name: ShortestFirstPolicy,
+    LargestFirstPolicy.name: LargestFirstPolicy,
+}
+
+
+def get_file_order_policy(name: str) -> FileOrderPolicy:
+    """
+    根据名称获取文件排序策略
+
+    Args:
+        name: 策略名称（'name'、'shortest_first' 或 'largest_first'）
+
+    Returns:
+        FileOrderPolicy: 文件排序策略实例
+
+    Raises:
+        ValueError: 不支持的策略
+    """
+    policy_class = FILE_ORDER_POLICIES.get(name)
+    if policy_class is None:
+        raise ValueError(
+            f"不支持的文件排序策略: {name}，"
+            f"请选择: {', '.join(FILE_ORDER_POLICIES)}"
+        )
+    return policy_class()
+
+
+def load_priority_rules(priority_file: Optional[Path] = None) -> List[str]:
+    """
+    读取优先级规则文件
+
+    Args:
+        priority_file: 规则文件路径，默认 PathConfig.PRIORITY_FILE
+
+    Returns:
+        通配符列表（按优先级从高到低），文件不存在时返回空列表
+    """
+    priority_file = Path(priority_file) if priority_file else PathConfig.PRIORITY_FILE
+    try:
+        with open(priority_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f'[排序] 读取优先级规则失败 {priority_file}: {e}')
+        return []
+
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
+
+
+def _priority_rank(file_name: str, rules: Sequence[str]) -> Optional[int]:
+    """返回文件名匹配的第一条规则的序号，不匹配任何规则时返回 None（不区分大小写）"""
+    lowered = file_name.lower()
+    for rank, pattern in enumerate(rules):
+        if fnmatch.fnmatchcase(lowered, pattern.lower()):
+            return rank
+    return None
+
+
+def order_files(
+    files: Sequence[Path],
+    policy: str = 'name',
+    char_counts: Optional[Mapping[Path, Optional[int]]] = None,
+    chunk_size: int = 1,
+    priority_rules: Sequence[str] = ()
+) -> List[Path]:
+    """
+    便捷函数：按优先级规则和排序策略排列待处理文件
+
+    匹配优先级规则的文件按规则顺序排在最前面（匹配同一条规则的文件之间按策略排序），
+    其余文件按策略排序
+
+    Args:
+        files: 待处理的文件列表（目录扫描顺序）
+        policy: 排序策略名称
+        char_counts: 各文件的文本字符数（来自预处理），缺失时按文件大小估算
+        chunk_size: 文本块大小，用于估算文本块数
+        priority_rules: 优先级规则（文件名通配符，按优先级从高到低）
+
+    Returns:
+        按处理先后排列的文件列表
+    """
+    order_policy = get_file_order_policy(policy)
+    char_counts = char_counts or {}
+    chunk_counts = {
+        file_path: estimate_chunk_count(file_path, char_counts.get(file_path), chunk_size)
+        for file_path in files
+    }
+
+    ordered = order_policy.order(files, chunk_counts)
+    if not priority_rules:
+        return ordered
+
+    ranks = {file_path: _priority_rank(file_path.name, priority_rules) for file_path in ordered}
+    prioritized = [file_path for file_path in ordered if ranks[file_path] is not None]
+    if prioritized:
+        logger.info(f'[排序] {len(prioritized)} 个文件匹配优先级规则，优先处理')
+    prioritized.sort(key=lambda file_path: ranks[file_path])
+    return prioritized + [file_path for file_path in ordered if ranks[file_path] is None]
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译结果元数据模块
+
+保存翻译结果时，译文已经在内存中，统计中文字数几乎没有额外开销。
+元数据以 JSON 保存在结果文件所在目录的 .meta/ 子目录中（"<结果文件名>.json"）：
+
+    {"size": ..., "mtime_ns": ..., "chinese_chars": ..., "sha1": ..., "has_carriage_return": ...,
+     "source": ..., "provider": ..., "model": ..., "failed_chunks": ...}
+
+合并扫描时，结果文件的大小和修改时间与元数据一致则直接使用其中的中文字数，
+无需重新读取和解码文件；不一致（文件被修改或替换）时视为无效
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from translation_app.domain.text_stats import count_cjk
+
+
+logger = logging.getLogger('OutputMetadata')
+
+
+# 元数据目录名（位于结果文件所在目录中）
+META_DIR_NAME = '.meta'
+
+
+@dataclass
+class OutputMetadata:
+    """翻译结果文件的元数据"""
+
+    # 结果文件大小（字节）
+    size: int
+
+    # 结果文件修改时间（纳秒）
+    mtime_ns: int
+
+    # 中文字符数
+    chinese_chars: int
+
+    # 结果文件内容的 SHA-1 哈希
+    sha1: str
+
+    # 译文是否包含 \r（不包含时合并可以直接复制字节）
+    has_carriage_return: bool = False
+
+    # 源文件名
+    source: str = ''
+
+    # 服务商 API 地址
+    provider: str = ''
+
+    # 模型名称
+    model: str = ''
+
+    # 翻译失败的文本块数量
+    failed_chunks: int = 0
+
+
+def metadata_path(output_path: Path) -> Path:
+    """
+    结果文件对应的元数据文件路径
+
+    Args:
+        output_path: 翻译结果文件路径
+
+    Returns:
+        元数据文件路径
+    """
+    output_path = Path(output_path)
+    return output_path.parent / META_DIR_NAME / f'{output_path.name}.json'
+
+
+def write_result(
+    output_path: Path,
+    text: str,
+    source: str = '',
+    provider: str = '',
+    model: str = '',
+    failed_chunks: int = 0
+) -> OutputMetadata:
+    """
+    以 UTF-8 原子写入翻译结果，并在同一次处理中生成元数据
+
+    结果文件先写临时文件再原子替换；元数据写入失败只记录日志，不影响结果文件
+
+    Args:
+        output_path: 翻译结果文件路径
+        text: 译文
+        source: 源文件名
+        provider: 服务商 API 地址
+        model: 模型名称
+        failed_chunks: 翻译失败的文本块数量
+
+    Returns:
+        OutputMetadata: 结果文件的元数据
+
+    Raises:
+        OSError: 结果文件写入失败
+    """
+    output_path = Path(output_path)
+    data = text.encode('utf-8')
+
+    temp_path = output_path.with_name(f'{output_path.name}.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    stat = output_path.stat()
+    metadata = OutputMetadata(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        chinese_chars=count_cjk(text),
+        sha1=hashlib.sha1(data).hexdigest(),
+        has_carriage_return='\r' in text,
+        source=source,
+        provider=provider,
+        model=model,
+        failed_chunks=failed_chunks,
+    )
+
+    meta_path = metadata_path(output_path)
+    temp_meta_path = meta_path.with_name(f'{meta_path.name}.tmp')
+    try:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_meta_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(metadata), f, ensure_ascii=False)
+        os.replace(temp_meta_path, meta_path)
+    except OSError as e:
+        logger.warning(f'[元数据] 写入失败 {output_path.name}: {e}')
+    return metadata
+
+
+def load_metadata(output_path: Path) -> Optional[OutputMetadata]:
+    """
+    读取结果文件的元数据（文件大小和修改时间与记录一致时才有效）
+
+    Args:
+        output_path: 翻译结果文件路径
+
+    Returns:
+        OutputMetadata: 有效的元数据，不存在、损坏或已过期时返回 None
+    """
+    output_path = Path(output_path)
+    try:
+        with open(metadata_path(output_path), 'r', encoding='utf-8') as f:
+            metadata = OutputMetadata(**json.load(f))
+        stat = output_path.stat()
+    except (OSError, ValueError, TypeError):
+        return None
+
+    if stat.st_size != metadata.size or stat.st_mtime_ns != metadata.mtime_ns:
+        return None
+    return metadata
+
+
+def remove_metadata(output_path: Path):
+    """
+    删除结果文件的元数据（结果文件被合并删除后调用）
+
+    Args:
+        output_path: 翻译结果文件路径
+    """
+    try:
+        metadata_path(output_path).unlink()
+    except OSError:
+        pass
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本块提交策略模块
+
+决定文本块提交到线程池的顺序，不影响翻译结果的拼接顺序：
+- document: 按原文顺序提交（支持边切割边提交）
+- longest_first: 最长处理时间优先（LPT），先提交预估成本最高的文本块，缩短整体完成时间
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Type
+
+from translation_app.domain.text_stats import count_cjk
+
+# 非 CJK 文本平均每个 token 对应的字符数（经验值）
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本的 token 数
+
+    汉字按每字 1 个 token 计算，其余字符按 CHARS_PER_TOKEN 个字符 1 个 token 计算
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        预估 token 数
+    """
+    cjk_count = count_cjk(text)
+    return cjk_count + (len(text) - cjk_count + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class SubmissionPolicy(ABC):
+    """提交策略基类"""
+
+    # 策略名称
+    name: str = ''
+
+    # 是否需要在提交前拿到全部文本块（为 True 时无法边切割边提交）
+    requires_all_chunks: bool = True
+
+    @abstractmethod
+    def order(self, chunks: Sequence[str]) -> List[int]:
+        """
+        计算提交顺序
+
+        Args:
+            chunks: 全部文本块
+
+        Returns:
+            文本块索引列表，按提交先后排列
+        """
+        pass
+
+
+class DocumentOrderPolicy(SubmissionPolicy):
+    """按原文顺序提交"""
+
+    name = 'document'
+    requires_all_chunks = False
+
+    def order(self, chunks: Sequence[str]) -> List[int]:
+        return list(range(len(chunks)))
+
+
+class LongestFirstPolicy(SubmissionPolicy):
+    """最长处理时间优先：按预估 token 数从大到小提交，成本相同时保持原文顺序"""
+
+    name = 'longest_first'
+
+    def order(self, chunks: Sequence[str]) -> List[int]:
+        costs = [estimate_tokens(chunk) for chunk in chunks]
+        return sorted(range(len(chunks)), key=lambda index: -costs[index])
+
+
+# 已注册的提交策略
+SUBMISSION_POLICIES: Dict[str, Type[SubmissionPolicy]] = {
+    DocumentOrderPolicy.name: DocumentOrderPolicy,
+    LongestFirstPolicy.name: LongestFirstPolicy,
+}
+
+
+def get_submission_policy(name: str) -> SubmissionPolicy:
+    """
+    根据名称获取提交策略
+
+    Args:
+        name: 策略名称（'document' 或 'longest_first'）
+
+    Returns:
+        SubmissionPolicy: 提交策略实例
+
+    Raises:
+        ValueError: 不支持的策略
+    """
+    policy_class = SUBMISSION_POLICIES.get(name)
+    if policy_class is None:
+        raise ValueError(
+            f"不支持的提交策略: {name}，"
+            f"请选择: {', '.join(SUBMISSION_POLICIES)}"
+        )
+    return policy_class()
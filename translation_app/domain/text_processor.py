@@ -7,7 +7,10 @@
 """
 
 import logging
-from typing import List
+import re
+import statistics
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from translation_app.core.config import SENTENCE_END_PUNCTUATION, SECONDARY_PUNCTUATION
 
@@ -15,6 +18,126 @@ from translation_app.core.config import SENTENCE_END_PUNCTUATION, SECONDARY_PUNC
 logger = logging.getLogger('TextProcessor')
 
 
+# 边界字符匹配：一次扫描同时识别句子结束标点、次要标点和空白字符
+# （\s 与 str.isspace() 判定的字符集合完全一致）
+_BOUNDARY_PATTERN = re.compile(
+    '(?P<primary>[{}])|(?P<secondary>[{}])|(?P<space>\\s)'.format(
+        re.escape(''.join(SENTENCE_END_PUNCTUATION)),
+        re.escape(''.join(c for c in SECONDARY_PUNCTUATION if not c.isspace())),
+    )
+)
+
+# 同时属于次要标点的空白字符（如半角空格）
+_SECONDARY_SPACES = frozenset(c for c in SECONDARY_PUNCTUATION if c.isspace())
+
+# 非空白字符
+_NON_SPACE_PATTERN = re.compile(r'\S')
+
+
+class BoundaryIndex:
+    """
+    文本边界索引
+
+    一次扫描文本，记录所有候选切割点（边界字符之后的位置），按类别分别保存为有序列表：
+    - primary: 句子结束标点
+    - secondary: 次要标点
+    - space: 空白字符
+
+    查找切割点时通过二分查找定位，不再逐字符回溯
+    """
+
+    def __init__(self, text: str):
+        """
+        建立边界索引
+
+        Args:
+            text: 需要建立索引的文本
+        """
+        self.primary: List[int] = []
+        self.secondary: List[int] = []
+        self.space: List[int] = []
+
+        primary_append = self.primary.append
+        secondary_append = self.secondary.append
+        space_append = self.space.append
+
+        for match in _BOUNDARY_PATTERN.finditer(text):
+            kind = match.lastgroup
+            position = match.end()
+            if kind == 'primary':
+                primary_append(position)
+            elif kind == 'secondary':
+                secondary_append(position)
+            else:
+                if match.group() in _SECONDARY_SPACES:
+                    secondary_append(position)
+                space_append(position)
+
+    @staticmethod
+    def _last_in_range(positions: List[int], low: int, high: int) -> int:
+        """在有序列表中查找 [low, high] 范围内的最大值，未找到返回 -1"""
+        index = bisect_right(positions, high) - 1
+        if index >= 0 and positions[index] >= low:
+            return positions[index]
+        return -1
+
+    def find_last(self, low: int, high: int) -> int:
+        """
+        查找 [low, high] 范围内最靠后的切割点
+
+        按句子结束标点 → 次要标点 → 空白字符的优先级查找
+
+        Args:
+            low: 切割点下限（包含）
+            high: 切割点上限（包含）
+
+        Returns:
+            切割点位置，-1 表示未找到
+        """
+        if low > high:
+            return -1
+        for positions in (self.primary, self.secondary, self.space):
+            split_point = self._last_in_range(positions, low, high)
+            if split_point != -1:
+                return split_point
+        return -1
+
+    @staticmethod
+    def _nearest_in_range(positions: List[int], target: int, low: int, high: int) -> int:
+        """在有序列表中查找 [low, high] 范围内最接近 target 的值，未找到返回 -1"""
+        index = bisect_left(positions, target)
+        candidates = [
+            positions[i] for i in (index - 1, index)
+            if 0 <= i < len(positions) and low <= positions[i] <= high
+        ]
+        if not candidates:
+            return -1
+        return min(candidates, key=lambda position: abs(position - target))
+
+    def find_nearest(self, target: int, low: int, high: int) -> int:
+        """
+        查找 [low, high] 范围内最接近 target 的切割点
+
+        按句子结束标点 → 次要标点 → 空白字符的优先级查找
+
+        Args:
+            target: 理想切割位置
+            low: 切割点下限（包含）
+            high: 切割点上限（包含）
+
+        Returns:
+            切割点位置，-1 表示未找到
+        """
+        if low > high:
+            return -1
+        target = min(max(target, low), high)
+        for positions in (self.primary, self.secondary, self.space):
+            split_point = self._nearest_in_range(positions, target, low, high)
+            if split_point != -1:
+                return split_point
+        return -1
+
+
 class TextProcessor:
     """
     文本处理器：智能切割文本，保持句子完整性
@@ -23,19 +146,37 @@ class TextProcessor:
     - 将提取器返回的内容列表切割成合适大小的文本块
     - 优先在句子边界处切割，保持语义完整性
     - 处理超长文本的递归切割
+    - 可选的均衡切割模式，使各文本块大小尽量接近 chunk_size
     """
 
-    def __init__(self, chunk_size: int = 8000, min_chunk_size: int = 500):
+    def __init__(
+        self,
+        chunk_size: int = 8000,
+        min_chunk_size: int = 500,
+        balanced: bool = False,
+        balance_tolerance: float = 0.2
+    ):
         """
         初始化文本处理器
 
         Args:
             chunk_size: 文本切割阈值（字符数），默认 8000
             min_chunk_size: 最小切割长度（字符数），默认 500
+            balanced: 是否启用均衡切割模式，默认 False（贪心切割）
+            balance_tolerance: 均衡模式下允许的块大小偏差比例，块大小目标范围为
+                [chunk_size * (1 - balance_tolerance), chunk_size]，默认 0.2
         """
+        if not 0 <= balance_tolerance < 1:
+            raise ValueError(f"balance_tolerance 必须在 [0, 1) 范围内: {balance_tolerance}")
+
         self.chunk_size = chunk_size
         self.min_chunk_size = min_chunk_size
-        logger.debug(f'[初始化] chunk_size={chunk_size}, min_chunk_size={min_chunk_size}')
+        self.balanced = balanced
+        self.balance_tolerance = balance_tolerance
+        logger.debug(
+            f'[初始化] chunk_size={chunk_size}, min_chunk_size={min_chunk_size}, '
+            f'balanced={balanced}, balance_tolerance={balance_tolerance}'
+        )
 
     def process_extracted_content(self, content_list: List[str]) -> List[str]:
         """
@@ -51,42 +192,225 @@ class TextProcessor:
             logger.warning('[处理] 输入内容为空')
             return []
 
-        chunks = []
-        current_chunk = ""
+        chunks = list(self.iter_chunks(content_list))
 
-        for content in content_list:
+        logger.info(f'[处理] 完成，共切割成 {len(chunks)} 个chunk')
+        return chunks
+
+    def iter_chunks(self, contents: Iterable[str]) -> Iterator[str]:
+        """
+        流式切割：逐个消费页面/章节，每凑满一个块立即产出
+
+        与 process_extracted_content 的切割结果完全一致，但不要求输入一次性载入内存，
+        调用方可以在后续内容仍在提取时就开始处理已产出的块
+
+        Args:
+            contents: 内容迭代器（每个元素是一页或一个章节），可以是生成器
+
+        Yields:
+            切割后的文本块
+        """
+        if self.balanced:
+            chunk_iter = self._iter_balanced_chunks(contents)
+        else:
+            chunk_iter = self._iter_greedy_chunks(contents)
+
+        sizes = []
+        for chunk in chunk_iter:
+            sizes.append(len(chunk))
+            yield chunk
+
+        self._log_size_distribution(sizes)
+
+    def _log_size_distribution(self, sizes: List[int]):
+        """在 debug 级别输出文本块大小分布"""
+        if not sizes or not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            f'[处理] chunk大小分布 | 数量: {len(sizes)} | 最小: {min(sizes)} | 最大: {max(sizes)} | '
+            f'平均: {statistics.fmean(sizes):.0f} | 中位数: {statistics.median(sizes):.0f} | '
+            f'标准差: {statistics.pstdev(sizes):.0f} | 模式: {"均衡" if self.balanced else "贪心"}'
+        )
+
+    def _iter_greedy_chunks(self, contents: Iterable[str]) -> Iterator[str]:
+        """
+        贪心切割：依次合并页面，放不下时另起一块，超长页面单独切割
+
+        Args:
+            contents: 内容迭代器
+
+        Yields:
+            切割后的文本块
+        """
+        # 当前块由多个片段组成，切割时再统一拼接，避免反复拼接字符串
+        current_parts: List[str] = []
+        current_length = 0
+
+        for content in contents:
             # 跳过空内容
             if not content or not content.strip():
                 continue
 
             # 如果当前内容本身就超过 chunk_size，需要单独切割
             if len(content) > self.chunk_size:
-                # 先保存当前积累的内容
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
+                # 先产出当前积累的内容
+                chunk = self._join_parts(current_parts)
+                if chunk:
+                    yield chunk
+                current_parts = []
+                current_length = 0
 
                 # 切割超长内容
-                large_chunks = self._split_large_text(content)
-                chunks.extend(large_chunks)
+                yield from self._iter_split_large_text(content)
                 continue
 
             # 检查是否可以合并到当前块
-            if len(current_chunk) + len(content) <= self.chunk_size:
+            if current_length + len(content) <= self.chunk_size:
                 # 可以合并
-                current_chunk += content + "\n"
+                current_parts.append(content)
+                current_length += len(content) + 1
             else:
-                # 不能合并，需要切割当前块
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                current_chunk = content + "\n"
+                # 不能合并，先产出当前块
+                chunk = self._join_parts(current_parts)
+                if chunk:
+                    yield chunk
+                current_parts = [content]
+                current_length = len(content) + 1
+
+        # 产出最后一个块
+        chunk = self._join_parts(current_parts)
+        if chunk:
+            yield chunk
+
+    def _iter_balanced_chunks(self, contents: Iterable[str]) -> Iterator[str]:
+        """
+        均衡切割：使文本块大小尽量落在 [chunk_size * (1 - balance_tolerance), chunk_size] 范围内
 
-        # 添加最后一个块
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        策略：
+        1. 页面放不下时，若当前块已达到下限，则在页面边界处切割
+        2. 否则将页面并入当前块，再在句子边界处从前端切出接近 chunk_size 的块，
+           剩余部分继续与后续页面合并（超长页面同样处理）
+        3. 保留最后一个已完成的块，输入结束时若末尾剩余过小，与其合并后在中点附近重新切割
 
-        logger.info(f'[处理] 完成，共切割成 {len(chunks)} 个chunk')
-        return chunks
+        Args:
+            contents: 内容迭代器
+
+        Yields:
+            切割后的文本块
+        """
+        lower = int(self.chunk_size * (1 - self.balance_tolerance))
+        parts: List[str] = []
+        length = 0
+        # 最近一个已完成、尚未产出的块（用于末尾的均衡调整）
+        pending: Optional[str] = None
+
+        for content in contents:
+            # 跳过空内容
+            if not content or not content.strip():
+                continue
+
+            # 放不下且当前块已达到下限：在页面边界处切割
+            if parts and length + 1 + len(content) > self.chunk_size and length >= lower:
+                chunk = self._join_parts(parts)
+                if chunk:
+                    if pending:
+                        yield pending
+                    pending = chunk
+                parts = []
+                length = 0
+
+            length += len(content) + (1 if parts else 0)
+            parts.append(content)
+            if length <= self.chunk_size:
+                continue
+
+            # 当前块超长：从前端切出接近 chunk_size 的块，剩余部分继续积累
+            text = "\n".join(parts)
+            pieces, rest = self._cut_front(text, lower)
+            for piece in pieces:
+                if pending:
+                    yield pending
+                pending = piece
+            parts = [rest] if rest else []
+            length = len(rest)
+
+        # 末尾剩余过小时与上一个块重新均衡
+        tail = self._join_parts(parts)
+        if pending and tail and len(tail) < lower:
+            final_chunks = self._rebalance_pair(pending, tail)
+        else:
+            final_chunks = [pending, tail]
+
+        for chunk in final_chunks:
+            if chunk:
+                yield chunk
+
+    def _cut_front(self, text: str, lower: int) -> Tuple[List[str], str]:
+        """
+        从文本前端依次切出大小在 [lower, chunk_size] 范围内的块，直到剩余文本不超过 chunk_size
+
+        范围内找不到边界时退回贪心切割点，仍找不到则强制切割
+
+        Args:
+            text: 需要切割的文本
+            lower: 块大小下限
+
+        Returns:
+            (切出的文本块列表, 剩余文本)
+        """
+        pieces = []
+        index = BoundaryIndex(text)
+        start = 0
+        end = len(text)
+
+        while end - start > self.chunk_size:
+            split_point = index.find_last(start + lower, start + self.chunk_size)
+            if split_point == -1:
+                split_point = self._find_split_point_in_index(index, start, self.chunk_size)
+            if split_point == -1:
+                logger.warning(f'[切割] 未找到合适的切割点，强制切割 (长度={end - start})')
+                split_point = start + self.chunk_size
+
+            piece = text[start:split_point].strip()
+            if piece:
+                pieces.append(piece)
+            start = self._skip_whitespace(text, split_point)
+
+        return pieces, text[start:end].strip()
+
+    def _rebalance_pair(self, first: str, second: str) -> List[str]:
+        """
+        将相邻的两个块合并后在中点附近重新切割，使两块大小接近
+
+        Args:
+            first: 前一个块
+            second: 后一个块（过小的末尾块）
+
+        Returns:
+            重新切割后的块列表；找不到合适的边界时保持原样
+        """
+        text = first + "\n" + second
+        if len(text) <= self.chunk_size:
+            return [text]
+
+        middle = len(text) // 2
+        tolerance = int(middle * self.balance_tolerance)
+        # 两块都不能超过 chunk_size
+        low = max(len(text) - self.chunk_size, middle - tolerance)
+        high = min(self.chunk_size, middle + tolerance)
+
+        split_point = BoundaryIndex(text).find_nearest(middle, low, high)
+        if split_point == -1:
+            return [first, second]
+
+        return [text[:split_point].strip(), text[split_point:].strip()]
+
+    @staticmethod
+    def _join_parts(parts: List[str]) -> str:
+        """将积累的片段拼接成一个块（片段之间以换行分隔）"""
+        if not parts:
+            return ""
+        return "\n".join(parts).strip()
 
     def _split_large_text(self, text: str) -> List[str]:
         """
@@ -98,40 +422,84 @@ class TextProcessor:
         Returns:
             切割后的文本块列表
         """
-        chunks = []
-        remaining_text = text
+        chunks = list(self._iter_split_large_text(text))
+        logger.debug(f'[切割] 大文本切割完成，共 {len(chunks)} 个chunk')
+        return chunks
+
+    def _iter_split_large_text(self, text: str) -> Iterator[str]:
+        """
+        流式切割超长文本，每找到一个切割点立即产出
+
+        先为整段文本建立边界索引，之后通过偏移量在原文本上切片，
+        不再反复复制剩余文本
 
-        while len(remaining_text) > self.chunk_size:
+        Args:
+            text: 需要切割的超长文本
+
+        Yields:
+            切割后的文本块
+        """
+        index = BoundaryIndex(text)
+
+        # 剩余文本为 text[start:end]，首次切割后去除整段文本末尾的空白
+        start = 0
+        end = len(text)
+        stripped_end = len(text.rstrip())
+
+        while end - start > self.chunk_size:
             # 在 chunk_size 附近寻找切割点
-            split_point = self._find_split_point(remaining_text, self.chunk_size)
+            split_point = self._find_split_point_in_index(index, start, self.chunk_size)
 
             if split_point == -1:
                 # 找不到合适的切割点，强制在 chunk_size 处切割
-                logger.warning(f'[切割] 未找到合适的切割点，强制切割 (长度={len(remaining_text)})')
-                split_point = self.chunk_size
+                logger.warning(f'[切割] 未找到合适的切割点，强制切割 (长度={end - start})')
+                split_point = start + self.chunk_size
 
             # 切割文本
-            chunk = remaining_text[:split_point].strip()
+            chunk = text[start:split_point].strip()
             if chunk:
-                chunks.append(chunk)
+                yield chunk
 
-            remaining_text = remaining_text[split_point:].strip()
+            # 跳过切割点之后的空白字符
+            end = stripped_end
+            start = min(self._skip_whitespace(text, split_point), end)
 
-        # 添加剩余文本
-        if remaining_text.strip():
-            chunks.append(remaining_text.strip())
+        # 产出剩余文本
+        remaining_text = text[start:end].strip()
+        if remaining_text:
+            yield remaining_text
 
-        logger.debug(f'[切割] 大文本切割完成，共 {len(chunks)} 个chunk')
-        return chunks
+    @staticmethod
+    def _skip_whitespace(text: str, position: int) -> int:
+        """返回 position 之后第一个非空白字符的位置"""
+        match = _NON_SPACE_PATTERN.search(text, position)
+        return match.start() if match else len(text)
 
-    def _find_split_point(self, text: str, target_length: int) -> int:
+    def _find_split_point_in_index(self, index: BoundaryIndex, start: int, target_length: int) -> int:
         """
-        在文本中寻找最佳切割点
+        在边界索引中寻找最佳切割点
 
         策略：
-        1. 从 target_length 位置向前搜索，优先在句子结束标点处切割
+        1. 优先在句子结束标点处切割
         2. 如果找不到句子结束标点，尝试在次要标点处切割
-        3. 搜索范围为 [min_chunk_size, target_length]
+        3. 最后尝试在空白字符处切割
+        搜索范围为 [min_chunk_size, target_length]（相对 start 的偏移，且不超过 1000 字符）
+
+        Args:
+            index: 文本的边界索引
+            start: 剩余文本在原文本中的起始位置
+            target_length: 目标长度
+
+        Returns:
+            切割位置（原文本中的绝对位置），-1 表示未找到合适的切割点
+        """
+        search_start = max(self.min_chunk_size, target_length - 1000)
+        # 切割点位于边界字符之后，因此范围为 [search_start + 1, target_length]
+        return index.find_last(start + search_start + 1, start + target_length)
+
+    def _find_split_point(self, text: str, target_length: int) -> int:
+        """
+        在文本中寻找最佳切割点
 
         Args:
             text: 文本内容
@@ -143,27 +511,5 @@ class TextProcessor:
         if len(text) <= target_length:
             return len(text)
 
-        # 搜索范围：从 target_length 向前到 min_chunk_size
-        search_start = max(self.min_chunk_size, target_length - 1000)
-        search_end = min(target_length, len(text))
-
-        # 策略 1: 寻找句子结束标点
-        for i in range(search_end - 1, search_start - 1, -1):
-            if text[i] in SENTENCE_END_PUNCTUATION:
-                # 找到句子结束标点，在其后切割
-                return i + 1
-
-        # 策略 2: 寻找次要标点
-        for i in range(search_end - 1, search_start - 1, -1):
-            if text[i] in SECONDARY_PUNCTUATION:
-                # 找到次要标点，在其后切割
-                return i + 1
-
-        # 策略 3: 寻找空白字符
-        for i in range(search_end - 1, search_start - 1, -1):
-            if text[i].isspace():
-                return i + 1
-
-        # 未找到合适的切割点
-        return -1
+        return self._find_split_point_in_index(BoundaryIndex(text), 0, target_length)
 
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本统计模块
+
+一次性统计文本的汉字数、非空白字符数、可打印字符数和字母数字字符数。
+所有统计都由正则替换和字符串内置方法在 C 层完成，不逐字符执行 Python 代码：
+- 汉字：Unicode 范围 \\u4e00 - \\u9fff
+- 非空白字符：not str.isspace()（str.split() 的分隔规则与 isspace 一致）
+- 可打印字符：str.isprintable() 且非空白
+- 字母数字：str.isalnum()（正则 [^\\W_] 与 isalnum 一致）
+"""
+
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Pattern
+
+
+# 汉字 / 非汉字字符
+_CJK_PATTERN = re.compile('[\u4e00-\u9fff]+')
+_NON_CJK_PATTERN = re.compile('[^\u4e00-\u9fff]+')
+
+# 非字母数字字符
+_NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+
+# 汉字范围内的字符是否全部为字母数字（Unicode 14 起成立），成立时只需对非汉字部分做 Unicode 类别匹配
+_CJK_ALL_ALNUM = all(chr(codepoint).isalnum() for codepoint in range(0x4e00, 0xa000))
+
+
+@dataclass(frozen=True)
+class TextStats:
+    """文本统计结果"""
+
+    # 总字符数
+    length: int
+
+    # 汉字数
+    chinese: int
+
+    # 非空白字符数
+    non_space: int
+
+    # 可打印且非空白的字符数
+    printable: int
+
+    # 字母数字字符数
+    alnum: int
+
+    @property
+    def chinese_ratio(self) -> float:
+        """汉字占非空白字符的比例，没有非空白字符时为 0"""
+        if self.non_space == 0:
+            return 0.0
+        return self.chinese / self.non_space
+
+
+@lru_cache(maxsize=1)
+def _non_printable_pattern() -> Pattern:
+    """
+    不可打印且非空白的字符（控制字符、格式字符、未分配码位等）
+
+    由当前 Python 的 Unicode 数据生成，只在遇到此类字符时构建一次
+    """
+    ranges = []
+    start = None
+    for codepoint in range(sys.maxunicode + 1):
+        char = chr(codepoint)
+        matched = not char.isprintable() and not char.isspace()
+        if matched and start is None:
+            start = codepoint
+        elif not matched and start is not None:
+            ranges.append((start, codepoint - 1))
+            start = None
+    if start is not None:
+        ranges.append((start, sys.maxunicode))
+
+    char_class = ''.join(
+        f'\\U{low:08x}' if low == high else f'\\U{low:08x}-\\U{high:08x}'
+        for low, high in ranges
+    )
+    return re.compile(f'[{char_class}]+')
+
+
+def count_cjk(text: str) -> int:
+    """
+    统计文本中的汉字数量
+
+    Args:
+        text: 输入文本
+
+    Returns:
+        汉字数（仅统计 \\u4e00 - \\u9fff 范围内的字符）
+    """
+    return len(_NON_CJK_PATTERN.sub('', text))
+
+
+def compute_text_stats(text: str) -> TextStats:
+    """
+    统计文本的各类字符数
+
+    Args:
+        text: 输入文本
+
+    Returns:
+        TextStats: 统计结果
+    """
+    non_space_text = ''.join(text.split())
+
+    # 去掉汉字后的部分，长度差就是汉字数
+    other_text = _CJK_PATTERN.sub('', non_space_text)
+    chinese = len(non_space_text) - len(other_text)
+
+    if non_space_text.isprintable():
+        printable = len(non_space_text)
+    else:
+        printable = len(_non_printable_pattern().sub('', non_space_text))
+
+    if _CJK_ALL_ALNUM:
+        alnum = chinese + len(_NON_ALNUM_PATTERN.sub('', other_text))
+    else:
+        alnum = len(_NON_ALNUM_PATTERN.sub('', non_space_text))
+
+    return TextStats(
+        length=len(text),
+        chinese=chinese,
+        non_space=len(non_space_text),
+        printable=printable,
+        alnum=alnum,
+    )
@@ -7,17 +7,26 @@
 - 多线程并行翻译
 - 自动重试机制
 - 进度跟踪
+
+TranslationEngine 只处理内存中的文本（translate_text、translate_pages 及其异步、流式版本），
+Translator 在其基础上负责源文件的提取和翻译结果的保存
 """
 
+import asyncio
+import itertools
 import logging
+import threading
 import time
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from openai import APITimeoutError, APIError
-
-from translation_app.domain.extractors import get_extractor
+from collections import deque
+from collections.abc import Sized
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Iterable, Iterator, List, Sequence, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from translation_app.domain.extraction_cache import iter_file_pages
+from translation_app.domain.output_metadata import write_result
 from translation_app.domain.text_processor import TextProcessor
+from translation_app.domain.submission_policy import get_submission_policy
 from translation_app.core.config import LogConfig, PathConfig
 from translation_app.core.translate_config import TranslateConfig
 from translation_app.core.path_utils import normalize_file_path, get_translated_path
@@ -26,34 +35,57 @@ from translation_app.core.path_utils import normalize_file_path, get_translated_
 logger = logging.getLogger('Translator')
 
 
-class Translator:
-    """翻译器类"""
+@dataclass(frozen=True)
+class TranslationProgress:
+    """翻译进度快照"""
 
-    def __init__(self, source_file: str, config: TranslateConfig, work_dir: Optional[str] = None):
+    # 已完成（包括最终失败）的文本块数
+    completed: int
+
+    # 已提交的文本块数（total_known 为 False 时仍在切割，会继续增长）
+    total: int
+
+    # 文本块总数是否已确定
+    total_known: bool
+
+    # 最终失败的文本块数
+    failed: int
+
+    # 已用时间（秒）
+    elapsed: float
+
+    # 预计剩余时间（秒），总数未确定或尚无完成的文本块时为 None
+    eta: Optional[float]
+
+
+class TranslationEngine:
+    """
+    翻译引擎：切割文本、多线程调用 API 翻译（含重试）、跟踪进度，不读写文件
+
+    同一个引擎同一时间只能进行一次翻译；需要并行翻译多段文本时为每段创建引擎，
+    通过 TranslateConfig.client_factory 共享客户端
+    """
+
+    def __init__(self, config: TranslateConfig):
         """
-        初始化翻译器
+        初始化翻译引擎
 
         Args:
-            source_file: 需要翻译的文件名（支持相对路径，会自动处理 files/ 前缀）
             config: 翻译配置（TranslateConfig 实例）
-            work_dir: 可选的工作目录覆盖（默认使用 PathConfig.WORK_DIR）
         """
         if config is None:
             raise ValueError("config 参数是必需的，必须传入 TranslateConfig 实例")
 
         self.config = config
         self.client = self._init_api_client()
-
-        # 文件路径处理
-        PathConfig.ensure_dirs()
-        work_root = work_dir or str(PathConfig.WORK_DIR)
-        self.file_path = normalize_file_path(source_file, work_root)
-        self.output_txt = get_translated_path(self.file_path)
+        self.submission_policy = get_submission_policy(config.submission_policy)
 
         # 文本处理器
         self.text_processor = TextProcessor(
             chunk_size=config.chunk_size,
-            min_chunk_size=config.min_chunk_size
+            min_chunk_size=config.min_chunk_size,
+            balanced=config.chunking.balanced,
+            balance_tolerance=config.chunking.balance_tolerance
         )
 
         # 翻译结果
@@ -62,6 +94,48 @@ class Translator:
         self.translate_start_time = 0
         self._last_progress_percent = 0
 
+        # 流式翻译状态：文本块边切割边提交，切割结束前总数未知
+        self._progress_lock = threading.Lock()
+        self._chunks_complete = False
+        self._completed_count = 0
+        self._failed_chunks: List[int] = []
+
+        # 工作线程累计忙碌时间（用于计算线程利用率）
+        self._busy_time = 0.0
+        self._last_finish_time = 0.0
+
+        # 取消请求：停止提交新的文本块，未开始的文本块和重试等待立即结束
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """请求取消翻译（可在其他线程中调用），进行中的翻译尽快结束，取消后不应再复用"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self._cancel_event.is_set()
+
+    def progress(self) -> TranslationProgress:
+        """
+        获取当前翻译进度（可在其他线程中调用）
+
+        Returns:
+            TranslationProgress: 进度快照
+        """
+        with self._progress_lock:
+            completed = self._completed_count
+            total = self.total_chunks
+            total_known = self._chunks_complete
+            failed = len(self._failed_chunks)
+            started = self.translate_start_time
+
+        elapsed = time.time() - started if started else 0.0
+        eta = None
+        if total_known and completed:
+            eta = elapsed / completed * (total - completed)
+        return TranslationProgress(completed, total, total_known, failed, elapsed, eta)
+
     def _init_api_client(self):
         """初始化 API 客户端"""
         if self.config.client_factory:
@@ -75,32 +149,85 @@ class Translator:
             base_url=self.config.api_base_url
         )
 
-    def extract_text(self) -> Optional[List[str]]:
+    def translate_text(self, text: str) -> str:
         """
-        提取文本内容
+        翻译内存中的文本（不读写文件）
+
+        Args:
+            text: 原文
 
         Returns:
-            切割后的文本块列表，失败返回 None
+            译文（按原文顺序拼接，失败的文本块保留带标记的原文），原文为空时返回空字符串
         """
-        try:
-            # 获取对应的提取器
-            extractor = get_extractor(str(self.file_path))
+        return self.translate_pages([text])
 
-            # 提取原始内容
-            content_list = extractor.extract_text()
+    def translate_pages(self, pages: Iterable[str]) -> str:
+        """
+        翻译内存中的多段文本（不读写文件）
 
-            if not content_list:
-                logger.error(f'[提取] 未能提取到任何内容: {self.file_path}')
-                return None
+        Args:
+            pages: 文本片段（如每一页或每一章），可以是生成器，按 TextProcessor 规则合并切割
 
-            # 使用文本处理器切割内容
-            chunks = self.text_processor.process_extracted_content(content_list)
+        Returns:
+            译文（按原文顺序拼接，失败的文本块保留带标记的原文）
+        """
+        return self.translate_chunks(self.text_processor.iter_chunks(pages))
 
-            return chunks
+    def iter_translate_pages(self, pages: Iterable[str], window: Optional[int] = None) -> Iterator[str]:
+        """
+        流式翻译内存中的多段文本（不读写文件），边切割边翻译，按原文顺序产出译文文本块
 
-        except Exception as e:
-            logger.error(f'[提取] 提取文本失败: {e}')
-            return None
+        Args:
+            pages: 文本片段，可以是生成器
+            window: 在途文本块上限，默认为线程数的 2 倍
+
+        Yields:
+            按原文顺序的译文文本块
+        """
+        return self.iter_translate_chunks(self.text_processor.iter_chunks(pages), window)
+
+    async def translate_text_async(self, text: str) -> str:
+        """translate_text 的异步版本：在线程中翻译，不阻塞事件循环"""
+        return await self._run_in_thread(self.translate_text, text)
+
+    async def translate_pages_async(self, pages: Iterable[str]) -> str:
+        """translate_pages 的异步版本：在线程中翻译，不阻塞事件循环"""
+        return await self._run_in_thread(self.translate_pages, pages)
+
+    async def aiter_translate_pages(self, pages: Iterable[str], window: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        iter_translate_pages 的异步版本：每个译文文本块在线程中等待，不阻塞事件循环
+
+        提前停止迭代或协程被取消时同时取消翻译
+
+        Yields:
+            按原文顺序的译文文本块
+        """
+        iterator = self.iter_translate_pages(pages, window)
+        finished = False
+        try:
+            while True:
+                text = await asyncio.to_thread(next, iterator, None)
+                if text is None:
+                    finished = True
+                    return
+                yield text
+        finally:
+            if not finished:
+                self.cancel()
+                try:
+                    iterator.close()
+                except ValueError:
+                    # 线程中仍在等待下一个文本块，取消后会很快结束，由垃圾回收关闭
+                    pass
+
+    async def _run_in_thread(self, func: Callable[..., str], *args) -> str:
+        """在线程中运行同步翻译；等待的协程被取消时同时取消翻译"""
+        try:
+            return await asyncio.to_thread(func, *args)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
 
     def translate(self, text_origin: str) -> Optional[str]:
         """
@@ -112,6 +239,9 @@ class Translator:
         Returns:
             翻译结果，失败返回 None
         """
+        # 延迟导入：openai 导入较慢，只在实际调用 API 时加载
+        from openai import APITimeoutError, APIError
+
         try:
             # 仅在启用时打印内容预览（隐私保护）
             if LogConfig.LOG_SHOW_CONTENT:
@@ -161,14 +291,18 @@ class Translator:
             (chunk索引, 翻译结果, 是否成功)
         """
         chunk_index, chunk_content = chunk_data
-        total = self.total_chunks
+        total = self.total_chunks if self._chunks_complete else '?'
         chunk_tag = f'[翻译][Chunk {chunk_index + 1}/{total}]'
 
         for attempt in range(self.config.max_retries + 1):
+            if self.cancelled:
+                return chunk_index, None, False
             try:
                 if attempt > 0:
                     logger.warning(f'{chunk_tag} 重试 (第 {attempt + 1} 次)')
-                    time.sleep(self.config.retry_delay)
+                    # 等待期间收到取消请求时立即结束
+                    if self._cancel_event.wait(self.config.retry_delay):
+                        return chunk_index, None, False
                 else:
                     logger.debug(f'{chunk_tag} 开始 ({len(chunk_content)} 字符)')
 
@@ -190,113 +324,368 @@ class Translator:
         failed_content = f"\n[翻译失败 - Chunk {chunk_index + 1}]\n{chunk_content}\n[/翻译失败]\n"
         return chunk_index, failed_content, False
 
-    def translate_chunks(self, chunks: List[str]) -> str:
+    def translate_chunks(self, chunks: Iterable[str]) -> str:
         """
         多线程翻译所有文本块
 
+        文本块可以是列表，也可以是边提取边切割的迭代器：按原文顺序提交时，每取到一个文本块就立即
+        提交到线程池，无需等待全部切割完成；其他提交策略需要先取得全部文本块再排序提交。
+        无论提交顺序如何，翻译结果都按原文顺序拼接
+
         Args:
-            chunks: 文本块列表
+            chunks: 文本块列表或迭代器
 
         Returns:
-            合并后的翻译结果
+            合并后的翻译结果（按原文顺序）
         """
-        self.total_chunks = len(chunks)
-        self.translate_start_time = time.time()
-        self._last_progress_percent = 0
-        logger.info(f'[翻译] 开始任务，共 {self.total_chunks} 个chunk，线程数: {self.config.max_workers}')
-
-        # 准备数据
-        chunk_data_list = [(i, chunk) for i, chunk in enumerate(chunks)]
+        policy = self.submission_policy
+        if policy.requires_all_chunks:
+            chunks = list(chunks)
+            submissions = ((index, chunks[index]) for index in policy.order(chunks))
+        else:
+            submissions = enumerate(chunks)
+
+        # 列表输入时总数已知，迭代器输入时随提交逐步增长
+        known_total = len(chunks) if isinstance(chunks, Sized) else None
+
+        self._reset_progress(known_total)
+        if known_total is not None:
+            logger.info(
+                f'[翻译] 开始任务，共 {known_total} 个chunk，线程数: {self.config.max_workers}，'
+                f'提交策略: {policy.name}'
+            )
+        else:
+            logger.info(f'[翻译] 开始任务（流式提交），线程数: {self.config.max_workers}')
 
-        # 初始化结果列表
-        self.text_list = [(None, False)] * len(chunks)
+        total_chars = 0
 
         # 使用线程池进行翻译
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # 提交所有翻译任务
-            future_to_chunk = {
-                executor.submit(self.translate_chunk, chunk_data): chunk_data[0]
-                for chunk_data in chunk_data_list
-            }
+            # 按提交策略提交翻译任务，完成的任务通过回调收集结果
+            for chunk_index, chunk in submissions:
+                if self.cancelled:
+                    logger.warning('[翻译] 任务已取消，停止提交文本块')
+                    break
+                with self._progress_lock:
+                    if chunk_index >= len(self.text_list):
+                        self.text_list.append((None, False))
+                    self.total_chunks = max(self.total_chunks, chunk_index + 1)
+                total_chars += len(chunk)
+
+                future = executor.submit(self._translate_chunk_timed, (chunk_index, chunk))
+                future.add_done_callback(self._on_chunk_done)
+
+            with self._progress_lock:
+                self.total_chunks = len(self.text_list)
+                self._chunks_complete = True
+                if known_total is None:
+                    logger.info(f'[翻译] 文本切割完成，共 {self.total_chunks} 个chunk')
+                    if self._completed_count:
+                        self._update_progress(self._completed_count)
+
+        self._log_summary(total_chars)
 
-            # 收集结果
-            completed_count = 0
-            failed_chunks = []
+        # 合并翻译结果
+        return "\n\n".join([text for text, _ in self.text_list if text])
 
-            for future in as_completed(future_to_chunk):
-                try:
-                    chunk_index, translated_text, success = future.result()
-                    self.text_list[chunk_index] = (translated_text, success)
-                    completed_count += 1
+    def iter_translate_chunks(self, chunks: Iterable[str], window: Optional[int] = None) -> Iterator[str]:
+        """
+        按原文顺序流式翻译文本块：边读取边提交，开头连续的文本块都已完成时立即产出
 
-                    if not success:
-                        failed_chunks.append(chunk_index + 1)
+        同时在途（已提交但尚未产出）的文本块不超过 window 个，未读取的输入和已完成的译文都不会
+        堆积，内存占用与文档长度无关。始终按原文顺序提交（不使用提交策略）；失败的文本块产出
+        带标记的原文，取消后不再产出
+
+        Args:
+            chunks: 文本块迭代器
+            window: 在途文本块上限，默认为线程数的 2 倍
 
-                    # 更新进度
-                    self._update_progress(completed_count)
+        Yields:
+            按原文顺序的译文文本块
+        """
+        window = max(1, window or self.config.max_workers * 2)
+        self._reset_progress(None)
+        logger.info(f'[翻译] 开始任务（顺序输出），线程数: {self.config.max_workers}，在途上限: {window}')
 
-                except Exception as e:
-                    logger.error(f'[翻译] 翻译任务异常: {e}')
+        pending: Deque[Future] = deque()
+        total_chars = 0
+        executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        try:
+            for chunk_index, chunk in enumerate(chunks):
+                if self.cancelled:
+                    logger.warning('[翻译] 任务已取消，停止提交文本块')
+                    break
+                with self._progress_lock:
+                    self.total_chunks = chunk_index + 1
+                total_chars += len(chunk)
+
+                future = executor.submit(self._translate_chunk_timed, (chunk_index, chunk))
+                future.add_done_callback(self._on_streamed_chunk_done)
+                pending.append(future)
+
+                # 在途文本块已满时等待最早的文本块，并产出所有已完成的前缀
+                yield from self._pop_ordered_results(pending, window - 1)
+
+            with self._progress_lock:
+                self._chunks_complete = True
+                logger.info(f'[翻译] 文本切割完成，共 {self.total_chunks} 个chunk')
+
+            yield from self._pop_ordered_results(pending, 0)
+        finally:
+            # 调用方提前停止迭代时，尚未开始的文本块直接取消
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self._log_summary(total_chars)
+
+    @staticmethod
+    def _pop_ordered_results(pending: Deque[Future], keep: int) -> Iterator[str]:
+        """
+        按原文顺序取出在途文本块的结果
 
-        if failed_chunks:
-            logger.warning(f'[翻译] 失败的chunk: {failed_chunks}')
+        Args:
+            pending: 按原文顺序排列的在途任务
+            keep: 等待最早的任务完成，直到在途任务不超过该数量；之后继续取出已完成的任务
+
+        Yields:
+            译文文本块（已取消的文本块没有结果，不产出）
+        """
+        while pending and (len(pending) > keep or pending[0].done()):
+            _, translated_text, _ = pending.popleft().result()
+            if translated_text:
+                yield translated_text
+
+    def _reset_progress(self, known_total: Optional[int]):
+        """开始新一轮翻译前重置结果和进度状态（总数未知时传入 None）"""
+        self.total_chunks = known_total or 0
+        self._chunks_complete = known_total is not None
+        self._completed_count = 0
+        self._failed_chunks = []
+        self.text_list = [(None, False)] * (known_total or 0)
+        self.translate_start_time = time.time()
+        self._last_progress_percent = 0
+        self._busy_time = 0.0
+        self._last_finish_time = self.translate_start_time
+
+    def _log_summary(self, total_chars: int):
+        """输出失败的文本块和翻译速度统计"""
+        # 取消后未翻译的文本块不算失败
+        if self._failed_chunks and not self.cancelled:
+            logger.warning(f'[翻译] 失败的chunk: {sorted(self._failed_chunks)}')
 
-        # 合并翻译结果
-        merged_text = "\n\n".join([text for text, _ in self.text_list if text])
-        
-        # 计算并打印翻译速度统计
-        total_chars = sum(len(chunk) for chunk in chunks)
         elapsed_time = time.time() - self.translate_start_time
         if elapsed_time > 0:
             chars_per_second = total_chars / elapsed_time
             logger.info(
                 f'[翻译] 完成 | 总字符数: {total_chars:,} | 耗时: {elapsed_time:.1f}s | '
-                f'速度: {chars_per_second:.1f} 字符/秒'
+                f'速度: {chars_per_second:.1f} 字符/秒 | 线程利用率: {self._worker_utilization():.0%}'
             )
-        
-        return merged_text
+
+    def _translate_chunk_timed(self, chunk_data: Tuple[int, str]) -> Tuple[int, Optional[str], bool]:
+        """翻译单个文本块，并累计工作线程忙碌时间"""
+        start = time.time()
+        try:
+            return self.translate_chunk(chunk_data)
+        finally:
+            finish = time.time()
+            with self._progress_lock:
+                self._busy_time += finish - start
+                self._last_finish_time = max(self._last_finish_time, finish)
+
+    def _worker_utilization(self) -> float:
+        """
+        计算线程利用率：各线程忙碌时间之和 / (实际可用线程数 × 完成用时)
+
+        完成用时（makespan）从开始提交到最后一个文本块完成为止
+        """
+        makespan = self._last_finish_time - self.translate_start_time
+        workers = min(self.config.max_workers, self.total_chunks)
+        if makespan <= 0 or workers <= 0:
+            return 0.0
+        return min(self._busy_time / (workers * makespan), 1.0)
+
+    def _on_chunk_done(self, future: Future):
+        """翻译任务完成回调：记录结果并更新进度（在工作线程中执行）"""
+        try:
+            chunk_index, translated_text, success = future.result()
+        except Exception as e:
+            logger.error(f'[翻译] 翻译任务异常: {e}')
+            return
+
+        with self._progress_lock:
+            self.text_list[chunk_index] = (translated_text, success)
+            self._record_chunk(chunk_index, success)
+
+    def _on_streamed_chunk_done(self, future: Future):
+        """顺序输出模式的完成回调：只更新进度，译文由 iter_translate_chunks 按顺序取出"""
+        if future.cancelled():
+            return
+        try:
+            chunk_index, _, success = future.result()
+        except Exception as e:
+            logger.error(f'[翻译] 翻译任务异常: {e}')
+            return
+
+        with self._progress_lock:
+            self._record_chunk(chunk_index, success)
+
+    def _record_chunk(self, chunk_index: int, success: bool):
+        """记录一个文本块完成并更新进度（调用方需持有 _progress_lock）"""
+        self._completed_count += 1
+        if not success:
+            self._failed_chunks.append(chunk_index + 1)
+
+        # 更新进度
+        self._update_progress(self._completed_count)
 
     def _update_progress(self, completed_count: int):
         """更新进度显示"""
+        elapsed = time.time() - self.translate_start_time
+
+        if not self._chunks_complete:
+            # 切割尚未结束，总数未知，按完成数量定期输出
+            if completed_count % 10 == 0:
+                logger.info(
+                    f'[翻译] 进度: 已完成 {completed_count}/{self.total_chunks} 个chunk'
+                    f'（文本提取中）| 已用时 {elapsed:.1f}s'
+                )
+            return
+
         progress_percent = int((completed_count / self.total_chunks) * 100)
         if progress_percent - self._last_progress_percent >= 5 or progress_percent == 100:
-            elapsed = time.time() - self.translate_start_time
             logger.info(f'[翻译] 进度: {progress_percent}% | 已用时 {elapsed:.1f}s')
             self._last_progress_percent = progress_percent
 
+
+class Translator(TranslationEngine):
+    """翻译器类：翻译工作目录中的文件并保存结果"""
+
+    def __init__(self, source_file: str, config: TranslateConfig, work_dir: Optional[str] = None):
+        """
+        初始化翻译器
+
+        Args:
+            source_file: 需要翻译的文件名（支持相对路径，会自动处理 files/ 前缀）
+            config: 翻译配置（TranslateConfig 实例）
+            work_dir: 可选的工作目录覆盖（默认使用 PathConfig.WORK_DIR）
+        """
+        super().__init__(config)
+
+        # 文件路径处理
+        PathConfig.ensure_dirs()
+        work_root = work_dir or str(PathConfig.WORK_DIR)
+        self.file_path = normalize_file_path(source_file, work_root)
+        self.output_txt = get_translated_path(self.file_path)
+
+        self._extraction_failed = False
+
+    def extract_text(self) -> Optional[List[str]]:
+        """
+        提取文本内容
+
+        Returns:
+            切割后的文本块列表，失败返回 None
+        """
+        try:
+            # 提取原始内容（通过提取缓存读取）
+            content_list = list(iter_file_pages(self.file_path))
+
+            if not content_list:
+                logger.error(f'[提取] 未能提取到任何内容: {self.file_path}')
+                return None
+
+            # 使用文本处理器切割内容
+            chunks = self.text_processor.process_extracted_content(content_list)
+
+            return chunks
+
+        except Exception as e:
+            logger.error(f'[提取] 提取文本失败: {e}')
+            return None
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        流式提取并切割文本，每凑满一个文本块立即产出
+
+        提取失败时记录错误并停止产出，run() 会据此终止任务
+
+        Yields:
+            切割后的文本块
+        """
+        self._extraction_failed = False
+        try:
+            # 通过提取缓存读取，预处理阶段已解析过的文件不再重复解析
+            yield from self.text_processor.iter_chunks(iter_file_pages(self.file_path))
+        except Exception as e:
+            logger.error(f'[提取] 提取文本失败: {e}')
+            self._extraction_failed = True
+
     def save_result(self, result: str):
-        """保存翻译结果到文件"""
+        """保存翻译结果到文件，同时写入元数据（中文字数、哈希等，供合并扫描直接使用）"""
         if not result:
             logger.error('[保存] 结果为空，跳过保存')
             return
 
+        # 先写临时文件再原子替换，合并流程（可能在其他 worker 中运行）不会读到写了一半的结果
         try:
-            with open(self.output_txt, 'w', encoding='utf-8') as f:
-                f.write(result)
+            write_result(
+                self.output_txt,
+                result,
+                source=self.file_path.name,
+                provider=self.config.api_base_url,
+                model=self.config.model,
+                failed_chunks=len(self._failed_chunks)
+            )
             logger.info(f'[保存] 翻译结果已保存: {self.output_txt.name}')
         except Exception as e:
             logger.error(f'[保存] 保存失败: {e}')
 
-    def run(self) -> bool:
+    def run(
+        self,
+        chunks: Optional[Sequence[str]] = None,
+        confirm: Optional[Callable[[], bool]] = None
+    ) -> bool:
         """
         执行完整翻译流程
 
+        Args:
+            chunks: 已提取并切割好的文本块（如批量翻译的预取结果），None 表示流式提取
+            confirm: 保存结果前调用，返回 False 时放弃结果（如 worker 的租约已丢失）
+
         Returns:
             是否成功
         """
-        # 提取文本
-        chunks = self.extract_text()
-        if not chunks:
-            logger.error('[任务] 提取文本失败，终止任务')
+        if chunks is not None:
+            if not chunks:
+                logger.error(f'[提取] 未能提取到任何内容: {self.file_path}')
+                logger.error('[任务] 提取文本失败，终止任务')
+                return False
+            translated_text = self.translate_chunks(chunks)
+        else:
+            # 流式提取文本：第一个文本块就绪后即开始翻译
+            stream = self.iter_chunks()
+            first_chunk = next(stream, None)
+            if first_chunk is None:
+                if not self._extraction_failed:
+                    logger.error(f'[提取] 未能提取到任何内容: {self.file_path}')
+                logger.error('[任务] 提取文本失败，终止任务')
+                return False
+
+            # 翻译文本
+            translated_text = self.translate_chunks(itertools.chain([first_chunk], stream))
+
+        if self.cancelled:
+            logger.warning('[任务] 任务已取消，不保存结果')
+            return False
+        if self._extraction_failed:
+            logger.error('[任务] 提取文本中途失败，终止任务')
             return False
-
-        # 翻译文本
-        translated_text = self.translate_chunks(chunks)
         if not translated_text:
             logger.error('[任务] 翻译失败，终止任务')
             return False
+        if confirm is not None and not confirm():
+            logger.warning('[任务] 结果已不再需要，不保存结果')
+            return False
 
         # 保存结果
         self.save_result(translated_text)
         return True
-
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+工作目录清单模块
+
+在工作目录中保存 .manifest.json，记录每个源文件的分析结果和处理状态：
+
+    {"version": 1, "chinese_threshold": 0.3,
+     "files": {"文件名": {"size": ..., "mtime_ns": ..., "sha1": ..., "char_count": ...,
+                          "is_chinese": ..., "status": ...}}}
+
+文件大小和修改时间不变时直接复用上次的分析结果；只有修改时间变化时比较内容哈希，
+内容相同（如被复制或 touch）同样复用。预处理的开销因此只与发生变化的文件数量相关，
+查询待翻译文件也无需扫描和解析目录中的文件。
+
+清单只是缓存和索引：保存时重新读取磁盘上的清单，只合入本进程修改过的条目，再以原子方式
+替换整个文件；多个进程恰好同时保存时可能丢失对方的少量修改，只会导致文件被重新分析
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from translation_app.core.config import CharLimits, ExtractionConfig, PathConfig
+
+
+logger = logging.getLogger('WorkManifest')
+
+
+# 清单格式版本
+_VERSION = 1
+
+# 计算内容哈希时每次读取的字节数
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+# 文件处理状态
+STATUS_PENDING = 'pending'      # 待翻译
+STATUS_FAILED = 'failed'        # 翻译失败（下次运行重新尝试）
+STATUS_SKIPPED = 'skipped'      # 预处理跳过但保留原文件（如导出文本失败的中文 PDF/EPUB）
+
+
+def file_digest(file_path: Path) -> str:
+    """
+    计算文件内容的 SHA-1 哈希
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        十六进制哈希值
+    """
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(_HASH_BLOCK_BYTES)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """单个文件的清单条目"""
+
+    # 文件大小（字节）
+    size: int
+
+    # 修改时间（纳秒）
+    mtime_ns: int
+
+    # 内容哈希（SHA-1）
+    sha1: Optional[str] = None
+
+    # 文本字符数（中文文件不统计，为 None）
+    char_count: Optional[int] = None
+
+    # 是否中文文件
+    is_chinese: Optional[bool] = None
+
+    # 处理状态
+    status: str = STATUS_PENDING
+
+
+class WorkManifest:
+    """工作目录清单"""
+
+    FILE_NAME = '.manifest.json'
+
+    def __init__(self, work_dir: Optional[Path] = None, enabled: Optional[bool] = None):
+        """
+        初始化清单（从磁盘加载）
+
+        Args:
+            work_dir: 工作目录，默认 PathConfig.WORK_DIR
+            enabled: 是否启用清单，默认使用 ExtractionConfig.MANIFEST_ENABLED
+        """
+        self.work_dir = Path(work_dir) if work_dir else PathConfig.WORK_DIR
+        self.path = self.work_dir / self.FILE_NAME
+        self.enabled = ExtractionConfig.MANIFEST_ENABLED if enabled is None else enabled
+        self.entries: Dict[str, ManifestEntry] = {}
+        # 本进程修改过的条目（值为 None 表示删除），保存时合入磁盘上的最新清单
+        self._changes: Dict[str, Optional[ManifestEntry]] = {}
+        if self.enabled:
+            self.entries = self._load()
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        """读取磁盘上的清单，文件不存在、损坏或中文判定阈值已变化时返回空清单"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f'[清单] 清单文件损坏，重新建立: {e}')
+            return {}
+
+        if (
+            data.get('version') != _VERSION
+            or data.get('chinese_threshold') != CharLimits.CHINESE_RATIO_THRESHOLD
+        ):
+            logger.info('[清单] 清单版本或中文判定阈值已变化，重新建立')
+            return {}
+
+        entries = {}
+        for name, fields in data.get('files', {}).items():
+            try:
+                entries[name] = ManifestEntry(**fields)
+            except TypeError:
+                continue
+        return entries
+
+    def _put(self, name: str, entry: ManifestEntry):
+        self.entries[name] = entry
+        self._changes[name] = entry
+
+    def lookup(self, file_path: Path) -> Optional[ManifestEntry]:
+        """
+        查找文件的有效条目
+
+        大小和修改时间都未变化时直接返回；只有修改时间变化时比较内容哈希，
+        内容相同则更新修改时间后返回
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            有效的条目，没有记录或文件已变化时返回 None
+        """
+        if not self.enabled:
+            return None
+        entry = self.entries.get(file_path.name)
+        if entry is None:
+            return None
+
+        try:
+            stat = file_path.stat()
+            if stat.st_size != entry.size:
+                return None
+            if stat.st_mtime_ns == entry.mtime_ns:
+                return entry
+            if entry.sha1 is None or file_digest(file_path) != entry.sha1:
+                return None
+        except OSError:
+            return None
+
+        entry.mtime_ns = stat.st_mtime_ns
+        self._put(file_path.name, entry)
+        return entry
+
+    def record_analysis(
+        self,
+        file_path: Path,
+        is_chinese: bool,
+        char_count: Optional[int],
+        sha1: Optional[str] = None
+    ):
+        """
+        记录文件的分析结果（读取失败的结果不记录，下次重新分析）
+
+        Args:
+            file_path: 文件路径
+            is_chinese: 是否中文文件
+            char_count: 文本字符数（中文文件为 None，读取失败为 -1）
+            sha1: 已计算的内容哈希，None 表示在此计算
+        """
+        if not self.enabled or (char_count is not None and char_count < 0):
+            return
+        try:
+            stat = file_path.stat()
+            if sha1 is None:
+                sha1 = file_digest(file_path)
+        except OSError as e:
+            logger.debug(f'[清单] 无法读取文件信息 {file_path.name}: {e}')
+            return
+
+        previous = self.entries.get(file_path.name)
+        self._put(file_path.name, ManifestEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha1=sha1,
+            char_count=char_count,
+            is_chinese=is_chinese,
+            status=previous.status if previous else STATUS_PENDING,
+        ))
+
+    def set_status(self, file_path: Path, status: str):
+        """
+        更新文件的处理状态，文件已不存在时删除条目
+
+        Args:
+            file_path: 文件路径
+            status: 处理状态（STATUS_PENDING / STATUS_FAILED / STATUS_SKIPPED）
+        """
+        if not self.enabled:
+            return
+        entry = self.entries.get(file_path.name)
+        if not file_path.exists():
+            self.forget(file_path.name)
+        elif entry is not None and entry.status != status:
+            entry.status = status
+            self._put(file_path.name, entry)
+
+    def forget(self, name: str):
+        """
+        删除文件的条目（文件被删除、重命名或翻译完成后调用）
+
+        Args:
+            name: 文件名
+        """
+        if self.entries.pop(name, None) is not None:
+            self._changes[name] = None
+
+    def prune(self, existing_names: Iterable[str]):
+        """
+        删除目录中已不存在的文件的条目
+
+        Args:
+            existing_names: 目录中现有的文件名
+        """
+        existing = set(existing_names)
+        for name in [name for name in self.entries if name not in existing]:
+            self.forget(name)
+
+    def names_with_status(self, status: str) -> List[str]:
+        """
+        查询处于指定状态的文件（只读取清单，不扫描目录）
+
+        Args:
+            status: 处理状态
+
+        Returns:
+            文件名列表（按文件名排序）
+        """
+        return sorted(name for name, entry in self.entries.items() if entry.status == status)
+
+    def save(self):
+        """有变化时将本进程的修改合入磁盘上的最新清单，并以原子方式写入"""
+        if not self.enabled or not self._changes:
+            return
+
+        entries = self._load()
+        for name, entry in self._changes.items():
+            if entry is None:
+                entries.pop(name, None)
+            else:
+                entries[name] = entry
+        self.entries = entries
+
+        data = {
+            'version': _VERSION,
+            'chinese_threshold': CharLimits.CHINESE_RATIO_THRESHOLD,
+            'files': {name: asdict(entry) for name, entry in entries.items()},
+        }
+        temp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        try:
+            self.work_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+            self._changes = {}
+        except OSError as e:
+            logger.warning(f'[清单] 写入清单失败: {e}')
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
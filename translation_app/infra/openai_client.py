@@ -2,9 +2,9 @@
 OpenAI 客户端创建
 """
 
-from typing import Any
-
-from openai import OpenAI
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable
 
 from translation_app.core.translate_config import TranslateConfig
 
@@ -13,6 +13,9 @@ def build_openai_client(config: TranslateConfig) -> Any:
     """
     根据 TranslateConfig 创建 OpenAI 客户端
     """
+    # 延迟导入：openai 导入较慢，不创建客户端的命令（合并、状态查询）无需加载
+    from openai import OpenAI
+
     if not config.api_key:
         raise ValueError("api_key 参数不能为空")
     return OpenAI(
@@ -20,3 +23,64 @@ def build_openai_client(config: TranslateConfig) -> Any:
         base_url=config.api_base_url
     )
 
+
+
+def shared_client_factory(factory: Callable = build_openai_client) -> Callable:
+    """
+    包装客户端工厂：首次调用时创建客户端，之后所有翻译任务复用同一个客户端
+
+    用于常驻进程（监听模式、worker），避免每个文件都重新创建客户端和连接池
+    """
+    client = None
+    lock = threading.Lock()
+
+    def build(config: TranslateConfig) -> Any:
+        nonlocal client
+        with lock:
+            if client is None:
+                client = factory(config)
+        return client
+
+    return build
+
+
+class ConcurrencyLimitedClient:
+    """
+    包装客户端：通过它发出的 chat.completions.create 调用共享同一个并发上限
+
+    多个翻译任务各自使用线程池时，由共享的信号量限制同时进行的 API 请求总数
+    """
+
+    def __init__(self, client: Any, slots: threading.Semaphore):
+        """
+        初始化包装客户端
+
+        Args:
+            client: 原始客户端
+            slots: 共享的并发信号量
+        """
+        self._client = client
+        self._slots = slots
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, *args, **kwargs) -> Any:
+        """获取并发名额后调用原始客户端的 chat.completions.create"""
+        with self._slots:
+            return self._client.chat.completions.create(*args, **kwargs)
+
+
+def limited_client_factory(factory: Callable, slots: threading.Semaphore) -> Callable:
+    """
+    包装客户端工厂：创建的客户端共享同一个并发上限
+
+    Args:
+        factory: 原始客户端工厂
+        slots: 共享的并发信号量
+
+    Returns:
+        新的客户端工厂
+    """
+    def build(config: TranslateConfig) -> Any:
+        return ConcurrencyLimitedClient(factory(config), slots)
+
+    return build
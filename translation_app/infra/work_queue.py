@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基于租约文件的工作队列
+
+多个 worker 进程（可以在不同主机上，通过 NFS 等共享同一个工作目录）协作处理文件，
+每个文件同一时间只会被一个 worker 认领：
+
+- 认领：在租约目录中以 O_CREAT | O_EXCL 原子创建租约文件，创建成功即持有租约
+- 心跳：持有期间后台线程定期更新租约文件的修改时间
+- 过期：修改时间超过有效期的租约视为持有者已崩溃，其他 worker 先原子重命名租约文件
+  （只有一个 worker 能成功），确认仍已过期后删除并重新认领
+- 处理结果：失败或被跳过但仍留在目录中的文件写入结果记录（包含文件大小和修改时间）。
+  被跳过的文件在修改前所有 worker 都不再认领；失败的文件记录尝试次数，按指数退避
+  （QueueConfig.RETRY_DELAY 起，每次翻倍）到期后重新认领，达到 QueueConfig.MAX_ATTEMPTS
+  次后在文件修改前不再认领
+
+租约过期依赖修改时间与本机时钟的比较，各主机的时钟偏差需明显小于有效期
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from translation_app.core.config import PathConfig, QueueConfig
+
+
+logger = logging.getLogger('WorkQueue')
+
+
+def _new_owner_id() -> str:
+    """生成 worker 标识：主机名:进程号:随机后缀"""
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+class FileLease:
+    """一个文件的租约，持有期间后台线程定期发送心跳"""
+
+    def __init__(self, path: Path, owner: str, name: str, heartbeat_interval: float):
+        """
+        初始化租约（由 WorkQueue.claim 创建，不直接构造）
+
+        Args:
+            path: 租约文件路径
+            owner: 持有者标识
+            name: 被认领的文件名
+            heartbeat_interval: 心跳间隔（秒）
+        """
+        self.path = path
+        self.owner = owner
+        self.name = name
+        self.heartbeat_interval = heartbeat_interval
+        self.lost = False
+        self._lost_callbacks: List[Callable[[], None]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name=f'lease-heartbeat-{name}',
+            daemon=True
+        )
+        self._thread.start()
+
+    def _heartbeat_loop(self):
+        """定期更新租约文件的修改时间，发现租约已被回收时标记为丢失"""
+        while not self._stop.wait(self.heartbeat_interval):
+            if not self.heartbeat():
+                return
+
+    def heartbeat(self) -> bool:
+        """
+        发送一次心跳
+
+        Returns:
+            租约是否仍由当前 worker 持有
+        """
+        try:
+            if _read_owner(self.path) != self.owner:
+                raise FileNotFoundError(self.path)
+            os.utime(self.path)
+            return True
+        except OSError:
+            if not self.lost:
+                self.lost = True
+                logger.warning(f'[队列] 租约已丢失（可能因心跳超时被其他 worker 回收）: {self.name}')
+                for callback in self._lost_callbacks:
+                    callback()
+            return False
+
+    def on_lost(self, callback: Callable[[], None]):
+        """
+        注册租约丢失时的回调（如取消正在进行的翻译），租约已丢失时立即调用
+
+        Args:
+            callback: 无参数的回调函数（在心跳线程中调用）
+        """
+        self._lost_callbacks.append(callback)
+        if self.lost:
+            callback()
+
+    def release(self):
+        """停止心跳并释放租约（租约已丢失时不删除其他 worker 的租约文件）"""
+        self._stop.set()
+        self._thread.join()
+        if self.lost or _read_owner(self.path) != self.owner:
+            return
+        try:
+            self.path.unlink()
+        except OSError as e:
+            logger.warning(f'[队列] 释放租约失败 {self.name}: {e}')
+
+    def __enter__(self) -> 'FileLease':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def _read_owner(path: Path) -> Optional[str]:
+    """读取租约文件中的持有者标识，文件不存在或内容损坏时返回 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('owner')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class WorkQueue:
+    """基于租约文件的工作队列"""
+
+    def __init__(
+        self,
+        lease_dir: Optional[Path] = None,
+        owner: Optional[str] = None,
+        lease_ttl: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None
+    ):
+        """
+        初始化工作队列
+
+        Args:
+            lease_dir: 租约目录，默认 PathConfig.LEASE_DIR
+            owner: 当前 worker 的标识，默认由主机名、进程号和随机后缀生成
+            lease_ttl: 租约有效期（秒），默认 QueueConfig.LEASE_TTL
+            heartbeat_interval: 心跳间隔（秒），默认 QueueConfig.HEARTBEAT_INTERVAL
+        """
+        self.lease_dir = Path(lease_dir) if lease_dir else PathConfig.LEASE_DIR
+        self.owner = owner or _new_owner_id()
+        self.lease_ttl = QueueConfig.LEASE_TTL if lease_ttl is None else lease_ttl
+        self.heartbeat_interval = (
+            QueueConfig.HEARTBEAT_INTERVAL if heartbeat_interval is None else heartbeat_interval
+        )
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        """文件名对应的租约键（哈希后长度固定，不受文件名长度和字符限制）"""
+        return hashlib.sha1(name.encode('utf-8')).hexdigest()[:20]
+
+    def _lease_path(self, name: str) -> Path:
+        return self.lease_dir / f'{self._key(name)}.lease'
+
+    def _outcome_path(self, name: str) -> Path:
+        return self.lease_dir / f'{self._key(name)}.outcome'
+
+    def claim(self, name: str) -> Optional[FileLease]:
+        """
+        尝试认领一项工作
+
+        Args:
+            name: 工作名称（通常为文件名）
+
+        Returns:
+            FileLease: 认领成功时返回租约，已被其他 worker 持有时返回 None
+        """
+        lease_path = self._lease_path(name)
+        for _ in range(2):
+            try:
+                fd = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                # 已有租约：过期则回收后重试一次
+                if not self._break_if_expired(lease_path, name):
+                    return None
+                continue
+
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'owner': self.owner,
+                    'name': name,
+                    'acquired_at': time.time(),
+                }, f, ensure_ascii=False)
+            logger.debug(f'[队列] 已认领: {name}')
+            return FileLease(lease_path, self.owner, name, self.heartbeat_interval)
+        return None
+
+    def _break_if_expired(self, lease_path: Path, name: str) -> bool:
+        """
+        回收过期租约
+
+        Returns:
+            租约文件是否已不存在（已回收或已被持有者释放）
+        """
+        try:
+            if time.time() - lease_path.stat().st_mtime < self.lease_ttl:
+                return False
+        except FileNotFoundError:
+            return True
+
+        # 原子重命名，多个 worker 同时回收时只有一个成功
+        stale_path = lease_path.with_name(f'{lease_path.name}.{uuid.uuid4().hex[:8]}.stale')
+        try:
+            os.rename(lease_path, stale_path)
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            logger.warning(f'[队列] 回收租约失败 {name}: {e}')
+            return False
+
+        try:
+            # 检查与重命名之间租约可能刚被重新认领，此时放回原处
+            if time.time() - stale_path.stat().st_mtime < self.lease_ttl:
+                try:
+                    os.link(stale_path, lease_path)
+                except OSError:
+                    pass
+                return False
+            logger.warning(f'[队列] 回收过期租约: {name}（原持有者 {_read_owner(stale_path)}）')
+            return True
+        finally:
+            try:
+                stale_path.unlink()
+            except OSError:
+                pass
+
+    def _read_outcome(self, file_path: Path, stat: os.stat_result) -> Optional[dict]:
+        """读取文件的处理结果记录，不存在、损坏或文件已被修改时返回 None"""
+        try:
+            with open(self._outcome_path(file_path.name), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict):
+            return None
+        if record.get('size') != stat.st_size or record.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+        return record
+
+    def record_outcome(self, file_path: Path, outcome: str):
+        """
+        记录文件的处理结果（如处理失败、预处理跳过但保留原文件）
+
+        被跳过的文件在修改前所有 worker 都不再认领；失败的文件累计尝试次数，
+        退避时间到期后重新认领，达到最大尝试次数后在修改前不再认领
+
+        Args:
+            file_path: 文件路径
+            outcome: 处理结果（'failed'、'skipped' 等）
+        """
+        try:
+            stat = file_path.stat()
+            now = time.time()
+            record = {
+                'name': file_path.name,
+                'outcome': outcome,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'owner': self.owner,
+                'recorded_at': now,
+            }
+            if outcome == 'failed':
+                previous = self._read_outcome(file_path, stat) or {}
+                attempts = int(previous.get('attempts', 0)) + 1
+                record['attempts'] = attempts
+                if attempts < QueueConfig.MAX_ATTEMPTS:
+                    delay = QueueConfig.RETRY_DELAY * 2 ** (attempts - 1)
+                    record['retry_at'] = now + delay
+                    logger.info(
+                        f'[队列] {file_path.name} 第 {attempts} 次处理失败，{delay:.0f} 秒后重试'
+                    )
+                else:
+                    logger.warning(
+                        f'[队列] {file_path.name} 已失败 {attempts} 次，文件修改前不再重试'
+                    )
+            with open(self._outcome_path(file_path.name), 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f'[队列] 写入处理结果失败 {file_path.name}: {e}')
+
+    def has_outcome(self, file_path: Path) -> bool:
+        """
+        判断文件是否已有处理结果且暂不需要处理（文件之后未被修改，失败的文件尚未到重试时间
+        或已用完尝试次数）
+
+        Args:
+            file_path: 文件路径
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        record = self._read_outcome(file_path, stat)
+        if record is None:
+            return False
+        retry_at = record.get('retry_at')
+        return retry_at is None or time.time() < retry_at
+
+    def clear_outcome(self, name: str):
+        """删除文件的处理结果记录（文件修改后重新处理成功时调用）"""
+        try:
+            self._outcome_path(name).unlink()
+        except OSError:
+            pass
@@ -6,19 +6,26 @@
 
 import logging
 import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
 
 from translation_app.domain.translator import Translator
 from translation_app.services.file_preprocessor import FilePreprocessor
-from translation_app.core.translate_config import create_translate_config
+from translation_app.core.translate_config import TranslateConfig, create_translate_config
 from translation_app.infra.openai_client import build_openai_client
-from translation_app.services.merge_service import merge_entrance
+from translation_app.services.merge_service import merge_entrance, merge_file_incrementally
 from translation_app.core.providers import get_provider
-from translation_app.core.file_ops import safe_delete
+from translation_app.core.file_ops import list_source_files, safe_delete
+from translation_app.domain.extraction_cache import evict_file_cache
+from translation_app.domain.chunk_prefetcher import iter_prepared_files
+from translation_app.domain.file_order import get_file_order_policy, load_priority_rules, order_files
+from translation_app.domain.work_manifest import STATUS_FAILED, WorkManifest
+from translation_app.infra.work_queue import FileLease
 from translation_app.core.config import (
     LogConfig,
     PathConfig,
     CharLimits,
-    FileFormats,
+    MergeConfig,
     TranslationDefaults
 )
 
@@ -26,16 +33,27 @@ from translation_app.core.config import (
 logger = logging.getLogger('BatchService')
 
 
-def batch_translate(provider: str = 'akashml'):
+def build_batch_config(
+    provider: str = 'akashml',
+    balanced: bool = False,
+    submission_policy: str = TranslationDefaults.BATCH_SUBMISSION_POLICY,
+    client_factory: Optional[Callable] = None
+) -> TranslateConfig:
     """
-    批量翻译文件，支持 txt、pdf、epub 三种文件类型
+    创建批量翻译配置
 
     Args:
         provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'）
+        client_factory: 客户端工厂，默认 build_openai_client（每个翻译任务创建新的客户端）
+
+    Returns:
+        TranslateConfig: 翻译配置对象
     """
     provider_config = get_provider(provider)
 
-    config = create_translate_config(
+    return create_translate_config(
         max_workers=TranslationDefaults.BATCH_MAX_WORKERS,
         max_retries=TranslationDefaults.BATCH_MAX_RETRIES,
         retry_delay=TranslationDefaults.BATCH_RETRY_DELAY,
@@ -45,17 +63,94 @@ def batch_translate(provider: str = 'akashml'):
         api_base_url=provider_config.api_base_url,
         model=provider_config.model,
         api_key=provider_config.api_key,
-        client_factory=build_openai_client
+        client_factory=client_factory or build_openai_client,
+        balanced_chunks=balanced,
+        balance_tolerance=TranslationDefaults.CHUNK_BALANCE_TOLERANCE,
+        submission_policy=submission_policy
     )
 
+
+def translate_file(
+    file_path: Path,
+    config: TranslateConfig,
+    chunks: Optional[List[str]] = None,
+    manifest: Optional[WorkManifest] = None,
+    merge_each: bool = False,
+    lease: Optional[FileLease] = None
+) -> bool:
+    """
+    翻译一个文件，成功后删除原文件及其提取缓存
+
+    Args:
+        file_path: 文件路径
+        config: 翻译配置
+        chunks: 预取的文本块，None 表示由翻译器流式提取
+        manifest: 可选的工作目录清单，翻译完成后更新文件状态并保存
+        merge_each: 翻译结果保存后是否立即增量合并到 combined/
+        lease: worker 持有的租约；租约丢失（文件已被其他 worker 接手）时取消翻译并丢弃结果，
+            不保存、不删除原文件、不更新清单
+
+    Returns:
+        是否翻译成功（租约丢失时返回 False，调用方通过 lease.lost 区分）
+    """
+    logger.info(f'开始翻译：{file_path.name} (类型: {file_path.suffix.lower()})')
+    translator = Translator(file_path.name, config)
+    if lease is not None:
+        lease.on_lost(translator.cancel)
+    succeeded = translator.run(chunks, confirm=lease.heartbeat if lease is not None else None)
+    if lease is not None and (lease.lost or (succeeded and not lease.heartbeat())):
+        logger.warning(f'租约已丢失，丢弃翻译结果，保留原文件: {file_path.name}')
+        return False
+
+    if succeeded:
+        # 翻译成功后删除原文件及其提取缓存
+        safe_delete(file_path)
+        evict_file_cache(file_path)
+        if merge_each and translator.output_txt.exists():
+            merge_file_incrementally(translator.output_txt)
+    else:
+        logger.error(f"翻译失败: {file_path.name}")
+
+    if manifest is not None:
+        if succeeded:
+            manifest.forget(file_path.name)
+        else:
+            manifest.set_status(file_path, STATUS_FAILED)
+        manifest.save()
+    return succeeded
+
+
+def batch_translate(
+    provider: str = 'akashml',
+    balanced: bool = False,
+    submission_policy: str = TranslationDefaults.BATCH_SUBMISSION_POLICY,
+    prefetch: int = TranslationDefaults.BATCH_PREFETCH_FILES,
+    order: str = TranslationDefaults.BATCH_FILE_ORDER,
+    priority: Sequence[str] = (),
+    merge_each: bool = MergeConfig.MERGE_EACH_FILE
+):
+    """
+    批量翻译文件，支持 txt、pdf、epub 三种文件类型
+
+    Args:
+        provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'）
+        prefetch: 翻译当前文件时在后台提前提取的文件数，0 表示不预取
+        order: 文件处理顺序（'name'、'shortest_first' 或 'largest_first'）
+        priority: 优先处理的文件名通配符（优先于工作目录中 .priority 文件的规则）
+        merge_each: 每个文件翻译完成后立即增量合并，而不是等整批结束后再合并
+    """
+    config = build_batch_config(provider, balanced, submission_policy)
+    # 提前校验排序策略，避免预处理完成后才报错
+    get_file_order_policy(order)
+
     # 确保工作目录存在
     PathConfig.ensure_dirs()
     current_dir = PathConfig.WORK_DIR
 
-    # 收集所有支持的文件
-    all_files = []
-    for ext in FileFormats.SUPPORTED_EXTENSIONS:
-        all_files.extend(sorted(current_dir.glob(f"*{ext}")))
+    # 收集所有支持的文件（只扫描一次目录）
+    all_files = list_source_files(current_dir, include_translated=True)
 
     if not all_files:
         print("未找到待翻译的文件（txt/pdf/epub），退出。")
@@ -63,12 +158,26 @@ def batch_translate(provider: str = 'akashml'):
 
     # 预处理：筛选出需要处理的文件
     preprocessor = FilePreprocessor()
+    preprocessor.manifest.prune(file_path.name for file_path in all_files)
     files_to_process, preprocess_stats = preprocessor.preprocess_files(all_files)
 
     if not files_to_process:
         logger.info(f"没有需要处理的文件（预处理跳过 {preprocess_stats.total_skipped} 个文件）")
         return
 
+    # 按优先级规则和排序策略决定处理顺序
+    char_counts = {
+        file_path: analysis.char_count
+        for file_path, analysis in preprocessor.analyses.items()
+    }
+    files_to_process = order_files(
+        files_to_process,
+        policy=order,
+        char_counts=char_counts,
+        chunk_size=config.chunk_size,
+        priority_rules=list(priority) + load_priority_rules()
+    )
+
     # 初始化进度统计变量
     total_files = len(files_to_process)
     current_index = 0
@@ -83,23 +192,27 @@ def batch_translate(provider: str = 'akashml'):
     logger.info(f'[任务] 总文件数: {total_files}')
     logger.info(
         '[任务] 配置: 线程数=%s, 重试次数=%s, 重试延迟=%s秒, chunk大小=%s, '
-        '最小chunk=%s, 超时=%s秒',
+        '最小chunk=%s, 超时=%s秒, 均衡切割=%s, 提交策略=%s, 预取文件数=%s, 文件顺序=%s',
         config.max_workers,
         config.max_retries,
         config.retry_delay,
         config.chunk_size,
         config.min_chunk_size,
-        config.api_timeout
+        config.api_timeout,
+        config.chunking.balanced,
+        config.submission_policy,
+        prefetch,
+        order
     )
 
     if preprocess_stats.total_skipped > 0:
         preprocessor.log_stats()
     logger.info('=' * 60)
 
-    # 处理每个文件
-    for file_path in files_to_process:
+    # 处理每个文件（启用预取时，后续文件的提取与当前文件的翻译并行进行）
+    for prepared in iter_prepared_files(files_to_process, config.chunking, prefetch, char_counts):
+        file_path = prepared.file_path
         current_index += 1
-        file_ext = file_path.suffix.lower()
         file_name = file_path.name
 
         # 计算进度百分比
@@ -109,14 +222,12 @@ def batch_translate(provider: str = 'akashml'):
         logger.info(f'[进度] 处理第 {current_index}/{total_files} 个文件 ({progress_percent:.1f}%)：{file_name}')
 
         try:
-            # 启动翻译任务
-            logger.info(f'开始翻译：{file_name} (类型: {file_ext})')
-            translator = Translator(file_name, config)
-            result = translator.run()
+            if prepared.error is not None:
+                raise prepared.error
 
-            if not result:
+            # 启动翻译任务
+            if not translate_file(file_path, config, prepared.chunks, preprocessor.manifest, merge_each):
                 failed_count += 1
-                logger.error(f"翻译失败: {file_name}")
                 # 打印当前统计
                 remaining = total_files - current_index
                 logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}, 剩余: {remaining}')
@@ -124,9 +235,6 @@ def batch_translate(provider: str = 'akashml'):
 
             success_count += 1
 
-            # 翻译成功后删除原文件
-            safe_delete(file_path)
-
             # 打印当前统计
             remaining = total_files - current_index
             logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}, 剩余: {remaining}')
@@ -152,6 +260,7 @@ def batch_translate(provider: str = 'akashml'):
     merge_entrance(
         files_dir=str(PathConfig.WORK_DIR),
         delete_originals=True,
-        backup=False
+        backup=False,
+        incremental=True if merge_each else None
     )
 
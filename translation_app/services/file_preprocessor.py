@@ -7,14 +7,25 @@
 """
 
 import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
-from translation_app.core.config import CharLimits, FileFormats
+from translation_app.core.config import CharLimits, ExtractionConfig, FileFormats
 from translation_app.core.file_ops import safe_delete, safe_rename
 from translation_app.core.path_utils import get_translated_path
 from translation_app.domain.file_analyzer import count_file_characters, is_file_chinese
+from translation_app.domain.extraction_cache import evict_file_cache, iter_file_pages
+from translation_app.domain.work_manifest import (
+    STATUS_PENDING,
+    STATUS_SKIPPED,
+    WorkManifest,
+    file_digest,
+)
 
 
 logger = logging.getLogger('FilePreprocessor')
@@ -39,16 +50,77 @@ class PreprocessStats:
         )
 
 
+@dataclass
+class FileAnalysis:
+    """单个文件的分析结果（只读取文件，不修改文件）"""
+    
+    # 文件路径
+    file_path: Path
+    
+    # 是否中文文件
+    is_chinese: bool
+    
+    # 文本字符数（中文文件不统计，为 None；读取失败为 -1）
+    char_count: Optional[int] = None
+    
+    # 内容哈希（用于工作目录清单，None 表示未计算）
+    sha1: Optional[str] = None
+
+
+def analyze_file(file_path: Path, with_digest: bool = False) -> FileAnalysis:
+    """
+    分析文件：检测是否中文文件，非中文文件统计字符数
+    
+    只读取文件，可以在子进程中并行执行
+    
+    Args:
+        file_path: 文件路径
+        with_digest: 是否同时计算内容哈希
+    
+    Returns:
+        FileAnalysis: 分析结果
+    """
+    file_path = Path(file_path)
+    if is_file_chinese(file_path):
+        analysis = FileAnalysis(file_path, is_chinese=True)
+    else:
+        analysis = FileAnalysis(file_path, is_chinese=False, char_count=count_file_characters(file_path))
+    
+    if with_digest:
+        try:
+            analysis.sha1 = file_digest(file_path)
+        except OSError:
+            pass
+    return analysis
+
+
 class FilePreprocessor:
     """文件预处理器"""
     
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None, manifest: Optional[WorkManifest] = None):
+        """
+        初始化预处理器
+        
+        Args:
+            workers: 并行分析的进程数，默认使用 ExtractionConfig.PREPROCESS_WORKERS（0 表示 CPU 核数）；
+                     1 表示在当前进程中逐个分析
+            manifest: 工作目录清单，默认加载 PathConfig.WORK_DIR 中的清单
+        """
         self.stats = PreprocessStats()
+        # 最近一次预处理中各文件的分析结果（供批量翻译估算文件大小、决定处理顺序）
+        self.analyses: Dict[Path, FileAnalysis] = {}
+        self.manifest = manifest if manifest is not None else WorkManifest()
+        if workers is None:
+            workers = ExtractionConfig.PREPROCESS_WORKERS
+        self.workers = max(1, workers or os.cpu_count() or 1)
     
     def preprocess_files(self, files: List[Path]) -> Tuple[List[Path], PreprocessStats]:
         """
         预处理文件列表
         
+        清单中记录过且未变化的文件直接复用上次的分析结果；其余文件较多时在进程池中
+        并行分析（中文检测、字符统计），重命名、删除等操作仍在当前线程中按文件顺序执行
+        
         Args:
             files: 待处理的文件列表
         
@@ -56,20 +128,91 @@ class FilePreprocessor:
             (需要处理的文件列表, 预处理统计)
         """
         self.stats = PreprocessStats()
+        self.analyses = {}
         files_to_process = []
         
+        # 策略 1: 跳过已翻译文件（只看文件名，无需分析）
+        candidates = []
         for file_path in files:
-            if self._should_process_file(file_path):
+            if self._is_already_translated(file_path.name):
+                self.stats.skipped_already_translated += 1
+                logger.debug(f"[预处理] 跳过已翻译文件: {file_path.name}")
+            else:
+                candidates.append(file_path)
+        
+        # 复用清单中的分析结果，只分析新增或变化的文件
+        known = {}
+        for file_path in candidates:
+            entry = self.manifest.lookup(file_path)
+            if entry is not None:
+                known[file_path] = FileAnalysis(file_path, entry.is_chinese, entry.char_count, entry.sha1)
+        if known:
+            logger.info(f'[预处理] 复用清单中的分析结果: {len(known)}/{len(candidates)} 个文件')
+        
+        analyses = self._iter_analyses([file_path for file_path in candidates if file_path not in known])
+        for file_path in candidates:
+            analysis = known.get(file_path)
+            if analysis is None:
+                analysis = next(analyses)
+                self.manifest.record_analysis(
+                    file_path, analysis.is_chinese, analysis.char_count, analysis.sha1
+                )
+            self.analyses[file_path] = analysis
+            
+            should_process = self._should_process_file(file_path, analysis)
+            if should_process:
                 files_to_process.append(file_path)
+            self.manifest.set_status(file_path, STATUS_PENDING if should_process else STATUS_SKIPPED)
         
+        self.manifest.save()
         return files_to_process, self.stats
     
-    def _should_process_file(self, file_path: Path) -> bool:
+    def _iter_analyses(self, files: List[Path]) -> Iterator[FileAnalysis]:
+        """
+        按文件顺序产出分析结果
+        
+        文件数达到 ExtractionConfig.PREPROCESS_PARALLEL_MIN_FILES 且进程数大于 1 时并行分析，
+        否则在当前进程中逐个分析
+        """
+        workers = min(self.workers, len(files))
+        if workers < 2 or len(files) < ExtractionConfig.PREPROCESS_PARALLEL_MIN_FILES:
+            for file_path in files:
+                yield analyze_file(file_path, self.manifest.enabled)
+            return
+        
+        logger.info(f'[预处理] 并行分析 {len(files)} 个文件，{workers} 个进程')
+        
+        # 使用 spawn 启动子进程，避免在多线程环境下 fork
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        pending = deque()
+        try:
+            for file_path in files:
+                pending.append((file_path, executor.submit(analyze_file, file_path, self.manifest.enabled)))
+                if len(pending) < workers * 2:
+                    continue
+                yield self._collect_analysis(*pending.popleft())
+            
+            while pending:
+                yield self._collect_analysis(*pending.popleft())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _collect_analysis(self, file_path: Path, future) -> FileAnalysis:
+        """等待一个文件的分析结果，子进程异常时在当前进程中重新分析"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f'[预处理] 子进程分析失败，改为直接分析 {file_path.name}: {e}')
+            return analyze_file(file_path, self.manifest.enabled)
+    
+    def _should_process_file(self, file_path: Path, analysis: Optional[FileAnalysis] = None) -> bool:
         """
         判断文件是否需要处理
         
         Args:
             file_path: 文件路径
+            analysis: 预先完成的分析结果，None 表示在此分析
         
         Returns:
             是否需要处理
@@ -82,16 +225,22 @@ class FilePreprocessor:
             logger.debug(f"[预处理] 跳过已翻译文件: {file_name}")
             return False
         
-        # 策略 2: 检测并重命名中文文件（仅针对 .txt 文件）
-        if self._is_chinese_file(file_path):
+        if analysis is None:
+            analysis = analyze_file(file_path)
+        
+        # 策略 2: 检测中文文件（采样检测，.txt 重命名为翻译结果，PDF/EPUB 导出文本作为翻译结果）
+        if analysis.is_chinese:
             self.stats.skipped_already_chinese += 1
-            self._rename_chinese_file(file_path)
+            if file_path.suffix.lower() == '.txt':
+                self._rename_chinese_file(file_path)
+            else:
+                self._export_chinese_book(file_path)
             return False
         
         # 策略 3: 删除字符数不足的文件
-        if self._is_char_count_too_low(file_path):
+        if 0 <= analysis.char_count < CharLimits.MIN_FILE_CHARS:
             self.stats.skipped_char_too_few += 1
-            self._delete_small_file(file_path)
+            self._delete_small_file(file_path, analysis.char_count)
             return False
         
         # 策略 4: 跳过已存在翻译结果的文件
@@ -106,15 +255,6 @@ class FilePreprocessor:
         """判断是否已翻译文件"""
         return file_name.endswith(FileFormats.TRANSLATED_SUFFIX)
     
-    def _is_chinese_file(self, file_path: Path) -> bool:
-        """判断是否中文文件（仅 .txt）"""
-        return file_path.suffix.lower() == '.txt' and is_file_chinese(file_path)
-    
-    def _is_char_count_too_low(self, file_path: Path) -> bool:
-        """判断字符数是否过少"""
-        char_count = count_file_characters(file_path)
-        return 0 <= char_count < CharLimits.MIN_FILE_CHARS
-    
     def _translation_result_exists(self, file_path: Path) -> bool:
         """判断翻译结果是否已存在"""
         translated_path = get_translated_path(file_path)
@@ -128,19 +268,52 @@ class FilePreprocessor:
         else:
             logger.info(f"[预处理] 跳过中文文件（重命名失败）: {file_path.name}")
     
-    def _delete_small_file(self, file_path: Path):
+    def _export_chinese_book(self, file_path: Path):
+        """
+        将中文 PDF/EPUB 的文本导出为翻译结果，成功后删除原文件
+
+        与 .txt 重命名一样只执行一次：导出的文本被合并并删除后，不会再次导出同一本书。
+        导出失败时保留原文件，下次预处理重试
+        """
+        translated_path = get_translated_path(file_path)
+        if translated_path.exists():
+            logger.info(f"[预处理] 删除中文文件（已存在导出文本）: {file_path.name}")
+            safe_delete(file_path)
+            evict_file_cache(file_path)
+            return
+        
+        temp_path = translated_path.with_name(f"{translated_path.name}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for index, page in enumerate(iter_file_pages(file_path)):
+                    if index:
+                        f.write("\n\n")
+                    f.write(page)
+            os.replace(temp_path, translated_path)
+        except Exception as e:
+            logger.error(f"[预处理] 跳过中文文件（导出文本失败，保留原文件）: {file_path.name}: {e}")
+            if temp_path.exists():
+                safe_delete(temp_path)
+            return
+        
+        logger.info(f"[预处理] 跳过中文文件并导出文本: {file_path.name} -> {translated_path.name}")
+        safe_delete(file_path)
+        evict_file_cache(file_path)
+    
+    def _delete_small_file(self, file_path: Path, char_count: int):
         """删除字符数不足的文件"""
-        char_count = count_file_characters(file_path)
         logger.info(
             f"[预处理] 删除文件（字符数 {char_count} < {CharLimits.MIN_FILE_CHARS}）: "
             f"{file_path.name}"
         )
         safe_delete(file_path)
+        evict_file_cache(file_path)
     
     def _delete_original_with_result(self, file_path: Path):
         """删除已有翻译结果的原文件"""
         logger.info(f"[预处理] 删除文件（已存在翻译结果）: {file_path.name}")
         safe_delete(file_path)
+        evict_file_cache(file_path)
     
     def log_stats(self):
         """记录统计信息"""
@@ -151,7 +324,7 @@ class FilePreprocessor:
         if self.stats.skipped_already_translated > 0:
             logger.info(f'  - 跳过已翻译文件: {self.stats.skipped_already_translated} 个')
         if self.stats.skipped_already_chinese > 0:
-            logger.info(f'  - 跳过中文文件: {self.stats.skipped_already_chinese} 个（不删除）')
+            logger.info(f'  - 跳过中文文件: {self.stats.skipped_already_chinese} 个（转为翻译结果）')
         if self.stats.skipped_char_too_few > 0:
             logger.info(
                 f'  - 删除字符数不足文件: {self.stats.skipped_char_too_few} 个'
@@ -17,9 +17,14 @@ from translation_app.core.config import TranslationDefaults
 logger = logging.getLogger('JobService')
 
 
-def run_single_file(source_file: str, provider: str = 'akashml') -> bool:
+def run_single_file(source_file: str, provider: str = 'akashml', balanced: bool = False) -> bool:
     """
     单文件翻译入口
+
+    Args:
+        source_file: 要翻译的文件路径
+        provider: 服务商选择
+        balanced: 是否启用均衡切割模式
     """
     provider_config = get_provider(provider)
 
@@ -49,7 +54,9 @@ def run_single_file(source_file: str, provider: str = 'akashml') -> bool:
         api_base_url=provider_config.api_base_url,
         model=provider_config.model,
         api_key=provider_config.api_key,
-        client_factory=build_openai_client
+        client_factory=build_openai_client,
+        balanced_chunks=balanced,
+        balance_tolerance=TranslationDefaults.CHUNK_BALANCE_TOLERANCE
     )
 
     translator = Translator(source_file, config)
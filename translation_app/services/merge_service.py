@@ -6,23 +6,64 @@
 提供文件扫描、合并、删除的编排逻辑
 """
 
+import codecs
+import io
+import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
-
-from translation_app.core.config import CharLimits, PathConfig
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple
+
+from translation_app.core.config import (
+    CharLimits,
+    ExtractionConfig,
+    FileFormats,
+    MergeConfig,
+    PathConfig,
+)
+from translation_app.core.text_encoding import detect_encoding, read_text_file
 from translation_app.domain.file_analyzer import count_chinese_characters
 from translation_app.domain.file_merger import FileMerger, MergeGroup
+from translation_app.domain.output_metadata import load_metadata, remove_metadata
 
 
 logger = logging.getLogger('MergeService')
 
 
+# 流式读取、复制时每次处理的字节数
+_COPY_BLOCK_BYTES = 1024 * 1024
+
+# 可以直接复制字节的编码（合并文件以 UTF-8 写入）
+_RAW_COPY_ENCODINGS = ('utf-8', 'utf-8-sig')
+
+# 合并文件中各文件内容之间的分隔
+_SEPARATOR = b'\n\n'
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """翻译结果文件的扫描结果（一次流式解码得到）"""
+
+    # 文件路径
+    path: Path
+
+    # 中文字符数
+    char_count: int
+
+    # 解码成功的编码
+    encoding: str
+
+    # 是否可以直接复制字节（UTF-8 编码且不含 \r，合并时无需再次解码和转换换行符）
+    raw_copy: bool
+
+
 def read_file_content(file_path: Path) -> Optional[str]:
     """
-    读取文件内容，自动尝试多种编码
+    读取文件内容，自动检测编码（只完整解码一次）
     
     Args:
         file_path: 文件路径
@@ -30,32 +71,89 @@ def read_file_content(file_path: Path) -> Optional[str]:
     Returns:
         文件内容，读取失败返回 None
     """
-    for encoding in ['utf-8', 'gbk', 'gb2312']:
+    return read_text_file(file_path)
+
+
+def _scan_with_encoding(file_path: Path, encoding: str) -> ScannedFile:
+    """按指定编码流式解码文件，同时统计中文字符数"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    char_count = 0
+    has_carriage_return = False
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(_COPY_BLOCK_BYTES)
+            text = decoder.decode(block, final=not block)
+            char_count += count_chinese_characters(text)
+            has_carriage_return = has_carriage_return or '\r' in text
+            if not block:
+                break
+
+    raw_copy = not has_carriage_return and codecs.lookup(encoding).name in _RAW_COPY_ENCODINGS
+    return ScannedFile(file_path, char_count, encoding, raw_copy)
+
+
+def scan_file(file_path: Path) -> Optional[ScannedFile]:
+    """
+    扫描一个翻译结果文件：检测编码并流式解码一次，统计中文字符数
+    
+    采样检测通过但全文解码失败时（采样之外存在非法字节），依次尝试其余候选编码
+    
+    Args:
+        file_path: 文件路径
+    
+    Returns:
+        ScannedFile: 扫描结果，所有候选编码都无法解码时返回 None
+    """
+    detected = detect_encoding(file_path)
+    if detected is None:
+        return None
+
+    encodings = [detected] + [e for e in FileFormats.TXT_ENCODINGS if e != detected]
+    for encoding in encodings:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            return _scan_with_encoding(file_path, encoding)
         except UnicodeDecodeError:
+            logger.debug(f"按 {encoding} 解码失败: {file_path.name}")
             continue
     return None
 
 
-def scan_and_filter_files(
-    files_dir: Path,
-    char_limit: int = None
-) -> List[Tuple[Path, int]]:
+def _scan_from_metadata(file_path: Path) -> Optional[ScannedFile]:
+    """根据保存翻译结果时写入的元数据得到扫描结果，元数据缺失或已过期时返回 None"""
+    metadata = load_metadata(file_path)
+    if metadata is None:
+        return None
+    return ScannedFile(
+        file_path,
+        metadata.chinese_chars,
+        'utf-8',
+        raw_copy=not metadata.has_carriage_return
+    )
+
+
+def _scan_or_none(file_path: Path) -> Optional[ScannedFile]:
+    """扫描文件，读取失败时记录日志并返回 None（在线程池中执行）"""
+    try:
+        scanned = scan_file(file_path)
+    except Exception as e:
+        logger.error(f"读取文件失败 {file_path.name}: {e}")
+        return None
+    if scanned is None:
+        logger.warning(f"无法读取文件（编码错误）: {file_path.name}")
+    return scanned
+
+
+def scan_translated_files(files_dir: Path, workers: Optional[int] = None) -> List[ScannedFile]:
     """
-    扫描目录，筛选符合条件的文件
+    扫描目录中的所有 *translated.txt 文件，多个线程并行读取
     
     Args:
         files_dir: 目录路径
-        char_limit: 字符数上限
+        workers: 读取线程数，默认 ExtractionConfig.MERGE_READ_WORKERS
     
     Returns:
-        [(文件路径, 中文字符数), ...] 列表
+        扫描结果列表（无法读取的文件不包含在内）
     """
-    if char_limit is None:
-        char_limit = CharLimits.SMALL_FILE_LIMIT
-
     logger.info(f"扫描目录: {files_dir}")
 
     if not files_dir.exists():
@@ -71,22 +169,44 @@ def scan_and_filter_files(
         logger.warning("未找到任何 translated.txt 文件")
         return []
 
-    # 统计每个文件的中文字符数
-    file_char_counts = []
-    for file_path in all_files:
-        try:
-            content = read_file_content(file_path)
-            if content is None:
-                logger.warning(f"无法读取文件（编码错误）: {file_path.name}")
-                continue
+    # 优先使用保存翻译结果时写入的元数据，无需读取文件
+    results = {file_path: _scan_from_metadata(file_path) for file_path in all_files}
+    missing = [file_path for file_path, scanned in results.items() if scanned is None]
+    if len(missing) < len(all_files):
+        logger.info(f"使用元数据: {len(all_files) - len(missing)}/{len(all_files)} 个文件")
+
+    # 其余文件读取并统计中文字符数（每个文件只解码一次，读取在多个线程中并行进行）
+    workers = max(1, min(workers or ExtractionConfig.MERGE_READ_WORKERS, len(missing)))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='merge-scan') as executor:
+            results.update(zip(missing, executor.map(_scan_or_none, missing)))
+    else:
+        results.update((file_path, _scan_or_none(file_path)) for file_path in missing)
 
-            char_count = count_chinese_characters(content)
-            file_char_counts.append((file_path, char_count))
-            logger.debug(f"{file_path.name}: {char_count} 个中文字符")
+    scanned_files = [results[file_path] for file_path in all_files if results[file_path] is not None]
+    for scanned in scanned_files:
+        logger.debug(f"{scanned.path.name}: {scanned.char_count} 个中文字符")
+    return scanned_files
 
-        except Exception as e:
-            logger.error(f"读取文件失败 {file_path.name}: {e}")
-            continue
+
+def filter_scanned_files(
+    scanned_files: List[ScannedFile],
+    char_limit: int = None
+) -> List[Tuple[Path, int]]:
+    """
+    筛选并排序扫描结果
+    
+    Args:
+        scanned_files: 扫描结果列表
+        char_limit: 字符数上限
+    
+    Returns:
+        [(文件路径, 中文字符数), ...] 列表
+    """
+    if char_limit is None:
+        char_limit = CharLimits.SMALL_FILE_LIMIT
+
+    file_char_counts = [(scanned.path, scanned.char_count) for scanned in scanned_files]
 
     # 使用 FileMerger 进行筛选和排序
     merger = FileMerger(merge_limit=CharLimits.MERGE_FILE_LIMIT)
@@ -100,18 +220,118 @@ def scan_and_filter_files(
     return filtered_files
 
 
+def scan_and_filter_files(
+    files_dir: Path,
+    char_limit: int = None
+) -> List[Tuple[Path, int]]:
+    """
+    扫描目录，筛选符合条件的文件
+    
+    Args:
+        files_dir: 目录路径
+        char_limit: 字符数上限
+    
+    Returns:
+        [(文件路径, 中文字符数), ...] 列表
+    """
+    return filter_scanned_files(scan_translated_files(files_dir), char_limit)
+
+
+def _copy_content(source: ScannedFile, output: BinaryIO):
+    """
+    将一个文件的内容以 UTF-8 流式写入合并文件
+    
+    UTF-8 且不含 \r 的文件直接复制字节（跳过 BOM），其余文件按扫描时的编码
+    分块解码、转换换行符后重新编码，内存占用与文件大小无关
+    """
+    with open(source.path, 'rb') as f:
+        if source.raw_copy:
+            if codecs.lookup(source.encoding).name == 'utf-8-sig' and f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                f.seek(0)
+            shutil.copyfileobj(f, output, _COPY_BLOCK_BYTES)
+            return
+
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(source.encoding)(),
+            translate=True
+        )
+        while True:
+            block = f.read(_COPY_BLOCK_BYTES)
+            output.write(decoder.decode(block, final=not block).encode('utf-8'))
+            if not block:
+                break
+
+
+def _write_group(group: MergeGroup, output_file: Path, sources: Mapping[Path, ScannedFile]):
+    """流式写入一个合并组（先写临时文件再原子替换），无法读取的文件跳过"""
+    temp_path = output_file.with_name(f"{output_file.name}.tmp")
+    try:
+        with open(temp_path, 'wb') as output:
+            written = 0
+            for file_path, _ in group.files:
+                source = sources.get(file_path) or scan_file(file_path)
+                if source is None:
+                    logger.warning(f"无法读取文件（跳过）: {file_path.name}")
+                    continue
+
+                start = output.tell()
+                try:
+                    if written:
+                        output.write(_SEPARATOR)
+                    _copy_content(source, output)
+                except (OSError, UnicodeDecodeError) as e:
+                    # 回退本文件已写入的部分
+                    output.seek(start)
+                    output.truncate()
+                    logger.warning(f"无法读取文件（跳过）: {file_path.name}: {e}")
+                    continue
+                written += 1
+        os.replace(temp_path, output_file)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+def _last_combined_file(output_dir: Path) -> Tuple[int, Optional[Path]]:
+    """
+    查找编号最大的合并文件
+
+    Returns:
+        (编号, 文件路径)，没有合并文件时为 (0, None)
+    """
+    last_index, last_path = 0, None
+    for path in output_dir.glob("combined_*.txt"):
+        suffix = path.stem[len("combined_"):]
+        if suffix.isdigit() and int(suffix) > last_index:
+            last_index, last_path = int(suffix), path
+    return last_index, last_path
+
+
+def _next_combined_index(output_dir: Path) -> int:
+    """
+    计算下一个合并文件的编号（已有 combined_N.txt 之后），避免多次合并时覆盖之前的结果
+    """
+    return _last_combined_file(output_dir)[0] + 1
+
+
 def merge_files(
     file_list: List[Tuple[Path, int]],
     output_dir: Path,
-    merge_limit: int = None
+    merge_limit: int = None,
+    sources: Optional[Mapping[Path, ScannedFile]] = None
 ) -> List[Path]:
     """
     按中文字数限制合并文件
     
+    各文件的内容流式复制到合并文件中，不在内存中拼接
+    
     Args:
         file_list: [(文件路径, 字符数), ...] 列表
         output_dir: 输出目录
         merge_limit: 合并字数限制
+        sources: 扫描结果（文件路径 -> ScannedFile），用于复用已检测的编码；
+                 缺失的文件在写入时重新检测
     
     Returns:
         生成的合并文件路径列表
@@ -139,22 +359,12 @@ def merge_files(
 
     # 写入合并文件
     merged_files = []
-    for index, group in enumerate(groups, start=1):
+    first_index = _next_combined_index(output_dir)
+    for index, group in enumerate(groups, start=first_index):
         output_file = output_dir / f"combined_{index}.txt"
         
         try:
-            # 读取组内所有文件内容
-            contents = []
-            for file_path, _ in group.files:
-                content = read_file_content(file_path)
-                if content is not None:
-                    contents.append(content)
-                else:
-                    logger.warning(f"无法读取文件（跳过）: {file_path.name}")
-            
-            # 写入合并文件
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n\n'.join(contents))
+            _write_group(group, output_file, sources or {})
 
             logger.info(
                 f"生成: {output_file.name} "
@@ -171,6 +381,231 @@ def merge_files(
     return merged_files
 
 
+class MergeState:
+    """
+    增量合并状态
+
+    在合并输出目录的状态文件中记录每个合并文件当前的中文字数和字节数，以及已追加的原文件
+    （路径、大小和修改时间）。追加中途中断时，文件大小会超过记录值，下次追加前截断回记录值，
+    丢弃写了一半的内容（原文件尚未记录为已追加，下次合并会重新追加）；已记录的原文件
+    即使因中断或保留原文件而仍在目录中，也不会被再次追加
+    """
+
+    def __init__(self, output_dir: Path):
+        """
+        初始化状态（从磁盘加载）
+
+        Args:
+            output_dir: 合并输出目录
+        """
+        self.output_dir = output_dir
+        self.path = output_dir / MergeConfig.STATE_FILE_NAME
+        self.files, self.appended = self._load()
+
+    def _load(self) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, int]]]:
+        """读取状态文件，不存在或损坏时返回空状态"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return dict(data.get('files', {})), dict(data.get('appended', {}))
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"增量合并状态文件损坏，重新统计: {e}")
+            return {}, {}
+
+    def save(self):
+        """以原子方式写入状态文件（只保留仍然存在的合并文件和原文件）"""
+        files = {
+            name: record for name, record in self.files.items()
+            if (self.output_dir / name).exists()
+        }
+        appended = {
+            path: record for path, record in self.appended.items()
+            if os.path.exists(path)
+        }
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'files': files, 'appended': appended}, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+        self.files = files
+        self.appended = appended
+
+    def record(self, output_file: Path, char_count: int):
+        """记录合并文件当前的中文字数和字节数"""
+        self.files[output_file.name] = {
+            'chars': char_count,
+            'size': output_file.stat().st_size,
+        }
+
+    @staticmethod
+    def _source_key(file_path: Path) -> str:
+        return os.path.abspath(file_path)
+
+    def record_source(self, file_path: Path):
+        """记录原文件已追加（大小和修改时间用于判断之后是否被修改）"""
+        stat = file_path.stat()
+        self.appended[self._source_key(file_path)] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def was_appended(self, file_path: Path) -> bool:
+        """原文件是否已追加过且之后未被修改"""
+        record = self.appended.get(self._source_key(file_path))
+        if record is None:
+            return False
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == record['size'] and stat.st_mtime_ns == record['mtime_ns']
+
+    def open_tail(self) -> Tuple[Optional[Path], int]:
+        """
+        找到最后一个合并文件及其当前中文字数
+
+        文件大小超过记录值时截断回记录值（上次追加中断）；没有记录或文件被外部修改时重新统计字数
+
+        Returns:
+            (文件路径, 中文字数)，没有合并文件时为 (None, 0)
+        """
+        _, tail = _last_combined_file(self.output_dir)
+        if tail is None:
+            return None, 0
+
+        record = self.files.get(tail.name)
+        size = tail.stat().st_size
+        if record is not None and size > record['size']:
+            logger.warning(f"{tail.name} 上次追加未完成，丢弃未完成的部分")
+            with open(tail, 'r+b') as f:
+                f.truncate(record['size'])
+            size = record['size']
+
+        if record is None or size != record['size']:
+            scanned = scan_file(tail)
+            if scanned is None:
+                # 无法读取已有的合并文件时不再向其追加
+                return None, 0
+            self.record(tail, scanned.char_count)
+        return tail, self.files[tail.name]['chars']
+
+
+def append_files(
+    file_list: List[Tuple[Path, int]],
+    output_dir: Path,
+    merge_limit: int = None,
+    sources: Optional[Mapping[Path, ScannedFile]] = None,
+    delete_originals: bool = False,
+    backup: bool = False
+) -> Tuple[List[Path], List[Tuple[Path, int]]]:
+    """
+    增量合并：将文件依次追加到最后一个未满的合并文件，写满后新建下一个合并文件
+
+    之前的合并文件不会被重写；每追加一个文件就更新一次状态文件（同时记录该原文件已追加），
+    随后立即删除原文件。中途中断时，已追加的原文件不会在下次合并时重复追加
+
+    Args:
+        file_list: [(文件路径, 字符数), ...] 列表
+        output_dir: 输出目录
+        merge_limit: 合并字数限制
+        sources: 扫描结果（文件路径 -> ScannedFile），缺失的文件在写入时重新检测
+        delete_originals: 每个文件追加成功后是否立即删除原文件（连同其元数据）
+        backup: 删除原文件时是否备份
+
+    Returns:
+        (写入过的合并文件路径列表, 成功追加的 [(文件路径, 字符数), ...] 列表)
+    """
+    if merge_limit is None:
+        merge_limit = CharLimits.MERGE_FILE_LIMIT
+    sources = sources or {}
+
+    if not file_list:
+        logger.warning("没有文件需要合并")
+        return [], []
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = MergeState(output_dir)
+    target, total = state.open_tail()
+
+    touched: List[Path] = []
+    appended: List[Tuple[Path, int]] = []
+    for file_path, char_count in file_list:
+        if state.was_appended(file_path):
+            # 上次合并已追加，但在删除原文件前中断（或保留了原文件）
+            logger.info(f"已追加过（跳过）: {file_path.name}")
+            if delete_originals:
+                delete_original_files(file_list=[(file_path, char_count)], backup=backup)
+            continue
+
+        if target is None or (total > 0 and total + char_count > merge_limit):
+            target = output_dir / f"combined_{_next_combined_index(output_dir)}.txt"
+            total = 0
+
+        source = sources.get(file_path) or scan_file(file_path)
+        if source is None:
+            logger.warning(f"无法读取文件（跳过）: {file_path.name}")
+            continue
+
+        with open(target, 'ab') as output:
+            start = output.tell()
+            try:
+                if start:
+                    output.write(_SEPARATOR)
+                _copy_content(source, output)
+            except (OSError, UnicodeDecodeError) as e:
+                output.seek(start)
+                output.truncate()
+                logger.warning(f"无法读取文件（跳过）: {file_path.name}: {e}")
+                failed = True
+            else:
+                failed = False
+
+        if failed:
+            # 不留下空的合并文件
+            if start == 0:
+                target.unlink()
+                target = None
+            continue
+
+        total += char_count
+        state.record(target, total)
+        state.record_source(file_path)
+        state.save()
+        appended.append((file_path, char_count))
+        if target not in touched:
+            touched.append(target)
+        logger.info(f"追加: {file_path.name} -> {target.name} (+{char_count:,} 字, 共 {total:,} 字)")
+        if delete_originals:
+            delete_original_files(file_list=[(file_path, char_count)], backup=backup)
+
+    return touched, appended
+
+
+def merge_file_incrementally(file_path: Path, delete_original: bool = True) -> bool:
+    """
+    将单个翻译结果立即增量合并到同目录的 combined/ 中（用于每个文件翻译完成后立即合并）
+
+    中文字数达到 CharLimits.SMALL_FILE_LIMIT 的文件不合并，保持原样
+
+    Args:
+        file_path: 翻译结果文件路径
+        delete_original: 合并成功后是否删除该文件
+
+    Returns:
+        是否已合并
+    """
+    file_path = Path(file_path)
+    scanned = _scan_or_none(file_path)
+    if scanned is None or scanned.char_count >= CharLimits.SMALL_FILE_LIMIT:
+        return False
+
+    _, appended = append_files(
+        [(file_path, scanned.char_count)],
+        output_dir=file_path.parent / "combined",
+        sources={file_path: scanned},
+        delete_originals=delete_original
+    )
+    return bool(appended)
+
+
 def delete_original_files(
     file_list: List[Tuple[Path, int]],
     backup: bool = True
@@ -214,11 +649,12 @@ def delete_original_files(
             logger.warning("备份失败，取消删除操作")
             return {}
 
-    # 删除文件
+    # 删除文件（连同其元数据）
     delete_results = {}
     for file_path, _ in file_list:
         try:
             file_path.unlink()
+            remove_metadata(file_path)
             delete_results[file_path.name] = True
             logger.info(f"已删除: {file_path.name}")
         except Exception as e:
@@ -234,7 +670,8 @@ def delete_original_files(
 def merge_entrance(
     files_dir: str = "files",
     delete_originals: bool = True,
-    backup: bool = False
+    backup: bool = False,
+    incremental: Optional[bool] = None
 ):
     """
     合并服务入口：扫描 → 筛选 → 合并 → 删除（可选）
@@ -243,7 +680,11 @@ def merge_entrance(
         files_dir: 文件目录
         delete_originals: 是否删除原文件
         backup: 是否备份原文件
+        incremental: 是否增量合并（追加到最后一个未满的合并文件），默认 MergeConfig.INCREMENTAL
     """
+    if incremental is None:
+        incremental = MergeConfig.INCREMENTAL
+
     logger.info("=" * 80)
     logger.info("文档合并服务启动")
     logger.info("=" * 80)
@@ -251,10 +692,11 @@ def merge_entrance(
     files_path = Path(files_dir)
     output_path = files_path / "combined"
 
-    # 步骤1：扫描并筛选文件
+    # 步骤1：扫描并筛选文件（每个文件只解码一次，合并时复用扫描到的编码）
     logger.info("\n步骤 1/4: 扫描并筛选文件")
-    filtered_files = scan_and_filter_files(
-        files_dir=files_path,
+    scanned_files = scan_translated_files(files_path)
+    filtered_files = filter_scanned_files(
+        scanned_files,
         char_limit=CharLimits.SMALL_FILE_LIMIT
     )
 
@@ -263,12 +705,28 @@ def merge_entrance(
         return
 
     # 步骤2：合并文件
-    logger.info("\n步骤 2/4: 合并文件")
-    merged_files = merge_files(
-        file_list=filtered_files,
-        output_dir=output_path,
-        merge_limit=CharLimits.MERGE_FILE_LIMIT
-    )
+    logger.info("\n步骤 2/4: 合并文件" + ("（增量）" if incremental else ""))
+    sources = {scanned.path: scanned for scanned in scanned_files}
+    if incremental:
+        # 每个文件追加成功后立即删除（或备份后删除），中断时不会留下已追加的原文件
+        merged_files, filtered_files = append_files(
+            file_list=filtered_files,
+            output_dir=output_path,
+            merge_limit=CharLimits.MERGE_FILE_LIMIT,
+            sources=sources,
+            delete_originals=delete_originals,
+            backup=backup
+        )
+        if not merged_files:
+            logger.info("没有新的文件需要追加，程序结束")
+            return
+    else:
+        merged_files = merge_files(
+            file_list=filtered_files,
+            output_dir=output_path,
+            merge_limit=CharLimits.MERGE_FILE_LIMIT,
+            sources=sources
+        )
 
     if not merged_files:
         logger.error("文件合并失败，程序结束")
@@ -283,8 +741,10 @@ def merge_entrance(
     for merged_file in merged_files:
         logger.info(f"  - {merged_file}")
 
-    # 步骤4：删除原文件（可选）
-    if delete_originals:
+    # 步骤4：删除原文件（可选，增量合并已在追加后逐个删除）
+    if incremental:
+        logger.info("\n步骤 4/4: 原文件已在追加后逐个" + ("删除" if delete_originals else "保留"))
+    elif delete_originals:
         logger.info("\n步骤 4/4: 删除原文件")
         delete_original_files(file_list=filtered_files, backup=backup)
     else:
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 任务服务
+
+常驻进程，在本机提供 HTTP 接口接收翻译任务（上传文件、服务器上的文件路径或直接提交文本）：
+- 所有任务共享预热的 API 客户端（每个服务商一个）和同一个并发请求上限
+- 同时运行的任务数有上限，其余任务排队
+- 可查询每个任务的进度（已完成的文本块数、预计剩余时间）、取消任务、下载翻译结果
+
+接口（请求和响应均为 JSON，下载结果除外）：
+    POST   /jobs                 提交任务，JSON 请求体 {"path" | "text", "filename", "provider"}，
+                                 或以请求体上传文件：POST /jobs?filename=a.pdf&provider=deepseek
+    GET    /jobs                 列出所有任务
+    GET    /jobs/<id>            查询任务状态和进度
+    GET    /jobs/<id>/result     下载翻译结果（text/plain; charset=utf-8）
+    DELETE /jobs/<id>            取消未完成的任务，或删除已结束的任务及其文件
+    GET    /health               服务状态
+
+服务没有鉴权，默认只监听 127.0.0.1；按路径提交的文件必须位于 ServeConfig.PATH_ROOT
+（默认为工作目录）之内（解析符号链接后判断，相对路径相对于该目录），其他路径返回 403。
+任务列表只保存在内存中，重启后丢失
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from translation_app.core.config import FileFormats, PathConfig, ServeConfig, TranslationDefaults
+from translation_app.core.providers import get_provider
+from translation_app.core.translate_config import TranslateConfig
+from translation_app.domain.extraction_cache import evict_file_cache
+from translation_app.domain.translator import Translator
+from translation_app.infra.openai_client import (
+    build_openai_client,
+    limited_client_factory,
+    shared_client_factory
+)
+from translation_app.services.batch_service import build_batch_config
+from translation_app.services.watch_service import install_stop_handlers
+
+
+logger = logging.getLogger('ServeService')
+
+
+# 任务状态
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+# 已结束的任务状态
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+# 任务来源
+SOURCE_UPLOAD = 'upload'
+SOURCE_PATH = 'path'
+SOURCE_TEXT = 'text'
+
+# 读写请求体和结果文件的块大小
+_COPY_BLOCK_BYTES = 1024 * 1024
+
+
+class JobError(Exception):
+    """任务请求错误，携带返回给客户端的 HTTP 状态码"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class TranslationJob:
+    """一个翻译任务"""
+
+    # 任务 ID
+    id: str
+
+    # 任务来源（upload、path、text）
+    source: str
+
+    # 任务目录中的源文件名
+    filename: str
+
+    # 服务商
+    provider: str
+
+    # 任务目录（源文件和翻译结果都在其中）
+    job_dir: Path
+
+    state: str = JOB_QUEUED
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    # 运行中的翻译器（用于查询进度和取消）
+    translator: Optional[Translator] = None
+
+    # 翻译结果文件
+    result_path: Optional[Path] = None
+
+    # 在线程池中的任务
+    future: Optional[Future] = None
+
+    # 取消请求（翻译器创建前收到的取消也能生效）
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """任务状态快照，用于 JSON 响应"""
+        data: Dict[str, Any] = {
+            'id': self.id,
+            'state': self.state,
+            'source': self.source,
+            'filename': self.filename,
+            'provider': self.provider,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error,
+            'progress': None,
+            'result': f'/jobs/{self.id}/result' if self.state == JOB_SUCCEEDED else None,
+        }
+        translator = self.translator
+        if translator is not None:
+            progress = translator.progress()
+            data['progress'] = {
+                'chunks_done': progress.completed,
+                'chunks_total': progress.total,
+                'total_known': progress.total_known,
+                'chunks_failed': progress.failed,
+                'elapsed': round(progress.elapsed, 1),
+                'eta': None if progress.eta is None else round(progress.eta, 1),
+            }
+        return data
+
+
+def _safe_filename(filename: str) -> str:
+    """只保留文件名部分，防止写到任务目录之外"""
+    name = os.path.basename(filename.replace('\\', '/')).strip()
+    if name in ('', '.', '..'):
+        raise JobError(HTTPStatus.BAD_REQUEST, '文件名无效')
+    return name
+
+
+def _check_extension(filename: str):
+    """检查文件格式是否支持"""
+    suffix = Path(filename).suffix.lower()
+    if suffix not in FileFormats.SUPPORTED_EXTENSIONS:
+        raise JobError(
+            HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            f"不支持的文件格式: {suffix or '(无扩展名)'}，支持的格式: {', '.join(FileFormats.SUPPORTED_EXTENSIONS)}"
+        )
+
+
+class JobManager:
+    """任务管理：保存任务表，在线程池中运行翻译，所有任务共享客户端和并发上限"""
+
+    def __init__(
+        self,
+        max_jobs: int = ServeConfig.MAX_JOBS,
+        max_concurrency: int = ServeConfig.MAX_CONCURRENCY,
+        job_dir: Optional[Path] = None,
+        path_root: Optional[Path] = None
+    ):
+        """
+        初始化任务管理器
+
+        Args:
+            max_jobs: 同时运行的任务数
+            max_concurrency: 所有任务共享的 API 并发请求数上限
+            job_dir: 任务目录，默认 PathConfig.JOB_DIR
+            path_root: 按路径提交任务时允许访问的目录，默认 ServeConfig.PATH_ROOT（未设置时为工作目录）
+        """
+        self.job_dir = Path(job_dir) if job_dir else PathConfig.JOB_DIR
+        self.path_root = Path(path_root or ServeConfig.PATH_ROOT or PathConfig.WORK_DIR).expanduser().resolve()
+        self.max_jobs = max(1, max_jobs)
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_jobs, thread_name_prefix='job')
+        self._jobs: Dict[str, TranslationJob] = {}
+        self._configs: Dict[str, TranslateConfig] = {}
+        self._lock = threading.Lock()
+
+    def _get_config(self, provider: str) -> TranslateConfig:
+        """
+        获取服务商的翻译配置，同一服务商的所有任务共享一个客户端
+
+        Raises:
+            JobError: 不支持的服务商或 API Key 未设置
+        """
+        provider = provider.lower()
+        with self._lock:
+            config = self._configs.get(provider)
+            if config is not None:
+                return config
+            try:
+                get_provider(provider)
+            except ValueError as e:
+                raise JobError(HTTPStatus.BAD_REQUEST, str(e))
+            config = build_batch_config(
+                provider,
+                client_factory=shared_client_factory(limited_client_factory(build_openai_client, self._slots))
+            )
+            self._configs[provider] = config
+            return config
+
+    def _new_job(self, source: str, filename: str, provider: str) -> TranslationJob:
+        """创建任务及其目录"""
+        filename = _safe_filename(filename)
+        _check_extension(filename)
+        # 提前校验服务商，无效时不创建任务目录
+        self._get_config(provider)
+
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = self.job_dir / job_id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        return TranslationJob(job_id, source, filename, provider.lower(), job_dir)
+
+    def submit_upload(self, filename: str, stream: BinaryIO, length: int, provider: str) -> TranslationJob:
+        """
+        提交上传的文件
+
+        Args:
+            filename: 文件名（决定文件格式）
+            stream: 请求体
+            length: 请求体长度
+            provider: 服务商
+
+        Returns:
+            新建的任务
+        """
+        job = self._new_job(SOURCE_UPLOAD, filename, provider)
+        target = job.job_dir / job.filename
+        try:
+            remaining = length
+            with open(target, 'wb') as f:
+                while remaining > 0:
+                    block = stream.read(min(_COPY_BLOCK_BYTES, remaining))
+                    if not block:
+                        raise JobError(HTTPStatus.BAD_REQUEST, '上传内容不完整')
+                    f.write(block)
+                    remaining -= len(block)
+        except BaseException:
+            shutil.rmtree(job.job_dir, ignore_errors=True)
+            raise
+        return self._enqueue(job)
+
+    def submit_path(self, path: str, provider: str) -> TranslationJob:
+        """
+        提交服务器上已有的文件（不修改、不删除原文件）
+
+        Args:
+            path: 文件路径（必须位于 path_root 之内，相对路径相对于 path_root）
+            provider: 服务商
+
+        Returns:
+            新建的任务
+
+        Raises:
+            JobError: 文件位于 path_root 之外（403）或不存在（404）
+        """
+        # 先解析符号链接和 ..，再判断是否位于允许的目录内（目录外的文件不暴露是否存在）
+        source = (self.path_root / Path(path).expanduser()).resolve()
+        if not source.is_relative_to(self.path_root):
+            raise JobError(HTTPStatus.FORBIDDEN, f'只能提交 {self.path_root} 之内的文件: {path}')
+        if not source.is_file():
+            raise JobError(HTTPStatus.NOT_FOUND, f'文件不存在: {path}')
+        job = self._new_job(SOURCE_PATH, source.name, provider)
+        target = job.job_dir / job.filename
+        try:
+            # 优先创建符号链接，避免复制大文件
+            target.symlink_to(source)
+        except OSError:
+            shutil.copyfile(source, target)
+        return self._enqueue(job)
+
+    def submit_text(self, text: str, filename: str, provider: str) -> TranslationJob:
+        """
+        提交文本
+
+        Args:
+            text: 要翻译的文本
+            filename: 保存文本使用的文件名（默认 text.txt，扩展名必须为 .txt）
+            provider: 服务商
+
+        Returns:
+            新建的任务
+        """
+        if not text.strip():
+            raise JobError(HTTPStatus.BAD_REQUEST, '文本为空')
+        filename = filename or 'text.txt'
+        if Path(filename).suffix.lower() != '.txt':
+            filename = f'{filename}.txt'
+        job = self._new_job(SOURCE_TEXT, filename, provider)
+        (job.job_dir / job.filename).write_text(text, encoding='utf-8')
+        return self._enqueue(job)
+
+    def _enqueue(self, job: TranslationJob) -> TranslationJob:
+        with self._lock:
+            self._jobs[job.id] = job
+            job.future = self._executor.submit(self._run, job)
+        logger.info(f'[服务] 新任务 {job.id}: {job.filename} ({job.source}, {job.provider})')
+        return job
+
+    def _run(self, job: TranslationJob):
+        """在线程池中执行任务"""
+        if job.cancel_requested.is_set():
+            job.state = JOB_CANCELLED
+            job.finished_at = time.time()
+            return
+        job.state = JOB_RUNNING
+        job.started_at = time.time()
+        logger.info(f'[服务] 任务 {job.id} 开始: {job.filename}')
+
+        source_path = job.job_dir / job.filename
+        try:
+            translator = Translator(job.filename, self._get_config(job.provider), work_dir=str(job.job_dir))
+            job.translator = translator
+            if job.cancel_requested.is_set():
+                translator.cancel()
+
+            succeeded = translator.run()
+            if translator.cancelled:
+                job.state = JOB_CANCELLED
+            elif succeeded and translator.output_txt.exists():
+                job.result_path = translator.output_txt
+                job.state = JOB_SUCCEEDED
+            else:
+                job.state = JOB_FAILED
+                job.error = '翻译失败，详见服务日志'
+        except Exception as e:
+            logger.error(f'[服务] 任务 {job.id} 异常: {e}')
+            job.state = JOB_FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            evict_file_cache(source_path)
+
+        logger.info(f'[服务] 任务 {job.id} 结束: {job.state} ({job.finished_at - job.started_at:.1f}s)')
+
+    def get(self, job_id: str) -> TranslationJob:
+        """
+        获取任务
+
+        Raises:
+            JobError: 任务不存在
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobError(HTTPStatus.NOT_FOUND, f'任务不存在: {job_id}')
+        return job
+
+    def list_jobs(self) -> List[TranslationJob]:
+        """按创建时间排序的所有任务"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at)
+
+    def cancel(self, job_id: str) -> TranslationJob:
+        """
+        取消未结束的任务：排队中的任务直接取消，运行中的任务停止提交文本块，不保存结果
+
+        Returns:
+            被取消的任务（运行中的任务状态在翻译器退出后才变为 cancelled）
+        """
+        job = self.get(job_id)
+        job.cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            job.state = JOB_CANCELLED
+            job.finished_at = time.time()
+        elif job.translator is not None:
+            job.translator.cancel()
+        logger.info(f'[服务] 请求取消任务 {job.id}')
+        return job
+
+    def remove(self, job_id: str):
+        """删除已结束的任务及其目录"""
+        job = self.get(job_id)
+        if job.state not in FINISHED_STATES:
+            raise JobError(HTTPStatus.CONFLICT, f'任务尚未结束: {job_id}')
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        shutil.rmtree(job.job_dir, ignore_errors=True)
+        logger.info(f'[服务] 已删除任务 {job.id}')
+
+    def counts(self) -> Dict[str, int]:
+        """各状态的任务数"""
+        counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING) + FINISHED_STATES}
+        for job in self.list_jobs():
+            counts[job.state] += 1
+        return counts
+
+    def shutdown(self):
+        """取消所有未结束的任务并等待运行中的任务退出"""
+        for job in self.list_jobs():
+            if job.state not in FINISHED_STATES:
+                self.cancel(job.id)
+        self._executor.shutdown(wait=True)
+
+
+class JobServer(ThreadingHTTPServer):
+    """HTTP 服务器，持有任务管理器"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], manager: JobManager, default_provider: str = 'akashml'):
+        super().__init__(address, JobRequestHandler)
+        self.manager = manager
+        self.default_provider = default_provider
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """任务接口的请求处理"""
+
+    server: JobServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args):
+        logger.debug(f'[服务] {self.address_string()} {format % args}')
+
+    def _send_json(self, status: HTTPStatus, payload: Any, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self) -> Tuple[List[str], Dict[str, str]]:
+        """解析路径和查询参数"""
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        return parts, query
+
+    def _handle(self, method: str):
+        try:
+            parts, query = self._route()
+            if method == 'GET' and parts == ['health']:
+                self._send_json(HTTPStatus.OK, {'status': 'ok', 'jobs': self.server.manager.counts()})
+            elif parts[:1] != ['jobs'] or len(parts) > 3:
+                raise JobError(HTTPStatus.NOT_FOUND, f'未知路径: {self.path}')
+            elif method == 'POST' and len(parts) == 1:
+                self._submit(query)
+            elif method == 'GET' and len(parts) == 1:
+                self._send_json(HTTPStatus.OK, [job.to_dict() for job in self.server.manager.list_jobs()])
+            elif method == 'GET' and len(parts) == 2:
+                self._send_json(HTTPStatus.OK, self.server.manager.get(parts[1]).to_dict())
+            elif method == 'GET' and parts[2:] == ['result']:
+                self._send_result(parts[1])
+            elif method == 'DELETE' and len(parts) == 2:
+                self._delete(parts[1])
+            else:
+                raise JobError(HTTPStatus.METHOD_NOT_ALLOWED, f'不支持的请求: {method} {self.path}')
+        except JobError as e:
+            # 未读取的请求体会破坏长连接，出错时关闭连接
+            self.close_connection = True
+            self._send_json(e.status, {'error': str(e)})
+        except Exception as e:
+            logger.error(f'[服务] 处理请求失败: {method} {self.path}, 错误: {e}')
+            self.close_connection = True
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def _content_length(self) -> int:
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            raise JobError(HTTPStatus.LENGTH_REQUIRED, '缺少 Content-Length')
+        if length > ServeConfig.MAX_UPLOAD_BYTES:
+            raise JobError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f'请求体超过上限 {ServeConfig.MAX_UPLOAD_BYTES} 字节')
+        return length
+
+    def _submit(self, query: Dict[str, str]):
+        """POST /jobs：JSON 请求体提交路径或文本，其他类型的请求体视为上传的文件"""
+        manager = self.server.manager
+        length = self._content_length()
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+
+        if content_type == 'application/json':
+            try:
+                payload = json.loads(self.rfile.read(length).decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise JobError(HTTPStatus.BAD_REQUEST, f'请求体不是有效的 JSON: {e}')
+            if not isinstance(payload, dict):
+                raise JobError(HTTPStatus.BAD_REQUEST, '请求体必须是 JSON 对象')
+            provider = payload.get('provider') or self.server.default_provider
+            if payload.get('path'):
+                job = manager.submit_path(str(payload['path']), provider)
+            elif isinstance(payload.get('text'), str):
+                job = manager.submit_text(payload['text'], str(payload.get('filename') or ''), provider)
+            else:
+                raise JobError(HTTPStatus.BAD_REQUEST, '请求体需要包含 path 或 text')
+        else:
+            filename = query.get('filename')
+            if not filename:
+                raise JobError(HTTPStatus.BAD_REQUEST, '上传文件需要 filename 参数')
+            provider = query.get('provider') or self.server.default_provider
+            job = manager.submit_upload(filename, self.rfile, length, provider)
+
+        self._send_json(HTTPStatus.ACCEPTED, job.to_dict(), {'Location': f'/jobs/{job.id}'})
+
+    def _send_result(self, job_id: str):
+        """GET /jobs/<id>/result：分块发送翻译结果"""
+        job = self.server.manager.get(job_id)
+        if job.state != JOB_SUCCEEDED or job.result_path is None:
+            raise JobError(HTTPStatus.CONFLICT, f'任务没有可下载的结果（状态: {job.state}）')
+        try:
+            f = open(job.result_path, 'rb')
+        except OSError:
+            raise JobError(HTTPStatus.GONE, '结果文件已被删除')
+        with f:
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile, _COPY_BLOCK_BYTES)
+
+    def _delete(self, job_id: str):
+        """DELETE /jobs/<id>：取消未结束的任务，删除已结束的任务"""
+        manager = self.server.manager
+        job = manager.get(job_id)
+        if job.state in FINISHED_STATES:
+            manager.remove(job_id)
+            self._send_json(HTTPStatus.OK, {'id': job_id, 'deleted': True})
+        else:
+            self._send_json(HTTPStatus.ACCEPTED, manager.cancel(job_id).to_dict())
+
+
+def serve(
+    host: str = ServeConfig.HOST,
+    port: int = ServeConfig.PORT,
+    provider: str = 'akashml',
+    max_jobs: int = ServeConfig.MAX_JOBS,
+    max_concurrency: int = ServeConfig.MAX_CONCURRENCY,
+    stop_event: Optional[threading.Event] = None
+):
+    """
+    启动 HTTP 任务服务，直到收到 SIGTERM/SIGINT（或 stop_event 被设置）
+
+    Args:
+        host: 监听地址
+        port: 监听端口（0 表示随机端口）
+        provider: 请求未指定服务商时使用的默认服务商
+        max_jobs: 同时运行的任务数
+        max_concurrency: 所有任务共享的 API 并发请求数上限
+        stop_event: 可选的停止事件，默认在收到 SIGTERM/SIGINT 时停止
+    """
+    PathConfig.ensure_dirs()
+    manager = JobManager(max_jobs, max_concurrency)
+    server = JobServer((host, port), manager, default_provider=provider)
+
+    if stop_event is None:
+        stop_event = threading.Event()
+        install_stop_handlers(stop_event)
+
+    server_thread = threading.Thread(target=server.serve_forever, name='job-server', daemon=True)
+    server_thread.start()
+
+    logger.info('=' * 60)
+    logger.info(f'[服务] 任务服务已启动: http://{host}:{server.server_address[1]}')
+    logger.info(
+        f'[服务] 同时运行任务数: {manager.max_jobs}，共享并发请求数: {manager.max_concurrency}，'
+        f'每个任务线程数: {TranslationDefaults.BATCH_MAX_WORKERS}'
+    )
+    logger.info(f'[服务] 任务目录: {manager.job_dir}，可按路径提交的目录: {manager.path_root}')
+    logger.info('=' * 60)
+
+    try:
+        stop_event.wait()
+    finally:
+        logger.info('[服务] 正在停止：取消未完成的任务')
+        server.shutdown()
+        server.server_close()
+        manager.shutdown()
+        logger.info('[服务] 任务服务已停止')
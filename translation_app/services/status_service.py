@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+工作目录状态查询服务
+
+只读取工作目录清单（.manifest.json），不扫描、不解析目录中的文件
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from translation_app.core.config import PathConfig
+from translation_app.domain.work_manifest import (
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SKIPPED,
+    WorkManifest,
+)
+
+
+# 状态显示名称
+_STATUS_LABELS = {
+    STATUS_PENDING: '待翻译',
+    STATUS_FAILED: '翻译失败',
+    STATUS_SKIPPED: '已跳过',
+}
+
+
+def query_status(files_dir: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    按处理状态查询清单中的文件
+
+    Args:
+        files_dir: 工作目录，默认 PathConfig.WORK_DIR
+
+    Returns:
+        {状态: [文件名, ...]} 字典
+    """
+    manifest = WorkManifest(Path(files_dir) if files_dir else PathConfig.WORK_DIR, enabled=True)
+    return {status: manifest.names_with_status(status) for status in _STATUS_LABELS}
+
+
+def print_status(files_dir: Optional[str] = None, verbose: bool = False):
+    """
+    打印工作目录的处理状态
+
+    Args:
+        files_dir: 工作目录，默认 PathConfig.WORK_DIR
+        verbose: 是否列出每个状态下的文件名
+    """
+    for status, names in query_status(files_dir).items():
+        print(f"{_STATUS_LABELS[status]}: {len(names)}")
+        if verbose:
+            for name in names:
+                print(f"  - {name}")
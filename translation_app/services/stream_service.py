@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+管道翻译服务
+
+从标准输入读取文本，边读取边切割、翻译，按原文顺序把译文写到标准输出，用于 Unix 管道：
+
+    pdftotext book.pdf - | translate stream | gzip > book.zh.txt.gz
+
+- 输入按段落边界增量解码，凑满一个文本块即提交翻译，不等待输入结束；
+  没有换行的长行在句子边界处切分
+- 开头连续的文本块都翻译完成时立即输出并刷新，在途文本块有上限，内存占用与输入长度无关
+- 日志写到标准错误，标准输出只包含译文
+"""
+
+import logging
+from typing import BinaryIO, Iterator, Optional
+
+from translation_app.core.config import TranslationDefaults
+from translation_app.core.text_encoding import iter_decoded_segments
+from translation_app.domain.translator import TranslationEngine
+from translation_app.services.batch_service import build_batch_config
+
+
+logger = logging.getLogger('StreamService')
+
+
+# 每次从输入读取的最大字节数
+_READ_BLOCK_BYTES = 64 * 1024
+
+# 译文文本块之间的分隔（与文件翻译结果一致）
+_CHUNK_SEPARATOR = '\n\n'
+
+
+def _iter_input_blocks(stream: BinaryIO) -> Iterator[bytes]:
+    """读取输入：有数据就立即返回，不等待读满一整块（上游输出较慢时也能尽早开始翻译）"""
+    read = getattr(stream, 'read1', stream.read)
+    while True:
+        block = read(_READ_BLOCK_BYTES)
+        if not block:
+            return
+        yield block
+
+
+def stream_translate(
+    input_stream: BinaryIO,
+    output_stream: BinaryIO,
+    provider: str = 'akashml',
+    balanced: bool = False,
+    encoding: str = 'utf-8',
+    window: Optional[int] = None
+) -> bool:
+    """
+    翻译输入流并按原文顺序写出译文
+
+    Args:
+        input_stream: 输入字节流（如 sys.stdin.buffer）
+        output_stream: 输出字节流（如 sys.stdout.buffer），译文以 UTF-8 写出
+        provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        encoding: 输入编码
+        window: 在途文本块上限，默认为线程数的 2 倍
+
+    Returns:
+        是否全部翻译成功（有文本块最终失败时，输出中保留带标记的原文并返回 False）
+
+    Raises:
+        BrokenPipeError: 下游提前关闭（翻译随即停止）
+    """
+    config = build_batch_config(provider, balanced, TranslationDefaults.BATCH_SUBMISSION_POLICY)
+    engine = TranslationEngine(config)
+
+    # 段落不超过一个文本块，切割器凑满文本块即可提交，无需读入更多输入；
+    # 没有换行的输入（如压缩成一行的文本）超过两个文本块时在句子边界处切分，不等待输入结束
+    segments = iter_decoded_segments(
+        _iter_input_blocks(input_stream),
+        encoding,
+        config.chunk_size,
+        max_line_chars=2 * config.chunk_size
+    )
+    translated_chunks = engine.iter_translate_pages(segments, window)
+
+    written = 0
+    try:
+        for translated_chunk in translated_chunks:
+            if written:
+                output_stream.write(_CHUNK_SEPARATOR.encode('utf-8'))
+            output_stream.write(translated_chunk.encode('utf-8'))
+            output_stream.flush()
+            written += 1
+        if written:
+            output_stream.write(b'\n')
+            output_stream.flush()
+    except BaseException:
+        # 下游关闭、解码失败或被中断时，停止提交并取消尚未开始的文本块
+        engine.cancel()
+        translated_chunks.close()
+        raise
+
+    failed = engine.progress().failed
+    if failed:
+        logger.error(f'[管道] {failed} 个文本块翻译失败，输出中保留了带标记的原文')
+    logger.info(f'[管道] 完成，共输出 {written} 个文本块')
+    return failed == 0
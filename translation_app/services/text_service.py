@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+内存文本翻译服务
+
+直接翻译内存中的文本，不创建临时文件、不写入翻译结果，供其他服务作为库调用：
+
+    from translation_app.services.text_service import translate_text, iter_translate_pages
+
+    chinese = translate_text('Hello world.', provider='deepseek')
+    for translated_chunk in iter_translate_pages(pages):
+        ...
+
+需要复用同一个客户端时，通过 config 参数传入共享的配置（如 build_batch_config 配合
+shared_client_factory）
+"""
+
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+from translation_app.core.config import TranslationDefaults
+from translation_app.core.translate_config import TranslateConfig
+from translation_app.domain.translator import TranslationEngine
+from translation_app.services.batch_service import build_batch_config
+
+
+def create_engine(
+    provider: str = 'akashml',
+    balanced: bool = False,
+    submission_policy: str = TranslationDefaults.BATCH_SUBMISSION_POLICY,
+    config: Optional[TranslateConfig] = None
+) -> TranslationEngine:
+    """
+    创建翻译引擎（使用批量翻译的默认参数）
+
+    Args:
+        provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'）
+        config: 可选的翻译配置，传入时忽略以上参数
+
+    Returns:
+        TranslationEngine: 翻译引擎（每次翻译使用一个新引擎）
+    """
+    return TranslationEngine(config or build_batch_config(provider, balanced, submission_policy))
+
+
+def translate_text(
+    text: str,
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None
+) -> str:
+    """
+    翻译一段文本
+
+    Args:
+        text: 原文
+        provider: 服务商选择
+        balanced: 是否启用均衡切割模式
+        config: 可选的翻译配置
+
+    Returns:
+        译文（失败的文本块保留带标记的原文）
+    """
+    return create_engine(provider, balanced, config=config).translate_text(text)
+
+
+def translate_pages(
+    pages: Iterable[str],
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None
+) -> str:
+    """
+    翻译多段文本（如每一页或每一章），合并切割后翻译
+
+    Args:
+        pages: 文本片段，可以是生成器
+        provider: 服务商选择
+        balanced: 是否启用均衡切割模式
+        config: 可选的翻译配置
+
+    Returns:
+        译文（失败的文本块保留带标记的原文）
+    """
+    return create_engine(provider, balanced, config=config).translate_pages(pages)
+
+
+def iter_translate_pages(
+    pages: Iterable[str],
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None,
+    window: Optional[int] = None
+) -> Iterator[str]:
+    """
+    流式翻译多段文本，按原文顺序产出译文文本块
+
+    Args:
+        pages: 文本片段，可以是生成器
+        provider: 服务商选择
+        balanced: 是否启用均衡切割模式
+        config: 可选的翻译配置
+        window: 在途文本块上限，默认为线程数的 2 倍
+
+    Yields:
+        按原文顺序的译文文本块
+    """
+    return create_engine(provider, balanced, config=config).iter_translate_pages(pages, window)
+
+
+async def translate_text_async(
+    text: str,
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None
+) -> str:
+    """translate_text 的异步版本，协程被取消时同时取消翻译"""
+    return await create_engine(provider, balanced, config=config).translate_text_async(text)
+
+
+async def translate_pages_async(
+    pages: Iterable[str],
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None
+) -> str:
+    """translate_pages 的异步版本，协程被取消时同时取消翻译"""
+    return await create_engine(provider, balanced, config=config).translate_pages_async(pages)
+
+
+def aiter_translate_pages(
+    pages: Iterable[str],
+    provider: str = 'akashml',
+    balanced: bool = False,
+    config: Optional[TranslateConfig] = None,
+    window: Optional[int] = None
+) -> AsyncIterator[str]:
+    """iter_translate_pages 的异步版本，提前停止迭代时同时取消翻译"""
+    return create_engine(provider, balanced, config=config).aiter_translate_pages(pages, window)
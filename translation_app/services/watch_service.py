@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+监听翻译服务
+
+常驻进程，持续扫描工作目录，文件写入完成后立即预处理并翻译：
+- 轮询检测新文件，文件大小和修改时间保持不变一段时间后才视为写入完成（去抖动）
+- 所有翻译任务共享同一个 API 客户端，无需每次重新启动进程和创建客户端
+- 每轮有文件翻译成功后增量执行合并
+- 收到 SIGTERM/SIGINT 时完成当前文件后退出，再次收到信号时立即终止
+"""
+
+import logging
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from translation_app.core.config import PathConfig, TranslationDefaults, WatchConfig
+from translation_app.core.file_ops import list_source_files
+from translation_app.infra.openai_client import build_openai_client, shared_client_factory
+from translation_app.services.batch_service import build_batch_config, translate_file
+from translation_app.services.file_preprocessor import FilePreprocessor
+from translation_app.services.merge_service import merge_entrance
+
+
+logger = logging.getLogger('WatchService')
+
+
+@dataclass
+class _FileState:
+    """文件的观测状态"""
+
+    # (文件大小, 修改时间)
+    signature: Tuple[int, int]
+
+    # 最近一次观测到变化的时间（time.monotonic）
+    changed_at: float
+
+    # 当前版本是否已交给处理流程
+    handled: bool = False
+
+
+class WorkDirWatcher:
+    """工作目录轮询器：找出写入完成且尚未处理的待翻译文件"""
+
+    def __init__(self, work_dir: Path, settle_seconds: float = WatchConfig.SETTLE_SECONDS):
+        """
+        初始化轮询器
+
+        Args:
+            work_dir: 工作目录
+            settle_seconds: 文件保持不变多久后视为写入完成（秒）
+        """
+        self.work_dir = Path(work_dir)
+        self.settle_seconds = settle_seconds
+        self._states: Dict[Path, _FileState] = {}
+
+    def poll(self) -> List[Path]:
+        """
+        扫描一次工作目录
+
+        文件被修改（大小或修改时间变化）后会重新计时，再次稳定后重新交给处理流程；
+        处理失败但未改动的文件不会重复处理
+
+        Returns:
+            本轮新就绪的文件列表（按扩展名、文件名排序）
+        """
+        now = time.monotonic()
+        wall_now = time.time()
+        seen = set()
+        ready = []
+
+        for file_path in list_source_files(self.work_dir):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            seen.add(file_path)
+            signature = (stat.st_size, stat.st_mtime_ns)
+
+            state = self._states.get(file_path)
+            if state is None or state.signature != signature:
+                # 首次发现时按修改时间计算已稳定的时长，启动前已写完的文件无需等待
+                age = max(0.0, wall_now - stat.st_mtime) if state is None else 0.0
+                state = _FileState(signature, now - age)
+                self._states[file_path] = state
+
+            if not state.handled and now - state.changed_at >= self.settle_seconds:
+                state.handled = True
+                ready.append(file_path)
+
+        # 清理已删除或已重命名的文件
+        for file_path in list(self._states):
+            if file_path not in seen:
+                del self._states[file_path]
+
+        return ready
+
+
+def install_stop_handlers(stop_event: threading.Event):
+    """注册 SIGTERM/SIGINT 处理：首次收到信号时请求停止，并恢复默认处理以便再次收到时立即终止"""
+    previous = {}
+
+    def handle(signum, frame):
+        logger.info(f'[任务] 收到信号 {signal.Signals(signum).name}，完成当前文件后退出（再次发送信号立即终止）')
+        stop_event.set()
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            previous[sig] = signal.signal(sig, handle)
+        except ValueError:
+            # 只有主线程可以注册信号处理
+            logger.debug('[任务] 非主线程运行，未注册信号处理')
+            return
+
+
+def watch_translate(
+    provider: str = 'akashml',
+    balanced: bool = False,
+    submission_policy: str = TranslationDefaults.BATCH_SUBMISSION_POLICY,
+    poll_interval: float = WatchConfig.POLL_INTERVAL,
+    settle_seconds: float = WatchConfig.SETTLE_SECONDS,
+    merge: bool = True,
+    stop_event: Optional[threading.Event] = None
+):
+    """
+    监听工作目录，持续翻译新写入的文件
+
+    Args:
+        provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'）
+        poll_interval: 扫描工作目录的间隔（秒）
+        settle_seconds: 文件保持不变多久后视为写入完成（秒）
+        merge: 每轮有文件翻译成功后是否执行合并
+        stop_event: 可选的停止事件，默认在收到 SIGTERM/SIGINT 时停止
+    """
+    config = build_batch_config(
+        provider,
+        balanced,
+        submission_policy,
+        client_factory=shared_client_factory(build_openai_client)
+    )
+
+    PathConfig.ensure_dirs()
+    work_dir = PathConfig.WORK_DIR
+
+    if stop_event is None:
+        stop_event = threading.Event()
+        install_stop_handlers(stop_event)
+
+    watcher = WorkDirWatcher(work_dir, settle_seconds)
+    preprocessor = FilePreprocessor()
+    success_count = 0
+    failed_count = 0
+    skipped_count = 0
+
+    logger.info('=' * 60)
+    logger.info(f'[监听] 开始监听: {work_dir}（扫描间隔 {poll_interval} 秒，稳定时间 {settle_seconds} 秒）')
+    logger.info('=' * 60)
+
+    while not stop_event.is_set():
+        ready_files = watcher.poll()
+        if ready_files:
+            logger.info(f'[监听] 发现 {len(ready_files)} 个新文件')
+            files_to_process, preprocess_stats = preprocessor.preprocess_files(ready_files)
+            skipped_count += preprocess_stats.total_skipped
+            if preprocess_stats.total_skipped > 0:
+                preprocessor.log_stats()
+
+            translated = 0
+            for file_path in files_to_process:
+                if stop_event.is_set():
+                    break
+                try:
+                    if translate_file(file_path, config, manifest=preprocessor.manifest):
+                        translated += 1
+                        success_count += 1
+                    else:
+                        failed_count += 1
+                except Exception as e:
+                    failed_count += 1
+                    logger.error(f"处理文件时发生异常: {file_path.name}, 错误: {e}")
+                logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}')
+
+            # 增量合并：只在本轮有新的翻译结果时执行，追加到最后一个未满的合并文件，
+            # 长时间监听也不会每轮新建一个合并文件
+            if merge and (translated or preprocess_stats.skipped_already_chinese):
+                merge_entrance(
+                    files_dir=str(work_dir),
+                    delete_originals=True,
+                    backup=False,
+                    incremental=True
+                )
+
+        stop_event.wait(poll_interval)
+
+    logger.info('=' * 60)
+    logger.info('[监听] 已停止')
+    logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}')
+    logger.info('=' * 60)
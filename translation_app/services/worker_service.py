@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译 worker 服务
+
+多个 worker 进程（可在多台主机上共享同一个工作目录）通过租约文件协作处理工作目录中的文件，
+同一个文件只会被一个 worker 翻译；worker 崩溃后其租约过期，文件由其他 worker 接手
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from translation_app.core.config import PathConfig, TranslationDefaults, WatchConfig
+from translation_app.core.file_ops import list_source_files
+from translation_app.infra.openai_client import build_openai_client, shared_client_factory
+from translation_app.infra.work_queue import WorkQueue
+from translation_app.services.batch_service import build_batch_config, translate_file
+from translation_app.services.file_preprocessor import FilePreprocessor
+from translation_app.services.merge_service import merge_entrance
+from translation_app.services.watch_service import install_stop_handlers
+
+
+logger = logging.getLogger('WorkerService')
+
+
+# 合并步骤的租约名称（同一时间只有一个 worker 执行合并）
+_MERGE_LEASE = '.merge'
+
+
+def _merge_exclusively(queue: WorkQueue, work_dir: Path) -> bool:
+    """
+    持有合并租约时执行增量合并（追加到最后一个未满的合并文件，各 worker 的合并结果依次填满合并文件）
+
+    Returns:
+        是否执行了合并（其他 worker 正在合并时返回 False）
+    """
+    lease = queue.claim(_MERGE_LEASE)
+    if lease is None:
+        logger.info('[队列] 其他 worker 正在合并，稍后重试')
+        return False
+    with lease:
+        merge_entrance(
+            files_dir=str(work_dir),
+            delete_originals=True,
+            backup=False,
+            incremental=True
+        )
+    return True
+
+
+def run_worker(
+    provider: str = 'akashml',
+    balanced: bool = False,
+    submission_policy: str = TranslationDefaults.BATCH_SUBMISSION_POLICY,
+    poll_interval: float = WatchConfig.POLL_INTERVAL,
+    follow: bool = False,
+    merge: bool = True,
+    stop_event: Optional[threading.Event] = None
+):
+    """
+    运行一个翻译 worker
+
+    反复扫描工作目录，逐个认领并处理文件。所有待处理文件都被其他 worker 持有时，
+    等待其完成或租约过期后接手；没有待处理文件时退出（follow 为 True 时继续等待新文件）
+
+    Args:
+        provider: 服务商选择，可选值为 'akashml'、'deepseek' 或 'hyperbolic'
+        balanced: 是否启用均衡切割模式
+        submission_policy: 文本块提交策略（'document' 或 'longest_first'）
+        poll_interval: 没有可认领的文件时重新扫描的间隔（秒）
+        follow: 没有待处理文件时是否继续等待新文件
+        merge: 有文件翻译成功后是否执行合并
+        stop_event: 可选的停止事件，默认在收到 SIGTERM/SIGINT 时停止
+    """
+    config = build_batch_config(
+        provider,
+        balanced,
+        submission_policy,
+        client_factory=shared_client_factory(build_openai_client)
+    )
+
+    PathConfig.ensure_dirs()
+    work_dir = PathConfig.WORK_DIR
+
+    if stop_event is None:
+        stop_event = threading.Event()
+        install_stop_handlers(stop_event)
+
+    queue = WorkQueue()
+    preprocessor = FilePreprocessor()
+    success_count = 0
+    failed_count = 0
+    skipped_count = 0
+    merge_pending = False
+
+    logger.info('=' * 60)
+    logger.info(f'[队列] worker 启动: {queue.owner}，工作目录: {work_dir}')
+    logger.info('=' * 60)
+
+    while not stop_event.is_set():
+        pending = [file_path for file_path in list_source_files(work_dir) if not queue.has_outcome(file_path)]
+        if not pending and not follow:
+            break
+
+        claimed = 0
+        for file_path in pending:
+            if stop_event.is_set():
+                break
+            lease = queue.claim(file_path.name)
+            if lease is None:
+                continue
+
+            claimed += 1
+            with lease:
+                # 认领前文件可能已被其他 worker 处理完毕
+                if not file_path.exists():
+                    continue
+
+                try:
+                    files_to_process, preprocess_stats = preprocessor.preprocess_files([file_path])
+                except Exception as e:
+                    failed_count += 1
+                    logger.error(f"预处理文件时发生异常: {file_path.name}, 错误: {e}")
+                    queue.record_outcome(file_path, 'failed')
+                    continue
+
+                skipped_count += preprocess_stats.total_skipped
+                merge_pending = merge_pending or preprocess_stats.skipped_already_chinese > 0
+
+                # 被跳过但保留了原文件（如导出文本失败的中文 PDF/EPUB），记录结果避免重复认领
+                if not files_to_process and file_path.exists() and not lease.lost:
+                    queue.record_outcome(file_path, 'skipped')
+
+                for target in files_to_process:
+                    try:
+                        succeeded = translate_file(target, config, manifest=preprocessor.manifest, lease=lease)
+                    except Exception as e:
+                        succeeded = False
+                        logger.error(f"处理文件时发生异常: {target.name}, 错误: {e}")
+
+                    # 租约已被回收：文件由其他 worker 接手，丢弃结果，不记录处理结果
+                    if lease.lost:
+                        break
+                    if succeeded:
+                        success_count += 1
+                        merge_pending = True
+                        queue.clear_outcome(target.name)
+                    else:
+                        failed_count += 1
+                        queue.record_outcome(target, 'failed')
+                    logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}')
+
+        if claimed:
+            continue
+
+        # 没有可认领的文件：合并已有结果，然后等待其他 worker 完成或租约过期
+        if merge and merge_pending:
+            merge_pending = not _merge_exclusively(queue, work_dir)
+        stop_event.wait(poll_interval)
+
+    if merge and merge_pending:
+        _merge_exclusively(queue, work_dir)
+
+    logger.info('=' * 60)
+    logger.info(f'[队列] worker 退出: {queue.owner}')
+    logger.info(f'[统计] 成功: {success_count}, 失败: {failed_count}, 跳过: {skipped_count}')
+    logger.info('=' * 60)